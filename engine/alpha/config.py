@@ -70,6 +70,8 @@ class DeltaConfig:
     taker_fee: float = field(default_factory=lambda: _env_float("DELTA_TAKER_FEE", 0.0005))   # 0.05% per side
     maker_fee: float = field(default_factory=lambda: _env_float("DELTA_MAKER_FEE", 0.0002))   # 0.02% per side
     gst_rate: float = field(default_factory=lambda: _env_float("DELTA_GST_RATE", 0.18))       # 18% GST on fees
+    # INR per USD for valuing the INR wallet (no exchange we use quotes USDT/INR)
+    inr_usd_rate: float = field(default_factory=lambda: _env_float("DELTA_INR_USD_RATE", 86.5))
 
     @property
     def taker_fee_with_gst(self) -> float:
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 from typing import Any
 
@@ -18,7 +20,9 @@ class Database:
     """Async-friendly wrapper around the Supabase Python client.
 
     The supabase-py client is synchronous, so we run DB calls in a thread
-    executor to avoid blocking the event loop.
+    executor to avoid blocking the event loop. The executor is our own so
+    gathered DB writes neither queue behind nor starve other to_thread /
+    run_in_executor work on the loop's default pool.
     """
 
     TABLE_TRADES = "trades"
@@ -28,8 +32,13 @@ class Database:
     TABLE_ACTIVITY_LOG = "activity_log"
     TABLE_CHANGELOG = "changelog"
 
+    EXECUTOR_WORKERS = 8  # concurrent in-flight Supabase requests
+
     def __init__(self) -> None:
         self._client: Client | None = None
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.EXECUTOR_WORKERS, thread_name_prefix="supabase",
+        )
 
     async def connect(self) -> None:
         url = config.supabase.url
@@ -38,7 +47,7 @@ class Database:
             logger.warning("Supabase credentials not set — DB logging disabled")
             return
         loop = asyncio.get_running_loop()
-        self._client = await loop.run_in_executor(None, partial(create_client, url, key))
+        self._client = await loop.run_in_executor(self._executor, partial(create_client, url, key))
         logger.info("Connected to Supabase")
 
     @property
@@ -54,7 +63,7 @@ class Database:
         try:
             loop = asyncio.get_running_loop()
             result = await loop.run_in_executor(
-                None,
+                self._executor,
                 lambda: (
                     self._client.table(self.TABLE_TRADES)  # type: ignore[union-attr]
                     .insert(data)
@@ -76,6 +85,41 @@ class Database:
             )
             return None
 
+    async def log_trades(self, rows: list[dict[str, Any]]) -> list[int | None]:
+        """Insert several trade rows in one request; returns their row IDs in order.
+
+        PostgREST inserts a list atomically, so on failure nothing is written
+        and every ID comes back None (same contract as log_trade).
+        """
+        if not rows:
+            return []
+        if not self.is_connected:
+            return [None] * len(rows)
+        try:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(
+                self._executor,
+                lambda: (
+                    self._client.table(self.TABLE_TRADES)  # type: ignore[union-attr]
+                    .insert(rows)
+                    .execute()
+                ),
+            )
+            ids = [r.get("id") for r in (result.data or [])]
+            ids += [None] * (len(rows) - len(ids))
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Trades logged (ids=%s): %s",
+                    ids, ", ".join(f"{r.get('side')} {r.get('pair')} on {r.get('exchange')}" for r in rows),
+                )
+            return ids
+        except Exception as e:
+            logger.error(
+                "DB BULK INSERT FAILED for %d trades: %s | pairs=%s | %s",
+                len(rows), type(e).__name__, [r.get("pair") for r in rows], e,
+            )
+            return [None] * len(rows)
+
     async def close_trade(
         self, order_id: str, exit_price: float, pnl: float, pnl_pct: float,
         reason: str = "", exit_reason: str = "",
@@ -104,7 +148,7 @@ class Database:
         if exit_reason:
             data["exit_reason"] = exit_reason
         await loop.run_in_executor(
-            None,
+            self._executor,
             lambda: (
                 self._client.table(self.TABLE_TRADES)  # type: ignore[union-attr]
                 .update(data)
@@ -152,7 +196,7 @@ class Database:
                 )
             return result
 
-        await loop.run_in_executor(None, _do_update)
+        await loop.run_in_executor(self._executor, _do_update)
 
     async def get_open_trade(
         self, pair: str, exchange: str, strategy: str | None = None,
@@ -174,9 +218,35 @@ class Database:
                 q = q.eq("strategy", strategy)
             return q.order("opened_at", desc=True).limit(1).execute()
 
-        result = await loop.run_in_executor(None, _query)
+        result = await loop.run_in_executor(self._executor, _query)
         return result.data[0] if result.data else None
 
+    async def get_open_trades_by_pairs(
+        self, pairs: list[str], exchange: str, strategy: str | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Most recent open trade per pair for a set of pairs on one exchange — one query."""
+        if not self.is_connected or not pairs:
+            return {}
+        loop = asyncio.get_running_loop()
+
+        def _query() -> Any:
+            q = (
+                self._client.table(self.TABLE_TRADES)  # type: ignore[union-attr]
+                .select("*")
+                .in_("pair", pairs)
+                .eq("exchange", exchange)
+                .eq("status", "open")
+            )
+            if strategy:
+                q = q.eq("strategy", strategy)
+            return q.order("opened_at", desc=True).execute()
+
+        result = await loop.run_in_executor(self._executor, _query)
+        by_pair: dict[str, dict[str, Any]] = {}
+        for row in result.data or []:
+            by_pair.setdefault(row["pair"], row)  # rows are newest-first
+        return by_pair
+
     async def close_duplicate_open_trades(
         self, pair: str, exchange: str, keep_id: int | None = None,
     ) -> int:
@@ -205,7 +275,7 @@ class Database:
             return q.execute()
 
         try:
-            result = await loop.run_in_executor(None, _query)
+            result = await loop.run_in_executor(self._executor, _query)
             dupes = result.data or []
             closed = 0
             for row in dupes:
@@ -234,7 +304,7 @@ class Database:
             return
         loop = asyncio.get_running_loop()
         await loop.run_in_executor(
-            None,
+            self._executor,
             lambda: (
                 self._client.table(self.TABLE_TRADES)  # type: ignore[union-attr]
                 .update({"status": "cancelled", "reason": reason, "closed_at": iso_now()})
@@ -249,7 +319,7 @@ class Database:
             return []
         loop = asyncio.get_running_loop()
         result = await loop.run_in_executor(
-            None,
+            self._executor,
             lambda: (
                 self._client.table(self.TABLE_TRADES)  # type: ignore[union-attr]
                 .select("*")
@@ -280,7 +350,7 @@ class Database:
                 .execute()
             )
 
-        result = await loop.run_in_executor(None, _query)
+        result = await loop.run_in_executor(self._executor, _query)
         return result.data[0] if result.data else None
 
     async def get_open_trades(self, pair: str | None = None) -> list[dict[str, Any]]:
@@ -299,13 +369,36 @@ class Database:
                 q = q.eq("pair", pair)
             return q.order("opened_at", desc=True).execute()
 
-        result = await loop.run_in_executor(None, _query)
+        result = await loop.run_in_executor(self._executor, _query)
         return result.data
 
     async def get_all_open_trades(self) -> list[dict[str, Any]]:
         """Fetch ALL open trades across all pairs and exchanges."""
         return await self.get_open_trades(pair=None)
 
+    async def get_orphan_open_trades(
+        self, exclude_strategies: set[str],
+    ) -> list[dict[str, Any]]:
+        """Open trades whose strategy is NULL or not in exclude_strategies — filtered server-side."""
+        if not self.is_connected:
+            return []
+        loop = asyncio.get_running_loop()
+        # NOT IN never matches NULL, so NULL strategies are OR'd in explicitly
+        excluded = ",".join(f'"{name}"' for name in sorted(exclude_strategies))
+
+        def _query() -> Any:
+            return (
+                self._client.table(self.TABLE_TRADES)  # type: ignore[union-attr]
+                .select("*")
+                .eq("status", "open")
+                .or_(f"strategy.is.null,strategy.not.in.({excluded})")
+                .order("opened_at", desc=True)
+                .execute()
+            )
+
+        result = await loop.run_in_executor(self._executor, _query)
+        return result.data
+
     # ── Strategy log ─────────────────────────────────────────────────────────
 
     async def log_strategy_selection(self, data: dict[str, Any]) -> None:
@@ -313,6 +406,18 @@ class Database:
             return
         await self._insert(self.TABLE_STRATEGY_LOG, data)
 
+    async def log_strategy_selections(self, rows: list[dict[str, Any]]) -> None:
+        """Insert one analysis cycle's strategy-log rows in a single request."""
+        if not rows or not self.is_connected:
+            return
+        try:
+            await self._insert_strict(self.TABLE_STRATEGY_LOG, rows)
+        except Exception as e:
+            logger.error(
+                "DB BULK INSERT FAILED for %s (%d rows): %s | %s",
+                self.TABLE_STRATEGY_LOG, len(rows), type(e).__name__, e,
+            )
+
     # ── Bot status ───────────────────────────────────────────────────────────
 
     # Core columns guaranteed to exist in every bot_status table.
@@ -355,7 +460,7 @@ class Database:
             return None
         loop = asyncio.get_running_loop()
         result = await loop.run_in_executor(
-            None,
+            self._executor,
             lambda: (
                 self._client.table(self.TABLE_BOT_STATUS)  # type: ignore[union-attr]
                 .select("*")
@@ -375,7 +480,7 @@ class Database:
             return []
         loop = asyncio.get_running_loop()
         result = await loop.run_in_executor(
-            None,
+            self._executor,
             lambda: (
                 self._client.table(self.TABLE_BOT_COMMANDS)  # type: ignore[union-attr]
                 .select("*")
@@ -394,7 +499,7 @@ class Database:
             return
         loop = asyncio.get_running_loop()
         await loop.run_in_executor(
-            None,
+            self._executor,
             lambda: (
                 self._client.table(self.TABLE_BOT_COMMANDS)  # type: ignore[union-attr]
                 .update({
@@ -423,7 +528,7 @@ class Database:
 
         # Get all closed trades
         result = await loop.run_in_executor(
-            None,
+            self._executor,
             lambda: (
                 self._client.table(self.TABLE_TRADES)  # type: ignore[union-attr]
                 .select("pnl")
@@ -433,9 +538,11 @@ class Database:
         )
         rows = result.data or []
 
-        total_pnl = sum(float(r.get("pnl", 0) or 0) for r in rows)
-        total_trades = len(rows)
-        wins = sum(1 for r in rows if float(r.get("pnl", 0) or 0) > 0)
+        # Parse each row's pnl once — this scans every closed trade on every status save
+        pnls = [float(r.get("pnl") or 0) for r in rows]
+        total_pnl = sum(pnls)
+        total_trades = len(pnls)
+        wins = sum(1 for p in pnls if p > 0)
         win_rate = round((wins / total_trades * 100), 2) if total_trades > 0 else 0
 
         return {
@@ -491,7 +598,7 @@ class Database:
                 q = q.lt("closed_at", end_utc)
             return q.execute()
 
-        result = await loop.run_in_executor(None, _query)
+        result = await loop.run_in_executor(self._executor, _query)
         rows = result.data or []
 
         total_trades = len(rows)
@@ -538,7 +645,7 @@ class Database:
             return {}
         loop = asyncio.get_running_loop()
         result = await loop.run_in_executor(
-            None,
+            self._executor,
             lambda: (
                 self._client.table("pair_config")  # type: ignore[union-attr]
                 .select("*")
@@ -556,7 +663,7 @@ class Database:
             return {}
         loop = asyncio.get_running_loop()
         result = await loop.run_in_executor(
-            None,
+            self._executor,
             lambda: (
                 self._client.table("setup_config")  # type: ignore[union-attr]
                 .select("*")
@@ -588,7 +695,7 @@ class Database:
         loop = asyncio.get_running_loop()
         try:
             await loop.run_in_executor(
-                None,
+                self._executor,
                 lambda: (
                     self._client.table("signal_state")  # type: ignore[union-attr]
                     .upsert(rows, on_conflict="pair,signal_id")
@@ -614,7 +721,7 @@ class Database:
         loop = asyncio.get_running_loop()
         try:
             await loop.run_in_executor(
-                None,
+                self._executor,
                 lambda: (
                     self._client.table(self.TABLE_OPTIONS_STATE)  # type: ignore[union-attr]
                     .upsert(state, on_conflict="pair")
@@ -673,7 +780,7 @@ class Database:
             return q.execute()
 
         try:
-            result = await loop.run_in_executor(None, _query)
+            result = await loop.run_in_executor(self._executor, _query)
             return result.data[0] if result.data else None
         except Exception as e:
             logger.error("get_latest_changelog failed: %s", e)
@@ -686,7 +793,7 @@ class Database:
         try:
             loop = asyncio.get_running_loop()
             result = await loop.run_in_executor(
-                None,
+                self._executor,
                 lambda: (
                     self._client.table(self.TABLE_CHANGELOG)  # type: ignore[union-attr]
                     .insert(data)
@@ -714,10 +821,12 @@ class Database:
                 table, type(e).__name__, data.get("pair", "?"), e,
             )
 
-    async def _insert_strict(self, table: str, data: dict[str, Any]) -> None:
-        """Insert that re-raises on failure (caller handles retry logic)."""
+    async def _insert_strict(
+        self, table: str, data: dict[str, Any] | list[dict[str, Any]],
+    ) -> None:
+        """Insert (one row or a list of rows) that re-raises on failure (caller handles retry logic)."""
         loop = asyncio.get_running_loop()
         await loop.run_in_executor(
-            None,
+            self._executor,
             lambda: self._client.table(table).insert(data).execute(),  # type: ignore[union-attr]
         )
@@ -6,35 +6,236 @@ Supports Bybit (futures), Binance (spot), and Delta Exchange India (options) in
 from __future__ import annotations
 
 import asyncio
-import datetime as _dt
+import heapq
+import itertools
+import logging
 import os
+import random
 import signal
 import sys
 import time
-from typing import Any
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Coroutine, Mapping
 
 import aiohttp
 import ccxt.async_support as ccxt
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+try:
+    import uvloop
+except ImportError:  # optional — default asyncio loop otherwise (always on Windows)
+    uvloop = None
 
 from alpha.alerts import AlertManager
 from alpha.config import config
 from alpha.db import Database
-from alpha.market_analyzer import MarketAnalyzer
+from alpha.market_analyzer import MarketAnalysis, MarketAnalyzer
 from alpha.price_feed import PriceFeed
 from alpha.risk_manager import RiskManager
 from alpha.strategies.base import Signal, StrategyName
 from alpha.strategies.options_scalp import OptionsScalpStrategy
 from alpha.strategies.scalp import ScalpStrategy
 from alpha.trade_executor import TradeExecutor, DELTA_CONTRACT_SIZE, calc_pnl, is_option_symbol
-from alpha.utils import iso_now, setup_logger
+from alpha.utils import iso_now, parse_iso, setup_logger
 
 logger = setup_logger("main")
 
+# Phantom close reason → DB exit_reason (anything unlisted is a plain PHANTOM)
+_PHANTOM_EXIT_MAP = MappingProxyType({
+    "phantom_cleared": "PHANTOM",
+    "SL_EXCHANGE": "SL_EXCHANGE",
+    "TP_EXCHANGE": "TP_EXCHANGE",
+    "CLOSED_BY_EXCHANGE": "CLOSED_BY_EXCHANGE",
+})
+# Venues that record every phantom close as a plain PHANTOM, whatever the fill says
+_PHANTOM_EXIT_PLAIN: Mapping[str, str] = MappingProxyType({})
+# Balance currencies counted as cash (or converted separately), never priced as assets
+_NON_ASSET_CURRENCIES = frozenset({"USDT", "USD", "USDC", "INR"})
+# Order side that flattens a position of the given type
+_CLOSE_SIDE = MappingProxyType({"long": "sell", "spot": "sell", "short": "buy"})
+# Stand-in for a scalp strategy with no signal state yet (every .get() hits its default)
+_NO_SIGNAL: MappingProxyType[str, Any] = MappingProxyType({})
+
+
+def _fnum(d: dict[str, Any], key: str) -> float:
+    """Numeric field from an exchange/DB dict; missing, None, 0, "" or garbage → 0.0."""
+    v = d.get(key)
+    if not v:
+        return 0.0
+    try:
+        return float(v)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+# Sort key for the per-cycle strength ranking (C-level getter, no lambda frame)
+_by_signal_strength = attrgetter("signal_strength")
+
+
+def _version_tuple(version: str) -> tuple[int, ...]:
+    """Leading numeric release components of a version string ("3.10.5" → (3, 10, 5))."""
+    parts = []
+    for part in version.split(".")[:3]:
+        if not part.isdigit():
+            break
+        parts.append(int(part))
+    return tuple(parts)
+
+
+@lru_cache(maxsize=256)
+def _base_of(pair: str) -> str:
+    """Base asset of a pair symbol ("ETH/USDT" / "ETHUSDT" / "ETHUSD" → "ETH").
+
+    Pair strings are few and immutable, hence the cache.
+    """
+    head, sep, _ = pair.partition("/")
+    return head if sep else pair.removesuffix("USDT").removesuffix("USD")
+
+
+@dataclass(slots=True)
+class OpenTradeRow:
+    """A DB-open trade row parsed once for the restore pass (DB values, not exchange truth)."""
+    id: Any
+    order_id: str
+    pair: str
+    exchange: str
+    entry_price: float
+    amount: float
+    strategy: str
+    position_type: str
+    leverage: int
+    opened_at: str | None
+    peak_pnl: float | None
+
+    @classmethod
+    def from_row(cls, row: dict[str, Any]) -> OpenTradeRow:
+        return cls(
+            id=row.get("id"),
+            order_id=row.get("order_id") or "",
+            pair=row.get("pair", ""),
+            exchange=row.get("exchange", "binance"),
+            entry_price=_fnum(row, "entry_price"),
+            amount=_fnum(row, "amount"),
+            strategy=row.get("strategy", ""),
+            position_type=row.get("position_type", "spot"),
+            leverage=int(row.get("leverage", 1) or 1),
+            opened_at=row.get("opened_at"),
+            peak_pnl=row.get("peak_pnl"),
+        )
+
+
+@dataclass(slots=True)
+class RestoredTrade:
+    """A DB-open position verified on the exchange, pending strategy injection."""
+    pair: str
+    exchange_id: str
+    entry_price: float
+    amount: float
+    position_type: str  # "long", "short", or "spot"
+    leverage: float
+    strategy: str
+    opened_at: str | None = None
+    peak_pnl: float | None = None
+
+
+def _apply_restore(
+    scalp: ScalpStrategy, trade: RestoredTrade, now_monotonic: float, now_utc: datetime,
+) -> None:
+    """Load a restored position into a scalp strategy — pure state, no I/O.
+
+    CRITICAL: entry_time comes from the real opened_at, not monotonic now.
+    This ensures timeout (5min) and breakeven (60s) count from ORIGINAL
+    entry, not from restart. Without this, positions survive forever
+    across deploys because timers keep resetting.
+    """
+    position_type = trade.position_type
+    scalp.in_position = True
+    scalp.position_side = position_type if position_type in ("long", "short") else "long"
+    scalp.entry_price = trade.entry_price
+    scalp.entry_amount = trade.amount
+
+    entry_time = now_monotonic
+    if trade.opened_at:
+        try:
+            # Convert to monotonic: how many seconds ago was it opened?
+            seconds_ago = max(0.0, (now_utc - parse_iso(trade.opened_at)).total_seconds())
+            entry_time = now_monotonic - seconds_ago
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Restored %s entry_time: opened %ds ago (timeout/breakeven preserved)",
+                    trade.pair, int(seconds_ago),
+                )
+        except Exception as e:
+            logger.warning(
+                "Could not parse opened_at '%s' for %s: %s — using now",
+                trade.opened_at, trade.pair, e,
+            )
+    scalp.entry_time = entry_time
+
+    scalp.highest_since_entry = trade.entry_price
+    scalp.lowest_since_entry = trade.entry_price
+
+    # Restore peak P&L if available (for decay exit)
+    peak_pnl = trade.peak_pnl
+    if peak_pnl is not None and peak_pnl > 0:
+        scalp._peak_unrealized_pnl = float(peak_pnl)
+        logger.info("Restored %s peak_pnl: %.2f%%", trade.pair, float(peak_pnl))
+
+
+def _seconds_until_utc(hours: tuple[int, ...], minute: int) -> float:
+    """Seconds from now to the next HH:MM UTC wall-clock time with HH in hours."""
+    now = datetime.now(timezone.utc)
+    base = now.replace(minute=minute, second=0, microsecond=0)
+    waits = ((base.replace(hour=h) - now).total_seconds() % 86400.0 for h in hours)
+    # A slot that is (nearly) now has just fired — its next turn is tomorrow
+    return min(w if w >= 1.0 else w + 86400.0 for w in waits)
+
+
+@dataclass(slots=True, eq=False)
+class _Timer:
+    """A job on the timer wheel: every interval seconds, or daily at HH:MM UTC."""
+    job: Callable[[], Awaitable[Any]]
+    interval: float = 0.0
+    utc_hours: tuple[int, ...] = ()
+    utc_minute: int = 0
+    jitter: float = 0.0
+    slot: float = 0.0  # monotonic time of the next (unjittered) run
+    running: asyncio.Task[None] | None = None
+
+    def advance(self, now: float) -> None:
+        """Move slot to the first one after now — missed slots are skipped, not replayed."""
+        if self.interval:
+            self.slot += self.interval
+            while self.slot <= now:
+                self.slot += self.interval
+        else:
+            self.slot = now + _seconds_until_utc(self.utc_hours, self.utc_minute)
+
+    def fire_at(self) -> float:
+        """Slot delayed by a random 0..jitter seconds (the grid itself never shifts)."""
+        return self.slot + (random.uniform(0, self.jitter) if self.jitter else 0.0)
+
 
 class AlphaBot:
     """Top-level bot orchestrator — runs multiple pairs and exchanges concurrently."""
 
+    # Phantom detection (bot thinks it holds a position the exchange doesn't show)
+    PHANTOM_MIN_HOLD_S = 300    # don't clear positions opened < 5 min ago — still settling
+    PHANTOM_EXIT_GRACE_S = 30   # strategy closed < 30s ago — normal exit, not phantom
+    PHANTOM_COOLDOWN_S = 60     # no new entries on the pair after a phantom clear
+
+    # Upper bounds for periodic jobs so one hung call can't stall the next run
+    RECONCILE_READ_TIMEOUT_S = 20  # per exchange read in a reconcile pass — writes are never cut off
+    TELEGRAM_HEALTH_TIMEOUT_S = 10
+    BALANCE_CACHE_TTL_S = 5.0   # reconcile + portfolio reads within a cycle share one payload
+    TICKER_CACHE_TTL_S = 1.0    # back-to-back REST ticker reads for the same pair share one call
+    VALUATION_TICKER_TTL_S = 5.0  # portfolio valuation tolerates slightly older prices
+    PORTFOLIO_CACHE_TTL_S = 10.0  # overlapping status/report jobs share one valuation
+    ANALYSIS_CONCURRENCY = 4    # in-flight OHLCV fetches per venue during an analysis cycle
+
     def __init__(self) -> None:
         # Core components (initialized in start())
         self.binance: ccxt.Exchange | None = None
@@ -61,6 +262,19 @@ class AlphaBot:
         self.bybit_pairs: list[str] = config.bybit.pairs
         # Kraken futures pairs
         self.kraken_pairs: list[str] = config.kraken.pairs
+        # Frozen copies for the reconcilers' set algebra (refreshed in _init_exchanges)
+        self._delta_pair_set: frozenset[str] = frozenset(self.delta_pairs)
+        self._bybit_pair_set: frozenset[str] = frozenset(self.bybit_pairs)
+        self._kraken_pair_set: frozenset[str] = frozenset(self.kraken_pairs)
+        self._all_pairs: tuple[str, ...] | None = None  # frozen at the end of _init_exchanges
+        # pair → venue name for the strategy log (built in _init_exchanges; unlisted = binance)
+        self._pair_exchange: dict[str, str] = {}
+        # pair → (analyzer, venue semaphore) for the analysis cycle (built in start())
+        self._pair_analyzer: dict[str, tuple[MarketAnalyzer | None, asyncio.Semaphore]] = {}
+        # Base assets of the configured spot pairs — valued in _fetch_portfolio_usd
+        self._tracked_bases: frozenset[str] = frozenset(
+            _base_of(pair) for pair in (config.trading.pairs or [])
+        )
 
         # Scalp overlay strategies: pair -> ScalpStrategy (run independently)
         self._scalp_strategies: dict[str, ScalpStrategy] = {}
@@ -76,16 +290,34 @@ class AlphaBot:
         self._delta_enabled: bool = True
         self._kraken_enabled: bool = True
 
+        # exchange_id → ccxt client, for paths that only know the DB/strategy id
+        self._exchanges: dict[str, ccxt.Exchange] = {}
+
+        # Fire-and-forget tasks (alerts etc.) — strong refs so they aren't GC'd mid-flight
+        self._bg_tasks: set[asyncio.Task[Any]] = set()
+
+        # Shared aiohttp session for every ccxt REST client (created in _init_exchanges)
+        self._http_session: aiohttp.ClientSession | None = None
+
         # WebSocket price feed for real-time exit checks
         self._price_feed: PriceFeed | None = None
 
-        # Scheduler
-        self._scheduler = AsyncIOScheduler()
+        # Timer wheel: (fire_at, seq, timer) heap drained by _run_timers
+        self._timers: list[tuple[float, int, _Timer]] = []
+        self._timer_seq = itertools.count()
+        self._timer_task: asyncio.Task[None] | None = None
 
         # Shutdown flag
         self._running = False
+        self._stop_event = asyncio.Event()  # set when shutdown finishes; start() waits on it
         self._start_time: float = 0.0  # monotonic time for uptime calc
 
+        # Per-venue caps on concurrent analyzer calls (see _analyze_one)
+        self._analysis_sems: dict[str, asyncio.Semaphore] = {
+            "binance": asyncio.Semaphore(self.ANALYSIS_CONCURRENCY),
+            "delta": asyncio.Semaphore(self.ANALYSIS_CONCURRENCY),
+        }
+
         # Suppress strategy-change alerts on the very first analysis cycle
         self._has_run_first_cycle: bool = False
 
@@ -102,15 +334,35 @@ class AlphaBot:
         # Orphan grace: first-seen time for untracked positions (key: "exchange:pair")
         self._position_first_seen: dict[str, float] = {}
         self.ORPHAN_GRACE_S = 120  # seconds before orphan close fires
+        # Fingerprint of the last Delta reconcile pass that found nothing to do
+        self._delta_recon_fp: int | None = None
+        # Liquidation warning state: pair -> last telegram time
+        self._liq_warned: dict[str, float] = {}
+        # Per-venue reconcile serialization (see _run_reconciler)
+        self._reconcile_locks: dict[str, asyncio.Lock] = {}
+        self._reconcile_pending: set[str] = set()
+        # Short-lived fetch_balance cache (key: exchange id → (monotonic ts, balance))
+        self._balance_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+        self._balance_locks: dict[str, asyncio.Lock] = {}
+        # Sub-second fetch_ticker cache (key: (exchange id, pair) → (monotonic ts, ticker))
+        self._ticker_cache: dict[tuple[str, str], tuple[float, dict[str, Any]]] = {}
+        # Portfolio USD value per exchange id (see _fetch_portfolio_usd)
+        self._portfolio_cache: dict[str, tuple[float, float]] = {}
+        self._portfolio_locks: dict[str, asyncio.Lock] = {}
+        # INR/USD conversion rate — configured, so resolved once here
+        # (86.5 ≈ Feb 2026; set DELTA_INR_USD_RATE for precision)
+        self._inr_usd_rate: float = config.delta.inr_usd_rate if config.delta.inr_usd_rate > 0 else 86.5
 
     @property
-    def all_pairs(self) -> list[str]:
-        """All tracked pairs across all exchanges."""
+    def all_pairs(self) -> tuple[str, ...]:
+        """All tracked pairs across all exchanges (materialized once exchanges are up)."""
+        if self._all_pairs is not None:
+            return self._all_pairs
         return (
-            self.pairs
-            + (self.bybit_pairs if self.bybit else [])
-            + (self.delta_pairs if self.delta else [])
-            + (self.kraken_pairs if self.kraken else [])
+            tuple(self.pairs)
+            + tuple(self.bybit_pairs if self.bybit else ())
+            + tuple(self.delta_pairs if self.delta else ())
+            + tuple(self.kraken_pairs if self.kraken else ())
         )
 
     def _get_scalp(self, pair: str, exchange: str | None = None) -> ScalpStrategy | None:
@@ -178,18 +430,8 @@ class AlphaBot:
         # Restore state from DB if available
         await self._restore_state()
 
-        # Hook into risk_manager.record_close to track hourly stats
-        _original_record_close = self.risk_manager.record_close
-
-        def _tracked_record_close(pair: str, pnl: float) -> None:
-            _original_record_close(pair, pnl)
-            self._hourly_pnl += pnl
-            if pnl >= 0:
-                self._hourly_wins += 1
-            else:
-                self._hourly_losses += 1
-
-        self.risk_manager.record_close = _tracked_record_close  # type: ignore[assignment]
+        # Track hourly stats off every risk_manager.record_close
+        self.risk_manager.on_close_listeners.append(self._on_trade_closed)
 
         # Build components — Binance (spot) + Bybit/Kraken (futures) + Delta (options)
         self.executor = TradeExecutor(
@@ -223,6 +465,16 @@ class AlphaBot:
             self.kraken_analyzer = MarketAnalyzer(
                 self.kraken, pair=self.kraken_pairs[0],
             )
+
+        # Analysis routing: spot pairs on the Binance analyzer, then Delta pairs
+        self._pair_analyzer = {
+            pair: (self.analyzer, self._analysis_sems["binance"]) for pair in self.pairs
+        }
+        if self.delta and self.delta_analyzer:
+            self._pair_analyzer.update(
+                (pair, (self.delta_analyzer, self._analysis_sems["delta"]))
+                for pair in self.delta_pairs
+            )
         # strategy_selector DISABLED — scalp-only, no dynamic strategy switching
 
         # Load market limits for all exchanges
@@ -283,7 +535,7 @@ class AlphaBot:
         if self.delta and self.delta_options and self._options_enabled:
             for pair in config.delta.options_pairs:
                 # Map options pair to Delta scalp strategy (delta-prefixed keys)
-                base = pair.split("/")[0]
+                base = _base_of(pair)
                 scalp = self._scalp_strategies.get(f"delta:{pair}")
                 if scalp is None:
                     # Try matching by base asset within delta-prefixed keys
@@ -316,25 +568,40 @@ class AlphaBot:
 
         # Start all scalp strategies (gated by exchange enabled flags)
         _ex_enabled = {"bybit": self._bybit_enabled, "delta": self._delta_enabled, "kraken": self._kraken_enabled}
-        started = 0
+        to_start: list[str] = []
         for pair, scalp in self._scalp_strategies.items():
             ex_id = getattr(scalp, "_exchange_id", "delta")
             if not _ex_enabled.get(ex_id, True):
                 logger.info("Skipping %s — %s exchange disabled", pair, ex_id)
                 continue
-            await scalp.start()
-            started += 1
+            to_start.append(pair)
+        # Strategy starts are independent — overlap them instead of N round-trips
+        results = await asyncio.gather(
+            *(self._scalp_strategies[p].start() for p in to_start), return_exceptions=True,
+        )
+        started = 0
+        for pair, res in zip(to_start, results):
+            if isinstance(res, Exception):
+                logger.error("Scalp overlay failed to start on %s: %s", pair, res)
+            else:
+                started += 1
         logger.info("Scalp overlay started on %d/%d pairs", started, len(self._scalp_strategies))
 
         # Load pair/setup configs from DB → apply to scalp strategies
         await self._load_pair_setup_configs()
 
         # Start options strategies (gated by delta enabled flag)
-        for pair, opts in self._options_strategies.items():
-            if not self._delta_enabled:
+        if self._delta_enabled:
+            opts_pairs = list(self._options_strategies)
+            results = await asyncio.gather(
+                *(self._options_strategies[p].start() for p in opts_pairs), return_exceptions=True,
+            )
+            for pair, res in zip(opts_pairs, results):
+                if isinstance(res, Exception):
+                    logger.error("Options overlay failed to start on %s: %s", pair, res)
+        else:
+            for pair in self._options_strategies:
                 logger.info("Skipping options %s — delta exchange disabled", pair)
-                continue
-            await opts.start()
         if self._options_strategies:
             logger.info("Options overlay started on %d pairs", len(self._options_strategies))
 
@@ -361,6 +628,7 @@ class AlphaBot:
                 delta_testnet=config.delta.testnet,
                 bybit_testnet=config.bybit.testnet,
                 kraken_testnet=config.kraken.testnet,
+                session=self._http_session,
             )
 
             # Register momentum wake callbacks — WS detects sharp moves and
@@ -369,23 +637,33 @@ class AlphaBot:
                 self._price_feed.register_wake_callback(strategy.pair, strategy.wake)
 
             await self._price_feed.start()
+            # WS frame parsing shares the loop with REST fan-out — flag a venv
+            # that predates the aiohttp floor pinned in requirements.txt
+            if _version_tuple(aiohttp.__version__) < (3, 10, 5):
+                logger.warning(
+                    "aiohttp %s is older than the pinned 3.10.5 -- PriceFeed WS "
+                    "parsing is slower; reinstall from requirements.txt",
+                    aiohttp.__version__,
+                )
+            else:
+                logger.info("PriceFeed started on aiohttp %s", aiohttp.__version__)
         except Exception:
             logger.exception("PriceFeed failed to start — REST polling continues as fallback")
             self._price_feed = None
 
-        # Schedule periodic tasks
-        self._scheduler.add_job(
-            self._analysis_cycle, "interval",
-            seconds=config.trading.analysis_interval_sec,
-        )
-        self._scheduler.add_job(self._daily_reset, "cron", hour=18, minute=30)  # midnight IST = 18:30 UTC
+        # Schedule periodic jobs — all of them share one timer wheel (_run_timers)
+        # Jitter spreads jobs that would otherwise fire together (e.g. report +
+        # status at the top of the hour) so their REST bursts don't stack up
+        interval = config.trading.analysis_interval_sec
+        self._add_interval(self._analysis_cycle, interval, jitter=min(5, interval // 10))
+        self._add_interval(self._poll_commands, 5, jitter=1)
+        self._add_interval(self._save_status, 120, jitter=30)
+        self._add_interval(self._reconcile_exchange_positions, 60)
+        self._add_interval(self._telegram_health_check, 300)
+        self._add_daily(self._daily_reset, (18,), 30)  # midnight IST = 18:30 UTC
         # 3x daily updates: 8 AM, 12 PM, 8 PM IST (2:30, 6:30, 14:30 UTC)
-        self._scheduler.add_job(self._hourly_report, "cron", hour="2,6,14", minute=30)
-        self._scheduler.add_job(self._save_status, "interval", minutes=2)
-        self._scheduler.add_job(self._reconcile_exchange_positions, "interval", seconds=60)
-        self._scheduler.add_job(self._telegram_health_check, "interval", minutes=5)
-        self._scheduler.add_job(self._poll_commands, "interval", seconds=5)
-        self._scheduler.start()
+        self._add_daily(self._hourly_report, (2, 6, 14), 30, jitter=60)
+        self._timer_task = asyncio.create_task(self._run_timers())
 
         # Fetch live exchange balances → per-exchange capital for trade sizing
         binance_bal: float | None = None
@@ -393,10 +671,7 @@ class AlphaBot:
         bybit_bal: float | None = None
         kraken_bal: float | None = None
         try:
-            binance_bal = await self._fetch_portfolio_usd(self.binance)
-            delta_bal = await self._fetch_portfolio_usd(self.delta) if self.delta else None
-            bybit_bal = await self._fetch_portfolio_usd(self.bybit) if self.bybit else None
-            kraken_bal = await self._fetch_portfolio_usd(self.kraken) if self.kraken else None
+            binance_bal, delta_bal, bybit_bal, kraken_bal = await self._fetch_all_balances()
             self.risk_manager.update_exchange_balances(binance_bal, delta_bal, bybit_bal, kraken_bal)
         except Exception:
             logger.exception("[STARTUP] Failed to fetch exchange balances — continuing with defaults")
@@ -406,22 +681,23 @@ class AlphaBot:
         # ── Log per-pair affordability for Delta scalp ────────────────────
         try:
             if self.delta and delta_bal is not None:
-                from alpha.trade_executor import DELTA_CONTRACT_SIZE
 
                 active_pairs: list[str] = []
                 skipped_pairs: list[str] = []
                 leverage = config.delta.leverage or 1  # guard against zero
+                # One batched ticker read for every pair with a known contract size
+                tickers = await self._fetch_tickers(
+                    self.delta,
+                    [p for p in self.delta_pairs if DELTA_CONTRACT_SIZE.get(p, 0) > 0],
+                )
                 for pair in self.delta_pairs:
                     contract_size = DELTA_CONTRACT_SIZE.get(pair, 0)
                     if contract_size <= 0:
                         logger.warning("[STARTUP] %s — unknown contract size, may not trade", pair)
                         skipped_pairs.append(pair)
                         continue
-                    try:
-                        ticker = await self.delta.fetch_ticker(pair)
-                        price = float(ticker.get("last", 0) or 0)
-                    except Exception:
-                        price = 0
+                    ticker = tickers.get(pair)
+                    price = _fnum(ticker, "last") if ticker else 0
                     if price > 0:
                         collateral = (contract_size * price) / leverage
                         affordable = delta_bal >= collateral
@@ -506,7 +782,7 @@ class AlphaBot:
                 break
 
             # All pairs
-            _all_bases = sorted({p.split("/")[0] for p in self.all_pairs})
+            _all_bases = sorted({_base_of(p) for p in self.all_pairs})
             _pairs_str = " | ".join(_all_bases) if _all_bases else "none"
 
             msg = (
@@ -549,8 +825,7 @@ class AlphaBot:
             config.bybit.leverage,
         )
         try:
-            while self._running:
-                await asyncio.sleep(1)
+            await self._stop_event.wait()
         except (KeyboardInterrupt, asyncio.CancelledError):
             await self.shutdown("KeyboardInterrupt")
 
@@ -561,49 +836,92 @@ class AlphaBot:
         self._running = False
         logger.info("Shutting down: %s", reason)
 
-        # Stop WebSocket price feed first (prevents new exit triggers)
-        if self._price_feed:
-            await self._price_feed.stop()
+        try:
+            # Stop WebSocket price feed first (prevents new exit triggers)
+            if self._price_feed:
+                await self._price_feed.stop()
 
-        # Stop all active strategies concurrently (scalp + options overlays)
-        stop_tasks = []
-        for pair, scalp in self._scalp_strategies.items():
-            if scalp.is_active:
-                stop_tasks.append(scalp.stop())
-        for pair, opts in self._options_strategies.items():
-            if opts.is_active:
-                stop_tasks.append(opts.stop())
-        if stop_tasks:
-            await asyncio.gather(*stop_tasks, return_exceptions=True)
-
-        # Save final state
-        await self._save_status()
-
-        # Stop scheduler
-        self._scheduler.shutdown(wait=False)
-
-        # Notify (before closing Telegram session)
-        await self.alerts.send_bot_stopped(reason)
-
-        # Close Telegram bot session (prevents "Unclosed client session" warnings)
-        await self.alerts.disconnect()
-
-        # Close exchange connections
-        if self.binance:
-            await self.binance.close()
-        if self.kucoin:
-            await self.kucoin.close()
-        if self.delta:
-            await self.delta.close()
-        if self.delta_options:
-            await self.delta_options.close()
-        if self.bybit:
-            await self.bybit.close()
+            # Stop all active strategies concurrently (scalp + options overlays)
+            stop_tasks = []
+            for pair, scalp in self._scalp_strategies.items():
+                if scalp.is_active:
+                    stop_tasks.append(scalp.stop())
+            for pair, opts in self._options_strategies.items():
+                if opts.is_active:
+                    stop_tasks.append(opts.stop())
+            if stop_tasks:
+                await asyncio.gather(*stop_tasks, return_exceptions=True)
 
-        logger.info("Shutdown complete")
+            # Save final state
+            await self._save_status()
+
+            # Stop the timer wheel and any job run still in flight
+            if self._timer_task:
+                self._timer_task.cancel()
+            for _, _, timer in self._timers:
+                if timer.running:
+                    timer.running.cancel()
+
+            # Let in-flight background alerts finish before the Telegram session closes
+            if self._bg_tasks:
+                await asyncio.wait(self._bg_tasks, timeout=10)
+
+            # Notify (before closing Telegram session)
+            await self.alerts.send_bot_stopped(reason)
+
+            # Close Telegram bot session (prevents "Unclosed client session" warnings)
+            await self.alerts.disconnect()
+
+            # Close exchange connections
+            if self.binance:
+                await self.binance.close()
+            if self.kucoin:
+                await self.kucoin.close()
+            if self.delta:
+                await self.delta.close()
+            if self.delta_options:
+                await self.delta_options.close()
+            if self.bybit:
+                await self.bybit.close()
+            if self.kraken:
+                await self.kraken.close()
+            # ccxt doesn't close sessions it was handed — close the shared pool ourselves
+            if self._http_session:
+                await self._http_session.close()
+
+            logger.info("Shutdown complete")
+        finally:
+            # Release start() only once teardown is done (or has failed)
+            self._stop_event.set()
+
+    def _on_trade_closed(self, pair: str, pnl: float) -> None:
+        """RiskManager close listener — hourly stats + cache invalidation."""
+        # A close moves balances — drop cached wallet/portfolio reads
+        self._balance_cache.clear()
+        self._portfolio_cache.clear()
+        self._hourly_pnl += pnl
+        if pnl >= 0:
+            self._hourly_wins += 1
+        else:
+            self._hourly_losses += 1
 
     # -- Core cycle ------------------------------------------------------------
 
+    @staticmethod
+    async def _analyze_one(
+        analyzer: MarketAnalyzer | None,
+        pair: str,
+        sem: asyncio.Semaphore,
+        out: list[MarketAnalysis | BaseException | None],
+        i: int,
+    ) -> None:
+        """Analyze one pair into ``out[i]``; failures are stored, not raised."""
+        async with sem:
+            try:
+                out[i] = await analyzer.analyze(pair)  # type: ignore[union-attr]
+            except Exception as e:
+                out[i] = e
+
     async def _analysis_cycle(self) -> None:
         """Analyze all pairs (both exchanges) concurrently, switch strategies by signal strength."""
         if not self._running:
@@ -617,87 +935,74 @@ class AlphaBot:
             logger.exception("Failed to refresh pair/setup configs")
 
         try:
-            # 1. Analyze all pairs in parallel
-            analysis_tasks = [
-                self.analyzer.analyze(pair)  # type: ignore[union-attr]
-                for pair in self.pairs
-            ]
-            # Delta pairs use the delta analyzer
-            if self.delta and self.delta_analyzer:
-                for pair in self.delta_pairs:
-                    analysis_tasks.append(self.delta_analyzer.analyze(pair))
-
-            all_tracked = self.all_pairs
-            results = await asyncio.gather(*analysis_tasks, return_exceptions=True)
-
-            # 2. Collect successful analyses
-            analyses = []
-            for pair, result in zip(all_tracked, results):
-                if isinstance(result, Exception):
-                    logger.error("Analysis failed for %s: %s", pair, result)
-                else:
-                    analyses.append(result)
+            # 1. Analyze all pairs in parallel, capped per venue so one
+            # lagging exchange can't hog the loop with a burst of requests
+            routes = self._pair_analyzer
+            analyzed_pairs = list(routes)
+
+            results: list[MarketAnalysis | BaseException | None] = [None] * len(routes)
+            async with asyncio.TaskGroup() as tg:
+                for i, (pair, (analyzer, sem)) in enumerate(routes.items()):
+                    tg.create_task(self._analyze_one(analyzer, pair, sem, results, i))
+
+            # 2. Collect successful analyses -- failed slots hold the exception
+            analyses = [r for r in results if isinstance(r, MarketAnalysis)]
+            if len(analyses) != len(results):
+                for pair, result in zip(analyzed_pairs, results):
+                    if isinstance(result, BaseException):
+                        logger.error("Analysis failed for %s: %s", pair, result)
 
             # 3. Sort by signal_strength descending -- best opportunities first
-            analyses.sort(key=lambda a: a.signal_strength, reverse=True)
-
-            logger.info(
-                "Analysis complete -- strength ranking: %s",
-                ", ".join(f"{a.pair}={a.signal_strength:.0f}" for a in analyses),
-            )
+            analyses.sort(key=_by_signal_strength, reverse=True)
+            # One timestamp for every strategy-log row this cycle writes
+            cycle_ts = iso_now()
 
             # 4. Log analysis per pair — ALL pairs use SCALP only (no strategy switching)
             all_analysis_dicts: list[dict[str, Any]] = []
+            ranking: list[str] | None = [] if logger.isEnabledFor(logging.INFO) else None
+            selection_rows: list[dict[str, Any]] = []
 
             for analysis in analyses:
                 pair = analysis.pair
+                if ranking is not None:
+                    ranking.append(f"{pair}={analysis.signal_strength:.0f}")
 
                 # Log to strategy_log DB table (dashboard reads this) — always "scalp"
                 try:
-                    if pair in self.bybit_pairs:
-                        exchange = "bybit"
-                    elif pair in self.delta_pairs:
-                        exchange = "delta"
-                    elif pair in self.kraken_pairs:
-                        exchange = "kraken"
-                    else:
-                        exchange = "binance"
-                    if analysis.rsi >= 50:
-                        entry_distance_pct = analysis.rsi - 55.0
-                    else:
-                        entry_distance_pct = 45.0 - analysis.rsi
+                    exchange = self._pair_exchange.get(pair, "binance")
+                    # RSI points left to the 55/45 entry band (negative = inside it)
+                    entry_distance_pct = abs(analysis.rsi - 50.0) - 5.0
 
                     # Grab live signal state from the scalp strategy (1m data)
                     scalp = self._get_scalp(pair)
-                    sig = scalp.last_signal_state if scalp else None
-                    sig_count = sig.get("strength", 0) if sig else 0
-                    sig_side = sig.get("side") if sig else None  # "long", "short", or None
-                    bull_count = sig.get("bull_count", 0) if sig else 0
-                    bear_count = sig.get("bear_count", 0) if sig else 0
+                    sig = (scalp.last_signal_state if scalp else None) or _NO_SIGNAL
+                    sig_get = sig.get
+                    sig_count = sig_get("strength", 0)
+                    sig_side = sig_get("side")  # "long", "short", or None
+                    bull_count = sig_get("bull_count", 0)
+                    bear_count = sig_get("bear_count", 0)
 
                     # Per-direction core-4 booleans (dashboard shows both bull + bear dots)
-                    bull_mom = sig.get("bull_mom", False) if sig else False
-                    bull_vol = sig.get("bull_vol", False) if sig else False
-                    bull_rsi = sig.get("bull_rsi", False) if sig else False
-                    bull_bb = sig.get("bull_bb", False) if sig else False
-                    bear_mom = sig.get("bear_mom", False) if sig else False
-                    bear_vol = sig.get("bear_vol", False) if sig else False
-                    bear_rsi = sig.get("bear_rsi", False) if sig else False
-                    bear_bb = sig.get("bear_bb", False) if sig else False
-
-                    # Legacy: active-side signals for backward compat
-                    if sig_side == "long":
-                        sig_mom, sig_vol, sig_rsi, sig_bb = bull_mom, bull_vol, bull_rsi, bull_bb
-                    elif sig_side == "short":
-                        sig_mom, sig_vol, sig_rsi, sig_bb = bear_mom, bear_vol, bear_rsi, bear_bb
-                    else:
-                        if bull_count >= bear_count:
-                            sig_mom, sig_vol, sig_rsi, sig_bb = bull_mom, bull_vol, bull_rsi, bull_bb
-                        else:
-                            sig_mom, sig_vol, sig_rsi, sig_bb = bear_mom, bear_vol, bear_rsi, bear_bb
+                    bull = (
+                        sig_get("bull_mom", False), sig_get("bull_vol", False),
+                        sig_get("bull_rsi", False), sig_get("bull_bb", False),
+                    )
+                    bear = (
+                        sig_get("bear_mom", False), sig_get("bear_vol", False),
+                        sig_get("bear_rsi", False), sig_get("bear_bb", False),
+                    )
+                    bull_mom, bull_vol, bull_rsi, bull_bb = bull
+                    bear_mom, bear_vol, bear_rsi, bear_bb = bear
+
+                    # Legacy: active-side signals for backward compat — the
+                    # signalled side, else whichever side has more votes
+                    use_bull = sig_side == "long" or (
+                        sig_side != "short" and bull_count >= bear_count
+                    )
+                    sig_mom, sig_vol, sig_rsi, sig_bb = bull if use_bull else bear
 
-                    await self.db.log_strategy_selection({
-                        "timestamp": iso_now(),
+                    selection_rows.append({
+                        "timestamp": cycle_ts,
                         "pair": pair,
                         "exchange": exchange,
                         "market_condition": analysis.condition.value,
@@ -740,7 +1045,7 @@ class AlphaBot:
                         "bear_vol": bear_vol,
                         "bear_rsi": bear_rsi,
                         "bear_bb": bear_bb,
-                        "skip_reason": sig.get("skip_reason", "") if sig else "",
+                        "skip_reason": sig_get("skip_reason", ""),
                     })
                 except Exception:
                     logger.debug("Failed to log strategy selection for %s", pair)
@@ -755,8 +1060,14 @@ class AlphaBot:
                     "exchange": exchange,
                 })
 
+            # All of this cycle's strategy-log rows go out in one insert
+            await self.db.log_strategy_selections(selection_rows)
+
             rm = self.risk_manager
 
+            if ranking is not None:
+                logger.info("Analysis complete -- strength ranking: %s", ", ".join(ranking))
+
             # 4b. Cache latest analysis data for the hourly market update
             self._latest_analyses = all_analysis_dicts
 
@@ -777,8 +1088,10 @@ class AlphaBot:
         if not self.kucoin:
             return False
         try:
-            binance_ticker = await self.binance.fetch_ticker(pair)  # type: ignore[union-attr]
-            kucoin_ticker = await self.kucoin.fetch_ticker(pair)
+            binance_ticker, kucoin_ticker = await asyncio.gather(
+                self.binance.fetch_ticker(pair),  # type: ignore[union-attr]
+                self.kucoin.fetch_ticker(pair),
+            )
             bp = binance_ticker["last"]
             kp = kucoin_ticker["last"]
             spread_pct = abs((bp - kp) / bp) * 100
@@ -803,23 +1116,27 @@ class AlphaBot:
         if not self.delta:
             return
 
-        # Initialize warning state if needed
-        if not hasattr(self, "_liq_warned"):
-            self._liq_warned: dict[str, float] = {}  # pair -> last telegram time
-
         sl_distance_pct = config.trading.per_trade_stop_loss_pct  # actual configured SL
 
+        # ── Ghost position guard ──
+        # Only check liquidation if the scalp strategy ALSO thinks we're in
+        # a position. Prevents spam from stale entries in risk_manager.
+        check_pairs: list[str] = []
         for pair in self.delta_pairs:
-            try:
-                # ── Ghost position guard ──
-                # Only check liquidation if the scalp strategy ALSO thinks we're in
-                # a position. Prevents spam from stale entries in risk_manager.
-                scalp = self._get_scalp(pair, exchange="delta")
-                if scalp and not scalp.in_position:
-                    self._liq_warned.pop(pair, None)
-                    continue
+            scalp = self._get_scalp(pair, exchange="delta")
+            if scalp and not scalp.in_position:
+                self._liq_warned.pop(pair, None)
+                continue
+            check_pairs.append(pair)
+        if not check_pairs:
+            return
+
+        # All prices in one batch request instead of one round-trip per pair
+        tickers = await self._fetch_tickers(self.delta, check_pairs)
 
-                ticker = await self.delta.fetch_ticker(pair)
+        for pair in check_pairs:
+            try:
+                ticker = tickers[pair]
                 current_price = ticker["last"]
                 distance = self.risk_manager.check_liquidation_risk(pair, current_price)
                 if distance is None:
@@ -829,19 +1146,16 @@ class AlphaBot:
 
                 # Find position info
                 pos = None
-                for p in self.risk_manager.open_positions:
-                    if p.pair == pair and p.leverage > 1:
+                for p in self.risk_manager.open_positions_by_pair.get(pair, ()):
+                    if p.leverage > 1:
                         pos = p
                         break
                 if pos is None:
                     continue
 
-                # Calculate liq price + leverage-aware thresholds
+                # Liq price (fixed at open) + leverage-aware thresholds
                 leverage = pos.leverage or 20
-                if pos.position_type == "long":
-                    liq_price = pos.entry_price * (1 - 1 / leverage)
-                else:
-                    liq_price = pos.entry_price * (1 + 1 / leverage)
+                liq_price = pos.liquidation_price
 
                 liq_total_pct = 100.0 / leverage   # total distance: 2% at 50x, 5% at 20x
                 safe_threshold = liq_total_pct * 0.60     # >60%: safe
@@ -932,19 +1246,18 @@ class AlphaBot:
             pnl_map = dict(rm.daily_pnl_by_pair)
             best_trade = None
             worst_trade = None
-            if pnl_map:
-                best_pair = max(pnl_map, key=pnl_map.get)  # type: ignore[arg-type]
-                worst_pair = min(pnl_map, key=pnl_map.get)  # type: ignore[arg-type]
-                best_trade = {"pair": best_pair, "pnl": pnl_map[best_pair]}
-                worst_trade = {"pair": worst_pair, "pnl": pnl_map[worst_pair]}
+            # Best and worst pair in one pass over the map
+            for pair, pnl in pnl_map.items():
+                if best_trade is None or pnl > best_trade["pnl"]:
+                    best_trade = {"pair": pair, "pnl": pnl}
+                if worst_trade is None or pnl < worst_trade["pnl"]:
+                    worst_trade = {"pair": pair, "pnl": pnl}
 
         # Fetch live exchange balances
-        binance_bal = await self._fetch_portfolio_usd(self.binance)
-        delta_bal = await self._fetch_portfolio_usd(self.delta) if self.delta else None
-        bybit_bal = await self._fetch_portfolio_usd(self.bybit) if self.bybit else None
+        binance_bal, delta_bal, bybit_bal, kraken_bal = await self._fetch_all_balances()
 
         # Capital = sum of actual exchange balances
-        total_capital = (binance_bal or 0) + (delta_bal or 0) + (bybit_bal or 0)
+        total_capital = (binance_bal or 0) + (delta_bal or 0) + (bybit_bal or 0) + (kraken_bal or 0)
 
         await self.alerts.send_daily_summary(
             total_trades=total,
@@ -979,32 +1292,17 @@ class AlphaBot:
             rm = self.risk_manager
 
             # Build active strategies map (scalp + options overlays)
-            active_map: dict[str, str | None] = {}
-            for pair in self.all_pairs:
-                scalp = self._get_scalp(pair)
-                opts = self._options_strategies.get(pair)
-                if scalp and scalp.in_position:
-                    side = scalp.position_side or "long"
-                    active_map[pair] = f"scalp_{side}"
-                elif opts and getattr(opts, "in_position", False):
-                    active_map[pair] = "options_scalp"
-                elif scalp:
-                    active_map[pair] = "scalp"
-                else:
-                    active_map[pair] = None
+            active_map = self._build_active_map()
 
-            # Fetch live exchange balances (includes held assets)
-            binance_bal = await self._fetch_portfolio_usd(self.binance)
-            delta_bal = await self._fetch_portfolio_usd(self.delta) if self.delta else None
-            bybit_bal = await self._fetch_portfolio_usd(self.bybit) if self.bybit else None
-            kraken_bal = await self._fetch_portfolio_usd(self.kraken) if self.kraken else None
+            # Fetch live exchange balances (includes held assets) and cross-check
+            # positions against the exchange (verify we actually hold coins) together
+            (binance_bal, delta_bal, bybit_bal, kraken_bal), verified_positions = await asyncio.gather(
+                self._fetch_all_balances(), self._verify_positions_against_exchange(),
+            )
 
             # Capital = sum of actual exchange balances
             total_capital = (binance_bal or 0) + (delta_bal or 0) + (bybit_bal or 0) + (kraken_bal or 0)
 
-            # Cross-check positions against exchange: verify we actually hold coins
-            verified_positions = await self._verify_positions_against_exchange()
-
             # Compute unrealized P&L for open positions from scalp strategies
             unrealized_pnl = 0.0
             for _key, scalp in self._scalp_strategies.items():
@@ -1037,7 +1335,7 @@ class AlphaBot:
             # Build options status per base asset
             options_status: dict[str, str] = {}
             for pair, opts in self._options_strategies.items():
-                base = pair.split("/")[0] if "/" in pair else pair[:3]
+                base = _base_of(pair)
                 if opts.in_position and opts.option_side:
                     side_icon = "\U0001f7e2" if opts.option_side == "call" else "\U0001f534"
                     strike_tag = f"${opts.strike_price:,.0f}" if opts.strike_price else ""
@@ -1093,7 +1391,8 @@ class AlphaBot:
         binance_free: dict[str, Any] = {}
         try:
             if self.binance:
-                bal = await self.binance.fetch_balance()
+                # Shares the fetch made by _fetch_portfolio_usd in the same report
+                bal = await self._cached_balance(self.binance)
                 binance_free = bal.get("free", {})
         except Exception:
             logger.debug("Could not fetch Binance balance for position verification")
@@ -1104,84 +1403,93 @@ class AlphaBot:
             ]
 
         for pos in rm.open_positions:
-            if pos.exchange == "binance":
-                base = pos.pair.split("/")[0] if "/" in pos.pair else pos.pair
-                held = float(binance_free.get(base, 0) or 0)
-                held_value = held * pos.entry_price if pos.entry_price > 0 else 0
-                if held > 0 and held_value > 0.50:
-                    verified.append({
-                        "pair": pos.pair,
-                        "position_type": pos.position_type,
-                        "exchange": pos.exchange,
-                        "held": held,
-                        "held_value": held_value,
-                    })
-                else:
-                    logger.info(
-                        "Position %s on %s not found on exchange (held=%.8f, value=$%.2f) — stale?",
-                        pos.pair, pos.exchange, held, held_value,
-                    )
-            else:
+            pair, exchange_id = pos.pair, pos.exchange
+            row = {"pair": pair, "position_type": pos.position_type, "exchange": exchange_id}
+            if exchange_id != "binance":
                 # Delta/futures: trust internal state (futures positions may not show as balances)
-                verified.append({
-                    "pair": pos.pair,
-                    "position_type": pos.position_type,
-                    "exchange": pos.exchange,
-                })
+                verified.append(row)
+                continue
+            base = _base_of(pair)
+            held = _fnum(binance_free, base)
+            entry_price = pos.entry_price
+            held_value = held * entry_price if entry_price > 0 else 0
+            if held > 0 and held_value > 0.50:
+                row["held"] = held
+                row["held_value"] = held_value
+                verified.append(row)
+            else:
+                logger.info(
+                    "Position %s on %s not found on exchange (held=%.8f, value=$%.2f) — stale?",
+                    pair, exchange_id, held, held_value,
+                )
 
         return verified
 
-    async def _save_status(self) -> None:
-        """Persist bot state to Supabase for crash recovery + dashboard display."""
-        try:
-            await self._save_status_inner()
-        except Exception:
-            logger.exception("[STATUS] _save_status failed — dashboard may show stale data")
-
-    async def _save_status_inner(self) -> None:
-        rm = self.risk_manager
+    def _build_active_map(self) -> dict[str, str | None]:
+        """Current strategy label per tracked pair: scalp_<side>, options_scalp, scalp or None.
 
-        # Build per-pair info (scalp + options overlays)
+        Built on demand — position state lives on the strategies and changes
+        from their own loops, so a map kept in step elsewhere would go stale.
+        """
         active_map: dict[str, str | None] = {}
-        active_count = 0
+        options = self._options_strategies
         for pair in self.all_pairs:
             scalp = self._get_scalp(pair)
-            opts = self._options_strategies.get(pair)
+            opts = options.get(pair)
             if scalp and scalp.in_position:
-                side = scalp.position_side or "long"
-                active_map[pair] = f"scalp_{side}"
-                active_count += 1
+                active_map[pair] = f"scalp_{scalp.position_side or 'long'}"
             elif opts and getattr(opts, "in_position", False):
                 active_map[pair] = "options_scalp"
-                active_count += 1
             elif scalp:
                 active_map[pair] = "scalp"
-                active_count += 1
             else:
                 active_map[pair] = None
+        return active_map
+
+    async def _save_status(self) -> None:
+        """Persist bot state to Supabase for crash recovery + dashboard display."""
+        try:
+            await self._save_status_inner()
+        except Exception:
+            logger.exception("[STATUS] _save_status failed — dashboard may show stale data")
+
+    async def _save_status_inner(self) -> None:
+        rm = self.risk_manager
+
+        # Build per-pair info (scalp + options overlays)
+        active_map = self._build_active_map()
+        active_count = sum(1 for name in active_map.values() if name is not None)
 
         # Use primary pair's analysis for condition
         last = self.analyzer.last_analysis if self.analyzer else None
 
-        # Fetch exchange balances and update per-exchange capital
+        # Exchange balances and trade stats are independent —
+        # fetch them together instead of one round-trip after another
+        balances, trade_stats = await asyncio.gather(
+            self._fetch_all_balances(),
+            self.db.get_trade_stats(),
+            return_exceptions=True,
+        )
+
+        # Update per-exchange capital from the balances
         binance_bal: float | None = None
         delta_bal: float | None = None
         bybit_bal: float | None = None
         kraken_bal: float | None = None
-        try:
-            binance_bal = await self._fetch_portfolio_usd(self.binance)
-            delta_bal = await self._fetch_portfolio_usd(self.delta) if self.delta else None
-            bybit_bal = await self._fetch_portfolio_usd(self.bybit) if self.bybit else None
-            kraken_bal = await self._fetch_portfolio_usd(self.kraken) if self.kraken else None
-        except Exception:
-            logger.exception("[STATUS] Balance fetch failed — saving status with partial data")
+        if isinstance(balances, Exception):
+            logger.error(
+                "[STATUS] Balance fetch failed — saving status with partial data",
+                exc_info=balances,
+            )
+        else:
+            binance_bal, delta_bal, bybit_bal, kraken_bal = balances
         rm.update_exchange_balances(binance_bal, delta_bal, bybit_bal, kraken_bal)
 
         # Fetch raw INR balance for dashboard display
         delta_balance_inr = None
         if self.delta:
             try:
-                bal = await self.delta.fetch_balance()
+                bal = await self._cached_balance(self.delta)  # just fetched for the portfolio value
                 inr_val = bal.get("total", {}).get("INR") or bal.get("free", {}).get("INR")
                 if inr_val is not None and float(inr_val) > 0:
                     delta_balance_inr = round(float(inr_val), 2)
@@ -1196,11 +1504,9 @@ class AlphaBot:
         else:
             bot_state = "running"
 
-        # Query ACTUAL P&L from trades table (source of truth)
+        # ACTUAL P&L from trades table (source of truth)
         # Never trust in-memory calculations for dashboard display
-        try:
-            trade_stats = await self.db.get_trade_stats()
-        except Exception:
+        if isinstance(trade_stats, Exception):
             logger.warning("[STATUS] get_trade_stats failed — using defaults")
             trade_stats = {"total_pnl": 0, "win_rate": 0, "total_trades": 0}
 
@@ -1242,7 +1548,7 @@ class AlphaBot:
             "delta_enabled": self._delta_enabled,
             "kraken_enabled": self._kraken_enabled,
             # INR exchange rate for dashboard display
-            "inr_usd_rate": await self._get_inr_usd_rate(),
+            "inr_usd_rate": self._inr_usd_rate,
             # Daily P&L breakdown
             "daily_pnl_scalp": rm.daily_pnl_scalp,
             "daily_pnl_options": rm.daily_pnl_options,
@@ -1269,7 +1575,7 @@ class AlphaBot:
                 since_mono = getattr(s, "_regime_since", 0.0)
                 if since_mono > 0 and self._start_time:
                     elapsed = time.monotonic() - since_mono
-                    regime_since_ts = (_dt.datetime.now(_dt.timezone.utc) - _dt.timedelta(seconds=elapsed)).isoformat()
+                    regime_since_ts = (datetime.now(timezone.utc) - timedelta(seconds=elapsed)).isoformat()
 
         status["market_regime"] = worst_regime
         status["chop_score"] = round(best_chop, 3)
@@ -1329,7 +1635,10 @@ class AlphaBot:
         except Exception:
             logger.debug("Failed to build diagnostics blob")
 
-        await self.db.save_bot_status(status)
+        # Nothing downstream consumes the write — don't hold the job open for
+        # the Supabase round-trip. save_bot_status logs its own failures and
+        # shutdown() drains _bg_tasks before the sessions close.
+        self._spawn(self.db.save_bot_status(status))
 
     async def _poll_commands(self) -> None:
         """Check Supabase for pending dashboard commands and execute them."""
@@ -1369,14 +1678,16 @@ class AlphaBot:
             elif command == "resume":
                 force = bool(params.get("force", False))
                 self.risk_manager.unpause(force=force)
-                await self._analysis_cycle()  # re-evaluate and start strategies
+                # Re-evaluate in the background — the ack shouldn't wait on a full cycle
+                self._spawn(self._analysis_cycle())
                 # Restart scalp + options overlays
-                for pair, scalp in self._scalp_strategies.items():
-                    if not scalp.is_active:
-                        await scalp.start()
-                for pair, opts in self._options_strategies.items():
-                    if not opts.is_active:
-                        await opts.start()
+                restart = [
+                    s.start() for s in self._scalp_strategies.values() if not s.is_active
+                ] + [
+                    o.start() for o in self._options_strategies.values() if not o.is_active
+                ]
+                if restart:
+                    await asyncio.gather(*restart, return_exceptions=True)
                 label = "force_resume" if force else "resume"
                 await self.alerts.send_command_confirmation(label)
                 result_msg = "Bot force-resumed (win-rate bypass active)" if force else "Bot resumed"
@@ -1503,7 +1814,7 @@ class AlphaBot:
         # Find the matching scalp strategy instance
         scalp: ScalpStrategy | None = None
         for _key, s in self._scalp_strategies.items():
-            if s.pair == pair_str or pair_str.startswith(s.pair.split("/")[0]):
+            if s.pair == pair_str or pair_str.startswith(_base_of(s.pair)):
                 scalp = s
                 pair_str = s.pair  # normalise to full bare pair
                 break
@@ -1511,7 +1822,7 @@ class AlphaBot:
         if scalp is None:
             return f"Error: no scalp strategy for {pair_str}"
 
-        short = pair_str.split("/")[0]
+        short = _base_of(pair_str)
         changes: list[str] = []
 
         if "sl" in params:
@@ -1581,7 +1892,7 @@ class AlphaBot:
         # Apply pair configs to matching scalp strategies
         for _key, scalp in self._scalp_strategies.items():
             bare = scalp.pair
-            base = bare.split("/")[0] if "/" in bare else bare.replace("USD", "").replace(":USD", "")
+            base = _base_of(bare)
             pc = pair_configs.get(base, {})
             if pc:
                 scalp._pair_enabled = pc.get("enabled", True)
@@ -1614,7 +1925,7 @@ class AlphaBot:
         # Find the matching scalp strategy
         scalp: ScalpStrategy | None = None
         for _key, s in self._scalp_strategies.items():
-            if s.pair == pair_str or pair_str.startswith(s.pair.split("/")[0]):
+            if s.pair == pair_str or pair_str.startswith(_base_of(s.pair)):
                 scalp = s
                 break
 
@@ -1665,7 +1976,6 @@ class AlphaBot:
             if strat.in_position and (strat.option_symbol == pair_str or strat.pair == pair_str):
                 # Build a market exit signal and execute
                 try:
-                    from alpha.strategies.base import Signal, StrategyName
                     exit_side = "sell"  # options are always long, close by selling
                     exit_signal = Signal(
                         side=exit_side,
@@ -1708,27 +2018,30 @@ class AlphaBot:
             if not open_trade:
                 return f"Trade {trade_id} not found or already closed"
 
-            entry_price = float(open_trade.get("entry_price", 0) or 0)
+            entry_price = _fnum(open_trade, "entry_price")
             position_type = open_trade.get("position_type", "long")
             leverage = int(open_trade.get("leverage", 1) or 1)
-            amount = float(open_trade.get("amount", 0) or 0)
+            amount = _fnum(open_trade, "amount")
             exchange_id = open_trade.get("exchange", "delta")
 
             # Try to get exit price from exchange trade history
             exit_price = entry_price  # fallback
             try:
-                exchange = self.delta_options if is_option_symbol(pair_str) else (
-                    self.delta if exchange_id == "delta" else self.binance
+                exchange = (
+                    self.delta_options if is_option_symbol(pair_str)
+                    else self._exchanges.get(exchange_id)
                 )
                 if exchange:
                     recent = await exchange.fetch_my_trades(pair_str, limit=20)
-                    close_side = "sell" if position_type in ("long", "spot") else "buy"
-                    fills = [t for t in (recent or []) if t.get("side") == close_side]
-                    if fills:
-                        exit_price = float(fills[-1].get("price", 0) or 0) or entry_price
-                    elif not fills:
-                        ticker = await exchange.fetch_ticker(pair_str)
-                        exit_price = float(ticker.get("last", 0) or 0) or entry_price
+                    close_side = _CLOSE_SIDE.get(position_type, "buy")
+                    last_fill = next(
+                        (t for t in reversed(recent or []) if t.get("side") == close_side), None,
+                    )
+                    if last_fill:
+                        exit_price = _fnum(last_fill, "price") or entry_price
+                    else:
+                        ticker = await self._get_ticker(exchange, pair_str)
+                        exit_price = _fnum(ticker, "last") or entry_price
             except Exception as e:
                 logger.warning("Ghost trade %s: could not fetch exit price: %s", pair_str, e)
 
@@ -1742,11 +2055,11 @@ class AlphaBot:
                 "status": "closed",
                 "exit_price": exit_price,
                 "closed_at": iso_now(),
-                "pnl": round(result.net_pnl, 8),
-                "pnl_pct": round(result.pnl_pct, 4),
-                "gross_pnl": round(result.gross_pnl, 8),
-                "entry_fee": round(result.entry_fee, 8),
-                "exit_fee": round(result.exit_fee, 8),
+                "pnl": result.net_pnl,
+                "pnl_pct": result.pnl_pct,
+                "gross_pnl": result.gross_pnl,
+                "entry_fee": result.entry_fee,
+                "exit_fee": result.exit_fee,
                 "reason": "ghost_manual_close",
                 "exit_reason": "MANUAL",
                 "position_state": None,
@@ -1775,50 +2088,57 @@ class AlphaBot:
 
             open_trades = await self.db.get_all_open_trades()
             binance_trades = [t for t in open_trades if t.get("exchange") == "binance"]
-            dust_count = 0
+            # (trade, held, entry_price) for every trade that's dust on the exchange
+            dust: list[tuple[dict[str, Any], float, float]] = []
             for trade in binance_trades:
+                if not trade.get("id"):
+                    continue
                 pair = trade.get("pair", "")
-                base = pair.split("/")[0] if "/" in pair else pair
-                held = float(free_map.get(base, 0) or 0)
-                entry_price = float(trade.get("entry_price", 0) or 0)
+                base = _base_of(pair)
+                held = _fnum(free_map, base)
+                entry_price = _fnum(trade, "entry_price")
                 held_value = held * entry_price if entry_price > 0 else 0
                 if held_value < 5.0 and held_value > 0:
-                    trade_id = trade.get("id")
-                    order_id = trade.get("order_id", "")
-                    if trade_id:
-                        # Calculate P&L from entry — dust is a small loss
-                        try:
-                            ticker = await self.binance.fetch_ticker(pair)  # type: ignore[union-attr]
-                            current_price = float(ticker.get("last", 0) or 0)
-                        except Exception:
-                            current_price = entry_price  # fallback: 0 P&L
-                        pnl, pnl_pct = calc_pnl(
-                            entry_price, current_price, held,
-                            trade.get("position_type", "spot"),
-                            trade.get("leverage", 1) or 1,
-                            "binance", pair,
-                        )
-                        if order_id:
-                            await self.db.close_trade(
-                                order_id, current_price, pnl, pnl_pct,
-                                reason="dust_unsellable",
-                                exit_reason="DUST",
-                            )
-                        else:
-                            await self.db.update_trade(trade_id, {
-                                "status": "closed",
-                                "closed_at": iso_now(),
-                                "exit_price": current_price,
-                                "pnl": pnl,
-                                "pnl_pct": pnl_pct,
-                                "reason": "dust_unsellable",
-                                "exit_reason": "DUST",
-                            })
-                        dust_count += 1
-                        logger.info(
-                            "Dust trade %s: exit=$%.2f pnl=$%.4f (%.2f%%)",
-                            pair, current_price, pnl, pnl_pct,
-                        )
+                    dust.append((trade, held, entry_price))
+
+            # Price all dust pairs in one batch, then close them concurrently
+            tickers = await self._fetch_tickers(
+                self.binance, list({t.get("pair", "") for t, _, _ in dust}),
+            )
+            writes: list[tuple[str, Any, Coroutine[Any, Any, Any]]] = []
+            for trade, held, entry_price in dust:
+                pair = trade.get("pair", "")
+                # Calculate P&L from entry — dust is a small loss
+                current_price = _fnum(tickers.get(pair) or {}, "last") or entry_price  # fallback: 0 P&L
+                pnl, pnl_pct = calc_pnl(
+                    entry_price, current_price, held,
+                    trade.get("position_type", "spot"),
+                    trade.get("leverage", 1) or 1,
+                    "binance", pair,
+                )
+                order_id = trade.get("order_id", "")
+                if order_id:
+                    writes.append((pair, order_id, self.db.close_trade(
+                        order_id, current_price, pnl, pnl_pct,
+                        reason="dust_unsellable",
+                        exit_reason="DUST",
+                    )))
+                else:
+                    writes.append((pair, trade["id"], self.db.update_trade(trade["id"], {
+                        "status": "closed",
+                        "closed_at": iso_now(),
+                        "exit_price": current_price,
+                        "pnl": pnl,
+                        "pnl_pct": pnl_pct,
+                        "reason": "dust_unsellable",
+                        "exit_reason": "DUST",
+                    })))
+                logger.info(
+                    "Dust trade %s: exit=$%.2f pnl=$%.4f (%.2f%%)",
+                    pair, current_price, pnl, pnl_pct,
+                )
+            await self._gather_db_writes(writes, "Binance dust close")
+            dust_count = len(writes)
             if dust_count:
                 logger.info("Closed %d Binance dust trades (< $5)", dust_count)
         except Exception:
@@ -1984,7 +2304,7 @@ class AlphaBot:
         NOTE: Restored trades are saved in self._restored_trades for later
         injection into strategy instances (see _restore_strategy_state).
         """
-        self._restored_trades: list[dict[str, Any]] = []
+        self._restored_trades: list[RestoredTrade] = []
 
         open_trades = await self.db.get_all_open_trades()
         if not open_trades:
@@ -1993,112 +2313,148 @@ class AlphaBot:
 
         logger.info("Found %d open trades in DB — verifying against exchange...", len(open_trades))
 
-        # Fetch exchange balances once (not per-trade)
-        binance_balance: dict[str, Any] = {}
+        # Only query the venues that have DB-open trades to verify — on a
+        # warm restart most of them have none. Delta futures positions are
+        # always fetched: the discovery pass below needs them.
+        db_exchanges = {t.get("exchange", "binance") for t in open_trades}
+        has_options_trades = any(
+            is_option_symbol(t.get("pair", "")) for t in open_trades
+            if t.get("exchange") == "delta"
+        )
 
-        try:
-            if self.binance:
-                bal = await self.binance.fetch_balance()
-                binance_balance = bal.get("free", {})
-        except Exception:
-            logger.warning("Could not fetch Binance balance for position restore")
+        # The four venue reads below are independent — run them concurrently
+        # so startup waits on the slowest one, not the sum
 
-        # Fetch Delta positions via fetch_positions() — actual open contracts
-        delta_positions: dict[str, dict[str, Any]] = {}
-        try:
-            if self.delta:
-                positions = await self.delta.fetch_positions()
-                for pos in positions:
-                    contracts = float(pos.get("contracts", 0) or 0)
-                    if contracts != 0:
-                        symbol = pos.get("symbol", "")
-                        side = "long" if contracts > 0 else "short"
-                        entry_px = float(pos.get("entryPrice", 0) or 0)
-                        delta_positions[symbol] = {
-                            "side": side,
-                            "contracts": abs(contracts),
-                            "entry_price": entry_px,
-                            "info": pos,
-                        }
-                        logger.info(
-                            "Found open Delta position: %s %s %.0f contracts @ $%.2f",
-                            symbol, side, abs(contracts), entry_px,
-                        )
-                if not delta_positions:
-                    logger.info("No open Delta positions on exchange")
-        except Exception as e:
-            logger.error("Failed to fetch Delta positions on startup: %s", e)
+        async def _load_binance_balance() -> dict[str, float]:
+            # Fetch exchange balances once (not per-trade), normalized to floats
+            # so the per-trade check below is a plain dict lookup
+            try:
+                if self.binance and "binance" in db_exchanges:
+                    bal = await self._cached_balance(self.binance)
+                    free = bal.get("free") or {}
+                    return {asset: _fnum(free, asset) for asset in free}
+            except Exception:
+                logger.warning("Could not fetch Binance balance for position restore")
+            return {}
 
-        # Fetch options positions from delta_options exchange (separate from futures)
-        options_positions: dict[str, dict[str, Any]] = {}
-        try:
-            if self.delta_options:
-                opt_positions = await self.delta_options.fetch_positions()
-                for pos in opt_positions:
-                    contracts = float(pos.get("contracts", 0) or 0)
-                    if contracts != 0:
-                        symbol = pos.get("symbol", "")
-                        entry_px = float(pos.get("entryPrice", 0) or 0)
-                        options_positions[symbol] = {
+        async def _load_delta_positions() -> dict[str, dict[str, Any]]:
+            # Fetch Delta positions via fetch_positions() — actual open contracts
+            found: dict[str, dict[str, Any]] = {}
+            try:
+                if self.delta:
+                    positions = await self.delta.fetch_positions()
+                    found = {
+                        pos.get("symbol", ""): {
                             "side": "long" if contracts > 0 else "short",
                             "contracts": abs(contracts),
-                            "entry_price": entry_px,
+                            "entry_price": _fnum(pos, "entryPrice"),
+                            "info": pos,
                         }
-                        logger.info(
-                            "Found open options position: %s %.0f contracts @ $%.4f",
-                            symbol, abs(contracts), entry_px,
-                        )
-                if not options_positions:
-                    logger.info("No open options positions on exchange")
-        except Exception as e:
-            logger.warning("Could not fetch options positions on startup: %s", e)
+                        for pos in positions
+                        if (contracts := _fnum(pos, "contracts")) != 0
+                    }
+                    if not found:
+                        logger.info("No open Delta positions on exchange")
+                    elif logger.isEnabledFor(logging.INFO):
+                        for symbol, p in found.items():
+                            logger.info(
+                                "Found open Delta position: %s %s %.0f contracts @ $%.2f",
+                                symbol, p["side"], p["contracts"], p["entry_price"],
+                            )
+            except Exception as e:
+                logger.error("Failed to fetch Delta positions on startup: %s", e)
+            return found
 
-        # Fetch Bybit positions via fetch_positions() — actual open positions
-        bybit_positions: dict[str, dict[str, Any]] = {}
-        try:
-            if self.bybit:
-                positions = await self.bybit.fetch_positions()
-                for pos in positions:
-                    contracts = float(pos.get("contracts", 0) or 0)
-                    if contracts != 0:
-                        symbol = pos.get("symbol", "")
-                        side = "long" if contracts > 0 else "short"
-                        entry_px = float(pos.get("entryPrice", 0) or 0)
-                        bybit_positions[symbol] = {
-                            "side": side,
-                            "amount": abs(contracts),
-                            "entry_price": entry_px,
-                        }
-                        logger.info(
-                            "Found open Bybit position: %s %s %.6f coins @ $%.2f",
-                            symbol, side, abs(contracts), entry_px,
-                        )
-                if not bybit_positions:
-                    logger.info("No open Bybit positions on exchange")
-        except Exception as e:
-            logger.error("Failed to fetch Bybit positions on startup: %s", e)
+        async def _load_options_positions() -> dict[str, dict[str, Any]]:
+            # Fetch options positions from delta_options exchange (separate from futures)
+            found: dict[str, dict[str, Any]] = {}
+            try:
+                if self.delta_options and has_options_trades:
+                    opt_positions = await self.delta_options.fetch_positions()
+                    for pos in opt_positions:
+                        contracts = _fnum(pos, "contracts")
+                        if contracts != 0:
+                            symbol = pos.get("symbol", "")
+                            entry_px = _fnum(pos, "entryPrice")
+                            found[symbol] = {
+                                "side": "long" if contracts > 0 else "short",
+                                "contracts": abs(contracts),
+                                "entry_price": entry_px,
+                            }
+                            if logger.isEnabledFor(logging.INFO):
+                                logger.info(
+                                    "Found open options position: %s %.0f contracts @ $%.4f",
+                                    symbol, abs(contracts), entry_px,
+                                )
+                    if not found:
+                        logger.info("No open options positions on exchange")
+            except Exception as e:
+                logger.warning("Could not fetch options positions on startup: %s", e)
+            return found
 
-        restored = 0
-        closed = 0
+        async def _load_bybit_positions() -> dict[str, dict[str, Any]]:
+            # Fetch Bybit positions via fetch_positions() — actual open positions
+            found: dict[str, dict[str, Any]] = {}
+            try:
+                if self.bybit and "bybit" in db_exchanges:
+                    positions = await self.bybit.fetch_positions()
+                    for pos in positions:
+                        contracts = _fnum(pos, "contracts")
+                        if contracts != 0:
+                            symbol = pos.get("symbol", "")
+                            side = "long" if contracts > 0 else "short"
+                            entry_px = _fnum(pos, "entryPrice")
+                            found[symbol] = {
+                                "side": side,
+                                "amount": abs(contracts),
+                                "entry_price": entry_px,
+                            }
+                            if logger.isEnabledFor(logging.INFO):
+                                logger.info(
+                                    "Found open Bybit position: %s %s %.6f coins @ $%.2f",
+                                    symbol, side, abs(contracts), entry_px,
+                                )
+                    if not found:
+                        logger.info("No open Bybit positions on exchange")
+            except Exception as e:
+                logger.error("Failed to fetch Bybit positions on startup: %s", e)
+            return found
+
+        binance_balance, delta_positions, options_positions, bybit_positions = await asyncio.gather(
+            _load_binance_balance(),
+            _load_delta_positions(),
+            _load_options_positions(),
+            _load_bybit_positions(),
+        )
 
-        for trade in open_trades:
-            pair = trade.get("pair", "")
-            exchange_id = trade.get("exchange", "binance")
-            entry_price = float(trade.get("entry_price", 0) or 0)
-            amount = float(trade.get("amount", 0) or 0)
-            strategy = trade.get("strategy", "")
-            position_type = trade.get("position_type", "spot")
-            leverage = int(trade.get("leverage", 1) or 1)
-            trade_id = trade.get("id")
+        # One timestamp for every close/discovery this pass writes — they
+        # all describe the same restart
+        restore_ts = iso_now()
 
-            # Get the base asset (e.g., "ETH" from "ETH/USDT" or "ETHUSD")
-            base = pair.split("/")[0] if "/" in pair else pair.replace("USD", "").replace("USDT", "")
+        restored = 0
+        closed = 0
+        gone: list[OpenTradeRow] = []
+        # Delta pairs the DB knows about — collected here for the discovery pass below
+        db_delta_pairs: set[str] = set()
+
+        for row in open_trades:
+            trade = OpenTradeRow.from_row(row)
+            pair = trade.pair
+            exchange_id = trade.exchange
+            # Locals below may be overridden by the verified venue position
+            entry_price = db_entry_price = trade.entry_price
+            amount = trade.amount
+            strategy = trade.strategy
+            position_type = trade.position_type
+            leverage = trade.leverage
 
             # Check if position still exists on exchange
             position_exists = False
 
             if exchange_id == "binance":
-                held = float(binance_balance.get(base, 0) or 0)
+                # Base asset (e.g., "ETH" from "ETH/USDT" or "ETHUSD") — only spot needs it
+                base = _base_of(pair)
+                held = binance_balance.get(base, 0.0)
                 # Check if held amount is worth at least $5 (Binance min notional)
                 # Below $5 = unsellable dust, mark as closed
                 if held > 0 and entry_price > 0:
@@ -2116,7 +2472,6 @@ class AlphaBot:
                 bybit_pos = bybit_positions.get(pair)
                 if bybit_pos:
                     position_exists = True
-                    db_entry_price = float(trade.get("entry_price", 0) or 0)
                     exchange_entry_price = bybit_pos["entry_price"]
                     amount = bybit_pos["amount"]
                     position_type = bybit_pos["side"]
@@ -2136,6 +2491,7 @@ class AlphaBot:
                     )
                     position_exists = False
             elif exchange_id == "delta":
+                db_delta_pairs.add(pair)
                 # Options trades: check options_positions (separate exchange)
                 if is_option_symbol(pair):
                     opt_pos = options_positions.get(pair)
@@ -2158,7 +2514,6 @@ class AlphaBot:
                         position_exists = True
                         # Use EXCHANGE for size/side (truth), DB for entry_price (truth)
                         # Exchange entryPrice can be average/current — DB has our real entry
-                        db_entry_price = float(trade.get("entry_price", 0) or 0)
                         exchange_entry_price = delta_pos["entry_price"]
                         amount = delta_pos["contracts"]
                         position_type = delta_pos["side"]
@@ -2182,7 +2537,6 @@ class AlphaBot:
 
             if position_exists:
                 # Register with risk manager using a synthetic Signal
-                from alpha.strategies.base import Signal, StrategyName
                 try:
                     strat_name = StrategyName(strategy)
                 except ValueError:
@@ -2202,109 +2556,85 @@ class AlphaBot:
                     exchange_id=exchange_id,
                 )
                 self.risk_manager.record_open(synthetic_signal)
-                self._restored_trades.append({
-                    "pair": pair,
-                    "exchange_id": exchange_id,
-                    "entry_price": entry_price,
-                    "amount": amount,
-                    "position_type": position_type,
-                    "leverage": leverage,
-                    "strategy": strategy,
-                    "opened_at": trade.get("opened_at"),
-                    "peak_pnl": trade.get("peak_pnl"),
-                })
+                self._restored_trades.append(RestoredTrade(
+                    pair=pair,
+                    exchange_id=exchange_id,
+                    entry_price=entry_price,
+                    amount=amount,
+                    position_type=position_type,
+                    leverage=leverage,
+                    strategy=strategy,
+                    opened_at=trade.opened_at,
+                    peak_pnl=trade.peak_pnl,
+                ))
                 restored += 1
-                logger.info(
-                    "RESTORED %s %s %.0f @ $%.2f (DB) on %s [%s]",
-                    pair, position_type, amount, entry_price, exchange_id, strategy,
-                )
-            else:
-                # Position no longer on exchange — find actual exit price
-                exit_price = 0.0
-                pnl = 0.0
-                pnl_pct = 0.0
-
-                # Try to get real exit price from recent trade history
-                try:
-                    exchange = self.delta if exchange_id == "delta" else self.binance
-                    if exchange:
-                        # fetch_my_trades returns recent fills for this pair
-                        recent_trades = await exchange.fetch_my_trades(pair, limit=20)
-                        if recent_trades:
-                            # Find the most recent closing trade (opposite side)
-                            close_side = "sell" if position_type in ("long", "spot") else "buy"
-                            closing_fills = [
-                                t for t in recent_trades
-                                if t.get("side") == close_side
-                            ]
-                            if closing_fills:
-                                last_fill = closing_fills[-1]  # most recent
-                                exit_price = float(last_fill.get("price", 0) or 0)
-                                logger.info(
-                                    "Found exit fill for %s: $%.2f (from trade history)",
-                                    pair, exit_price,
-                                )
-                        # Fallback: use current ticker price
-                        if exit_price <= 0:
-                            ticker = await exchange.fetch_ticker(pair)
-                            exit_price = float(ticker.get("last", 0) or 0)
-                            logger.info(
-                                "No exit fill found for %s, using current price: $%.2f",
-                                pair, exit_price,
-                            )
-                except Exception as e:
-                    logger.warning(
-                        "Could not fetch exit price for %s: %s — using entry as fallback",
-                        pair, e,
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "RESTORED %s %s %.0f @ $%.2f (DB) on %s [%s]",
+                        pair, position_type, amount, entry_price, exchange_id, strategy,
                     )
-                    exit_price = entry_price  # worst case: 0 P&L
+            else:
+                # Position no longer on exchange — close after the loop, once
+                # every exit price has been looked up concurrently
+                gone.append(trade)
+
+        if gone:
+            exit_prices = await asyncio.gather(*(
+                self._find_restore_exit_price(trade) for trade in gone
+            ))
+            writes: list[tuple[str, Any, Coroutine[Any, Any, Any]]] = []
+            for trade, exit_price in zip(gone, exit_prices):
+                pair = trade.pair
+                exchange_id = trade.exchange
+                trade_id = trade.id
 
                 # Calculate P&L (leveraged, contract-aware)
                 pnl, pnl_pct = calc_pnl(
-                    entry_price, exit_price, amount,
-                    position_type, leverage,
+                    trade.entry_price, exit_price, trade.amount,
+                    trade.position_type, trade.leverage,
                     exchange_id, pair,
                 )
 
-                # Close in DB with real data
-                order_id = trade.get("order_id", "")
+                # Close in DB with real data (writes gathered after the loop)
+                order_id = trade.order_id
                 if order_id:
-                    await self.db.close_trade(
+                    writes.append((pair, order_id, self.db.close_trade(
                         order_id, exit_price, pnl, pnl_pct,
                         reason="position_not_found_on_restart",
                         exit_reason="POSITION_GONE",
-                    )
+                    )))
                 elif trade_id:
-                    await self.db.update_trade(trade_id, {
+                    writes.append((pair, trade_id, self.db.update_trade(trade_id, {
                         "status": "closed",
-                        "closed_at": iso_now(),
+                        "closed_at": restore_ts,
                         "exit_price": exit_price,
                         "pnl": pnl,
                         "pnl_pct": pnl_pct,
                         "reason": "position_not_found_on_restart",
                         "exit_reason": "POSITION_GONE",
-                    })
+                    })))
 
                 closed += 1
                 logger.info(
                     "Position %s no longer on %s — closed (exit=$%.2f, pnl=$%.4f, %.2f%%, trade_id=%s)",
                     pair, exchange_id, exit_price, pnl, pnl_pct, trade_id,
                 )
+            await self._gather_db_writes(writes, "Restore close")
 
         # Also check for Delta positions NOT in DB (opened manually or DB out of sync)
-        if delta_positions:
-            db_delta_pairs = {
-                t.get("pair") for t in open_trades if t.get("exchange") == "delta"
-            }
+        untracked = delta_positions.keys() - db_delta_pairs
+        if untracked:
+            discovered_rows: list[dict[str, Any]] = []
             for symbol, dpos in delta_positions.items():
-                if symbol not in db_delta_pairs:
+                if symbol in untracked:
                     logger.warning(
                         "Delta position %s %s %.0f contracts exists on exchange "
                         "but NOT in DB — creating DB record",
                         symbol, dpos["side"], dpos["contracts"],
                     )
                     # Create a DB trade record so the bot can manage exit
-                    await self.db.log_trade({
+                    # (inserted in one batch after the loop)
+                    discovered_rows.append({
                         "pair": symbol,
                         "exchange": "delta",
                         "strategy": "scalp",
@@ -2314,22 +2644,20 @@ class AlphaBot:
                         "position_type": dpos["side"],
                         "leverage": config.delta.leverage,
                         "status": "open",
-                        "opened_at": iso_now(),
+                        "opened_at": restore_ts,
                         "reason": "discovered_on_restart",
                     })
-                    self._restored_trades.append({
-                        "pair": symbol,
-                        "exchange_id": "delta",
-                        "entry_price": dpos["entry_price"],
-                        "amount": dpos["contracts"],
-                        "position_type": dpos["side"],
-                        "leverage": config.delta.leverage,
-                        "strategy": "scalp",
-                        "opened_at": None,  # just discovered, treat as fresh
-                        "peak_pnl": None,
-                    })
+                    self._restored_trades.append(RestoredTrade(
+                        pair=symbol,
+                        exchange_id="delta",
+                        entry_price=dpos["entry_price"],
+                        amount=dpos["contracts"],
+                        position_type=dpos["side"],
+                        leverage=config.delta.leverage,
+                        strategy="scalp",
+                        opened_at=None,  # just discovered, treat as fresh
+                    ))
                     # Also register with risk manager
-                    from alpha.strategies.base import Signal, StrategyName
                     synthetic_signal = Signal(
                         side="buy" if dpos["side"] == "long" else "sell",
                         price=dpos["entry_price"],
@@ -2344,12 +2672,58 @@ class AlphaBot:
                     )
                     self.risk_manager.record_open(synthetic_signal)
                     restored += 1
+            if discovered_rows:
+                await self.db.log_trades(discovered_rows)
 
         logger.info(
             "Position restore complete: %d restored, %d marked closed (of %d DB open)",
             restored, closed, len(open_trades),
         )
 
+    async def _find_restore_exit_price(self, trade: OpenTradeRow) -> float:
+        """Best-effort exit price for a DB trade whose position vanished while we were down.
+
+        Tries the most recent closing fill from trade history, then the
+        current price, then falls back to entry (0 P&L).
+        """
+        pair = trade.pair
+        exchange_id = trade.exchange
+        entry_price = trade.entry_price
+        position_type = trade.position_type
+        exit_price = 0.0
+        try:
+            exchange = self._exchanges.get(exchange_id)
+            if exchange:
+                # fetch_my_trades returns recent fills for this pair
+                recent_trades = await exchange.fetch_my_trades(pair, limit=20)
+                if recent_trades:
+                    # Find the most recent closing trade (opposite side) —
+                    # fills are oldest-first, so scan from the end
+                    close_side = _CLOSE_SIDE.get(position_type, "buy")
+                    last_fill = next(
+                        (t for t in reversed(recent_trades) if t.get("side") == close_side), None,
+                    )
+                    if last_fill:
+                        exit_price = _fnum(last_fill, "price")
+                        logger.info(
+                            "Found exit fill for %s: $%.2f (from trade history)",
+                            pair, exit_price,
+                        )
+                # Fallback: use current ticker price
+                if exit_price <= 0:
+                    exit_price = await self._get_current_price(pair, exchange_id) or entry_price
+                    logger.info(
+                        "No exit fill found for %s, using current price: $%.2f",
+                        pair, exit_price,
+                    )
+        except Exception as e:
+            logger.warning(
+                "Could not fetch exit price for %s: %s — using entry as fallback",
+                pair, e,
+            )
+            exit_price = entry_price  # worst case: 0 P&L
+        return exit_price
+
     async def _restore_strategy_state(self) -> None:
         """Inject restored positions into strategy instances.
 
@@ -2371,61 +2745,20 @@ class AlphaBot:
             return
 
         injected = 0
+        now_utc = datetime.now(timezone.utc)
+        now_mono = time.monotonic()
         for trade in self._restored_trades:
-            pair = trade["pair"]
-            exchange_id = trade["exchange_id"]
-            entry_price = trade["entry_price"]
-            amount = trade["amount"]
-            position_type = trade["position_type"]  # "long", "short", or "spot"
-            strategy_name = trade.get("strategy", "")
+            pair = trade.pair
+            exchange_id = trade.exchange_id
+            entry_price = trade.entry_price
+            amount = trade.amount
+            position_type = trade.position_type
+            strategy_name = trade.strategy
 
             # Only inject scalp positions (our active strategy)
             scalp = self._get_scalp(pair, exchange=exchange_id)
             if scalp and strategy_name in ("scalp", ""):
-                scalp.in_position = True
-                scalp.position_side = position_type if position_type in ("long", "short") else "long"
-                scalp.entry_price = entry_price
-                scalp.entry_amount = amount
-
-                # ── CRITICAL: use real opened_at time, not monotonic now ──
-                # This ensures timeout (5min) and breakeven (60s) count from
-                # ORIGINAL entry, not from restart. Without this, positions
-                # survive forever across deploys because timers keep resetting.
-                opened_at_str = trade.get("opened_at")
-                if opened_at_str:
-                    try:
-                        from datetime import datetime, timezone
-                        if isinstance(opened_at_str, str):
-                            # Parse ISO timestamp: "2026-02-16T04:58:07.123Z"
-                            opened_at_str = opened_at_str.replace("Z", "+00:00")
-                            opened_dt = datetime.fromisoformat(opened_at_str)
-                        else:
-                            opened_dt = opened_at_str  # already datetime
-                        # Convert to monotonic: how many seconds ago was it opened?
-                        seconds_ago = (datetime.now(timezone.utc) - opened_dt).total_seconds()
-                        seconds_ago = max(0, seconds_ago)  # don't go negative
-                        scalp.entry_time = time.monotonic() - seconds_ago
-                        logger.info(
-                            "Restored %s entry_time: opened %ds ago (timeout/breakeven preserved)",
-                            pair, int(seconds_ago),
-                        )
-                    except Exception as e:
-                        logger.warning(
-                            "Could not parse opened_at '%s' for %s: %s — using now",
-                            opened_at_str, pair, e,
-                        )
-                        scalp.entry_time = time.monotonic()
-                else:
-                    scalp.entry_time = time.monotonic()
-
-                scalp.highest_since_entry = entry_price
-                scalp.lowest_since_entry = entry_price
-
-                # Restore peak P&L if available (for decay exit)
-                peak_pnl = trade.get("peak_pnl")
-                if peak_pnl is not None and peak_pnl > 0:
-                    scalp._peak_unrealized_pnl = float(peak_pnl)
-                    logger.info("Restored %s peak_pnl: %.2f%%", pair, float(peak_pnl))
+                _apply_restore(scalp, trade, now_mono, now_utc)
 
                 # ── IMMEDIATE EXIT CHECK ON RESTORE ──────────────────
                 # Fetch current price and check if we should exit right away.
@@ -2492,6 +2825,254 @@ class AlphaBot:
             injected,
         )
 
+    # ==================================================================
+    # BACKGROUND TASKS
+    # ==================================================================
+
+    def _add_interval(
+        self, job: Callable[[], Awaitable[Any]], seconds: float, jitter: float = 0.0,
+    ) -> None:
+        """Run job every seconds on the timer wheel, first run one interval from now."""
+        now = time.monotonic()
+        self._push_timer(_Timer(job, interval=seconds, jitter=jitter, slot=now), now)
+
+    def _add_daily(
+        self, job: Callable[[], Awaitable[Any]], utc_hours: tuple[int, ...],
+        utc_minute: int, jitter: float = 0.0,
+    ) -> None:
+        """Run job on the timer wheel every day at each of utc_hours:utc_minute UTC."""
+        timer = _Timer(job, utc_hours=utc_hours, utc_minute=utc_minute, jitter=jitter)
+        self._push_timer(timer, time.monotonic())
+
+    def _push_timer(self, timer: _Timer, now: float) -> None:
+        timer.advance(now)
+        heapq.heappush(self._timers, (timer.fire_at(), next(self._timer_seq), timer))
+
+    async def _run_timers(self) -> None:
+        """Timer wheel — one task sleeps until the earliest due job, fires it, repeats.
+
+        Each run gets its own task so a slow job never delays the others. A
+        job still running when its next slot comes up skips that slot instead
+        of overlapping itself; missed slots are never fired back-to-back.
+        """
+        timers = self._timers
+        while timers:
+            fire_at, _, timer = timers[0]
+            delay = fire_at - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+            heapq.heappop(timers)
+            if timer.running is not None and not timer.running.done():
+                logger.debug(
+                    "Periodic job %s still running -- skipping this slot",
+                    getattr(timer.job, "__name__", timer.job),
+                )
+            else:
+                timer.running = asyncio.create_task(self._run_timer_job(timer.job))
+            self._push_timer(timer, time.monotonic())
+
+    @staticmethod
+    async def _run_timer_job(job: Callable[[], Awaitable[Any]]) -> None:
+        try:
+            await job()
+        except Exception:
+            logger.exception("Periodic job %s failed", getattr(job, "__name__", job))
+
+    def _spawn(self, coro: Coroutine[Any, Any, Any]) -> asyncio.Task[Any]:
+        """Schedule a coroutine without awaiting it, keeping a reference until it finishes."""
+        task = asyncio.create_task(coro)
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._bg_tasks.discard)
+        return task
+
+    @staticmethod
+    async def _gather_db_writes(
+        writes: list[tuple[str, Any, Coroutine[Any, Any, Any]]], context: str,
+    ) -> None:
+        """Await independent (pair, order ref, write) DB writes together.
+
+        A failed write is logged with its pair and order ref instead of
+        raising, so it can neither abort the caller nor hide other failures.
+        """
+        if not writes:
+            return
+        results = await asyncio.gather(*(w for _, _, w in writes), return_exceptions=True)
+        for (pair, ref, _), res in zip(writes, results):
+            if isinstance(res, BaseException):
+                logger.error(
+                    "%s: DB write failed for %s (order_id=%s): %s: %s",
+                    context, pair, ref, type(res).__name__, res,
+                )
+
+    async def _safe_orphan_alert(self, **kwargs: Any) -> None:
+        """send_orphan_alert that never raises — for use with _spawn()."""
+        try:
+            await self.alerts.send_orphan_alert(**kwargs)
+        except Exception:
+            logger.debug("Orphan alert failed for %s", kwargs.get("pair"), exc_info=True)
+
+    async def _close_phantoms(
+        self,
+        phantoms: list[ScalpStrategy],
+        exchange_id: str,
+        *,
+        default_leverage: int | float = 1,
+        position_type: str | None = None,
+        reason: str | None = None,
+        exit_reason_map: Mapping[str, str] = _PHANTOM_EXIT_MAP,
+        close_by_id: bool = False,
+    ) -> None:
+        """Close the DB trades behind cleared phantom positions and release them in the risk manager.
+
+        One DB lookup for all phantom pairs, fill histories fetched concurrently,
+        and the resulting close writes flushed together at the end. The
+        keyword arguments carry each venue's own DB conventions (see
+        _finalize_phantom).
+        """
+        exchange = self._exchanges.get(exchange_id)
+        phantom_trades: dict[str, dict[str, Any]] = {}
+        if self.db.is_connected:
+            phantom_trades = await self.db.get_open_trades_by_pairs(
+                [s.pair for s in phantoms], exchange_id, strategy="scalp",
+            )
+        history_pairs = [s.pair for s in phantoms if s.pair in phantom_trades]
+        fill_history: dict[str, Any] = {}
+        if exchange and history_pairs:
+            fill_history = dict(zip(history_pairs, await asyncio.gather(
+                *(
+                    self._reconcile_read(
+                        exchange.fetch_my_trades(pair, limit=20), exchange_id, f"fetch_my_trades {pair}",
+                    )
+                    for pair in history_pairs
+                ),
+                return_exceptions=True,
+            )))
+
+        db_writes: list[tuple[str, Any, Coroutine[Any, Any, Any]]] = []
+        for scalp in phantoms:
+            phantom_pnl = 0.0  # track actual P&L for risk manager
+            open_trade = phantom_trades.get(scalp.pair)
+            if open_trade:
+                closed = await self._finalize_phantom(
+                    scalp.pair, exchange_id, open_trade, fill_history.get(scalp.pair),
+                    default_leverage=default_leverage, position_type=position_type,
+                    reason=reason, exit_reason_map=exit_reason_map, close_by_id=close_by_id,
+                )
+                if closed is None:
+                    continue  # no usable exit price — leave the DB trade open
+                phantom_pnl, db_write = closed
+                if db_write is not None:
+                    db_writes.append((
+                        scalp.pair, open_trade.get("order_id") or open_trade.get("id"), db_write,
+                    ))
+            # Remove from risk manager — use real P&L for accurate daily tracking
+            self.risk_manager.record_close(scalp.pair, phantom_pnl)
+
+        await self._gather_db_writes(db_writes, f"{exchange_id} phantom close")
+
+    async def _finalize_phantom(
+        self,
+        pair: str,
+        exchange_id: str,
+        open_trade: dict[str, Any],
+        recent_trades: list[dict[str, Any]] | BaseException | None,
+        *,
+        default_leverage: int | float = 1,
+        position_type: str | None = None,
+        reason: str | None = None,
+        exit_reason_map: Mapping[str, str] = _PHANTOM_EXIT_MAP,
+        close_by_id: bool = False,
+    ) -> tuple[float, Coroutine[Any, Any, Any] | None] | None:
+        """Price a phantom's DB trade from its last closing fill (else current price).
+
+        Per-venue DB conventions: reason is the stored reason (None = the
+        detected one), exit_reason_map maps the detected reason to
+        exit_reason (unlisted = PHANTOM), and close_by_id lets trades without
+        an order_id be closed by row id. Only Delta fills carry SL/TP tags.
+
+        Returns (pnl, pending DB close) or None when no non-zero exit price exists.
+        """
+        order_id = open_trade.get("order_id", "")
+        entry_px = _fnum(open_trade, "entry_price")
+        trade_lev = open_trade.get("leverage", default_leverage) or 1
+        pos_type = position_type or open_trade.get("position_type", "long")
+        phantom_amount = open_trade.get("amount", 0)
+        phantom_exit = entry_px
+        fill_found = False
+        phantom_reason = "phantom_cleared"
+
+        # Try to find the actual exit from the exchange's trade history
+        try:
+            if isinstance(recent_trades, BaseException):
+                raise recent_trades
+            if recent_trades:
+                close_side = _CLOSE_SIDE.get(pos_type, "buy")
+                last_fill = next(
+                    (t for t in reversed(recent_trades) if t.get("side") == close_side), None,
+                )
+                if last_fill:
+                    fill_price = _fnum(last_fill, "price")
+                    if fill_price > 0:
+                        phantom_exit = fill_price
+                        fill_found = True
+                        # Determine exit reason from fill context (Delta tags SL/TP orders)
+                        fill_info = last_fill.get("info", {})
+                        fill_type = (
+                            str(fill_info.get("meta_data", {}).get("order_type", "")).lower()
+                            if exchange_id == "delta" and isinstance(fill_info, dict) else ""
+                        )
+                        if "stop" in fill_type or "sl" in fill_type:
+                            phantom_reason = "SL_EXCHANGE"
+                        elif "take_profit" in fill_type or "tp" in fill_type:
+                            phantom_reason = "TP_EXCHANGE"
+                        else:
+                            phantom_reason = "CLOSED_BY_EXCHANGE"
+                        logger.info(
+                            "Phantom %s (%s): found exit fill $%.2f (reason=%s)",
+                            pair, exchange_id, fill_price, phantom_reason,
+                        )
+        except Exception as e:
+            logger.debug("Could not fetch trade history for %s/%s: %s", pair, exchange_id, e)
+
+        if not fill_found:
+            phantom_exit = await self._get_current_price(pair, exchange_id) or entry_px
+
+        # ── SAFETY: never close with $0 exit ──
+        if phantom_exit <= 0:
+            logger.error("%s phantom %s: exit=$0, skipping close", exchange_id, pair)
+            return None
+
+        phantom_pnl, phantom_pnl_pct = calc_pnl(
+            entry_px, phantom_exit, phantom_amount,
+            pos_type, trade_lev, exchange_id, pair,
+        )
+        trade_id = open_trade.get("id")
+        phantom_exit_reason = exit_reason_map.get(phantom_reason, "PHANTOM")
+        stored_reason = reason or phantom_reason
+        db_write: Coroutine[Any, Any, Any] | None = None
+        if order_id:
+            db_write = self.db.close_trade(
+                order_id, phantom_exit, phantom_pnl, phantom_pnl_pct,
+                reason=stored_reason,
+                exit_reason=phantom_exit_reason,
+            )
+        elif trade_id and close_by_id:
+            db_write = self.db.update_trade(trade_id, {
+                "status": "closed",
+                "exit_price": phantom_exit,
+                "closed_at": iso_now(),
+                "pnl": phantom_pnl,
+                "pnl_pct": phantom_pnl_pct,
+                "reason": stored_reason,
+                "exit_reason": phantom_exit_reason,
+            })
+        logger.info(
+            "Phantom trade %s (%s) closed: exit=$%.2f pnl=$%.4f (%.2f%%) reason=%s",
+            pair, exchange_id, phantom_exit, phantom_pnl, phantom_pnl_pct, phantom_reason,
+        )
+        return phantom_pnl, db_write
+
     # ==================================================================
     # PRICE HELPERS
     # ==================================================================
@@ -2499,24 +3080,99 @@ class AlphaBot:
     async def _get_current_price(self, pair: str, exchange_id: str) -> float | None:
         """Fetch current price for a pair from the appropriate exchange.
 
-        Returns None on any failure (caller should handle gracefully).
+        Prefers a fresh WebSocket tick from the price feed; falls back to
+        REST fetch_ticker. Returns None on any failure (caller should handle gracefully).
         """
+        # Live WS tick first — the feed already streams every scalp pair
+        if self._price_feed:
+            ws_price = self._price_feed.get_fresh_price(pair, exchange_id)
+            if ws_price:
+                return ws_price
         try:
-            if exchange_id == "bybit":
-                exchange = self.bybit
-            elif exchange_id == "kraken":
-                exchange = self.kraken
-            elif exchange_id == "delta":
-                exchange = self.delta
-            else:
-                exchange = self.binance
+            exchange = self._exchanges.get(exchange_id)
             if exchange:
-                ticker = await exchange.fetch_ticker(pair)
-                return float(ticker.get("last", 0) or 0) or None
+                ticker = await self._get_ticker(exchange, pair)
+                return _fnum(ticker, "last") or None
         except Exception:
             logger.debug("Could not fetch current price for %s/%s", pair, exchange_id)
         return None
 
+    async def _cached_balance(self, exchange: ccxt.Exchange) -> dict[str, Any]:
+        """fetch_balance with a short TTL so back-to-back callers share one REST call.
+
+        Concurrent callers for the same exchange wait on one in-flight fetch.
+        """
+        cached = self._balance_cache.get(exchange.id)
+        if cached and time.monotonic() - cached[0] < self.BALANCE_CACHE_TTL_S:
+            return cached[1]
+        lock = self._balance_locks.get(exchange.id)
+        if lock is None:
+            lock = self._balance_locks[exchange.id] = asyncio.Lock()
+        async with lock:
+            cached = self._balance_cache.get(exchange.id)
+            if cached and time.monotonic() - cached[0] < self.BALANCE_CACHE_TTL_S:
+                return cached[1]
+            balance = await exchange.fetch_balance()
+            self._balance_cache[exchange.id] = (time.monotonic(), balance)
+            return balance
+
+    async def _get_ticker(
+        self, exchange: ccxt.Exchange, pair: str, ttl: float | None = None,
+    ) -> dict[str, Any]:
+        """fetch_ticker with a sub-second TTL so overlapping callers share one REST call."""
+        now = time.monotonic()
+        key = (exchange.id, pair)
+        cached = self._ticker_cache.get(key)
+        if cached and now - cached[0] < (self.TICKER_CACHE_TTL_S if ttl is None else ttl):
+            return cached[1]
+        ticker = await exchange.fetch_ticker(pair)
+        self._ticker_cache[key] = (now, ticker)
+        return ticker
+
+    async def _fetch_tickers(
+        self, exchange: ccxt.Exchange, symbols: list[str], ttl: float | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Tickers for many symbols in one batch call; falls back to concurrent fetch_ticker.
+
+        Shares _ticker_cache with _get_ticker — only symbols without a fresh
+        entry hit the exchange. Symbols whose ticker couldn't be fetched are
+        simply absent from the result.
+        """
+        if not symbols:
+            return {}
+        now = time.monotonic()
+        max_age = self.TICKER_CACHE_TTL_S if ttl is None else ttl
+        ex_id = exchange.id
+        cache = self._ticker_cache
+        tickers: dict[str, dict[str, Any]] = {}
+        missing: list[str] = []
+        for sym in symbols:
+            cached = cache.get((ex_id, sym))
+            if cached and now - cached[0] < max_age:
+                tickers[sym] = cached[1]
+            else:
+                missing.append(sym)
+        if not missing:
+            return tickers
+        try:
+            # Venues without a bulk endpoint go straight to the per-symbol
+            # burst instead of paying for a NotSupported round of ccxt
+            if not exchange.has.get("fetchTickers"):
+                raise ccxt.NotSupported(f"{ex_id} fetchTickers")
+            fetched = await exchange.fetch_tickers(missing)
+            for sym, t in fetched.items():
+                cache[(ex_id, sym)] = (now, t)
+            tickers.update(fetched)
+        except Exception:
+            results = await asyncio.gather(
+                *(self._get_ticker(exchange, sym, ttl) for sym in missing),
+                return_exceptions=True,
+            )
+            for sym, t in zip(missing, results):
+                if not isinstance(t, BaseException):
+                    tickers[sym] = t
+        return tickers
+
     # ==================================================================
     # TELEGRAM HEALTH CHECK — verify connection every 5 minutes
     # ==================================================================
@@ -2524,9 +3180,14 @@ class AlphaBot:
     async def _telegram_health_check(self) -> None:
         """Ping Telegram API every 5 minutes. Reconnect if dead."""
         try:
-            ok = await self.alerts.health_check()
+            ok = await asyncio.wait_for(self.alerts.health_check(), self.TELEGRAM_HEALTH_TIMEOUT_S)
             if not ok:
                 logger.warning("Telegram health check failed — alerts may be down")
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Telegram health check timed out after %ds — alerts may be down",
+                self.TELEGRAM_HEALTH_TIMEOUT_S,
+            )
         except Exception:
             logger.exception("Telegram health check error")
 
@@ -2534,6 +3195,43 @@ class AlphaBot:
     # ORPHAN PROTECTION — reconcile exchange positions every 60s
     # ==================================================================
 
+    async def _run_reconciler(
+        self, venue: str, reconcile: Callable[[], Awaitable[None]],
+    ) -> None:
+        """Run one venue's reconciler.
+
+        Only its exchange reads are time-bounded (see _reconcile_read) — the
+        pass itself is never cancelled, so a close that has started mutating
+        strategy state always reaches its DB write and record_close.
+        Never runs the same venue twice at once: a trigger that arrives while a
+        pass is in flight is coalesced into a single rerun after it finishes.
+        """
+        lock = self._reconcile_locks.get(venue)
+        if lock is None:
+            lock = self._reconcile_locks[venue] = asyncio.Lock()
+        if lock.locked():
+            self._reconcile_pending.add(venue)
+            return
+        async with lock:
+            while True:
+                self._reconcile_pending.discard(venue)
+                try:
+                    await reconcile()
+                except Exception:
+                    logger.exception("Orphan reconciliation failed (%s)", venue)
+                if venue not in self._reconcile_pending:
+                    break
+
+    async def _reconcile_read(self, aw: Awaitable[Any], venue: str, what: str) -> Any:
+        """Await one exchange read for a reconcile pass, bounded by RECONCILE_READ_TIMEOUT_S."""
+        try:
+            return await asyncio.wait_for(aw, self.RECONCILE_READ_TIMEOUT_S)
+        except asyncio.TimeoutError:
+            logger.error(
+                "Reconcile read %s (%s) timed out after %ds", what, venue, self.RECONCILE_READ_TIMEOUT_S,
+            )
+            raise
+
     async def _reconcile_exchange_positions(self) -> None:
         """Fetch ALL exchange positions and reconcile with bot memory.
 
@@ -2543,25 +3241,14 @@ class AlphaBot:
 
         This is the #1 safety net. Runs on startup AND every 60 seconds.
         """
-        try:
-            await self._reconcile_bybit_positions()
-        except Exception:
-            logger.exception("Orphan reconciliation failed (Bybit)")
-
-        try:
-            await self._reconcile_delta_positions()
-        except Exception:
-            logger.exception("Orphan reconciliation failed (Delta)")
-
-        try:
-            await self._reconcile_kraken_positions()
-        except Exception:
-            logger.exception("Orphan reconciliation failed (Kraken)")
-
-        try:
-            await self._reconcile_binance_positions()
-        except Exception:
-            logger.exception("Orphan reconciliation failed (Binance)")
+        # Venues are independent (own exchange, own strategies) — reconcile
+        # them concurrently. _run_reconciler never raises, so one venue
+        # failing or timing out doesn't cancel the others.
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(self._run_reconciler("Bybit", self._reconcile_bybit_positions))
+            tg.create_task(self._run_reconciler("Delta", self._reconcile_delta_positions))
+            tg.create_task(self._run_reconciler("Kraken", self._reconcile_kraken_positions))
+            tg.create_task(self._run_reconciler("Binance", self._reconcile_binance_positions))
 
         # ── GHOST SWEEP ──────────────────────────────────────────────
         # Catch stale entries in open_positions where the strategy has
@@ -2637,21 +3324,13 @@ class AlphaBot:
                     "(no strategy tracking, no exchange position)",
                     trade_id, pair, exchange,
                 )
-                entry_price = float(trade.get("entry_price", 0) or 0)
+                entry_price = _fnum(trade, "entry_price")
                 position_type = trade.get("position_type", "spot")
                 leverage = trade.get("leverage", 1) or 1
-                amount = float(trade.get("amount", 0) or 0)
+                amount = _fnum(trade, "amount")
 
                 # Try to get current price for P&L calculation
-                exit_price = entry_price
-                try:
-                    ex = {"delta": self.delta, "bybit": self.bybit,
-                          "kraken": self.kraken, "binance": self.binance}.get(exchange)
-                    if ex:
-                        ticker = await ex.fetch_ticker(pair)
-                        exit_price = float(ticker.get("last", 0) or 0) or entry_price
-                except Exception:
-                    pass  # use entry_price as fallback (0 P&L)
+                exit_price = await self._get_current_price(pair, exchange) or entry_price
 
                 result = calc_pnl(
                     entry_price, exit_price, amount,
@@ -2662,11 +3341,11 @@ class AlphaBot:
                     "status": "closed",
                     "exit_price": exit_price,
                     "closed_at": iso_now(),
-                    "pnl": round(result.net_pnl, 8),
-                    "pnl_pct": round(result.pnl_pct, 4),
-                    "gross_pnl": round(result.gross_pnl, 8),
-                    "entry_fee": round(result.entry_fee, 8),
-                    "exit_fee": round(result.exit_fee, 8),
+                    "pnl": result.net_pnl,
+                    "pnl_pct": result.pnl_pct,
+                    "gross_pnl": result.gross_pnl,
+                    "entry_fee": result.entry_fee,
+                    "exit_fee": result.exit_fee,
                     "exit_reason": "ORPHAN_SWEEP",
                     "position_state": None,
                 })
@@ -2693,7 +3372,9 @@ class AlphaBot:
 
         # ── Step 1: Fetch ALL open positions from Bybit ──────────────
         try:
-            positions = await self.bybit.fetch_positions()
+            positions = await self._reconcile_read(
+                self.bybit.fetch_positions(), "Bybit", "fetch_positions",
+            )
         except Exception:
             logger.debug("Failed to fetch Bybit positions for reconciliation")
             return
@@ -2701,12 +3382,12 @@ class AlphaBot:
         # Build map: symbol → {side, amount, entry_price}
         exchange_positions: dict[str, dict[str, Any]] = {}
         for pos in positions:
-            contracts = float(pos.get("contracts", 0) or 0)
+            contracts = _fnum(pos, "contracts")
             if contracts == 0:
                 continue
             symbol = pos.get("symbol", "")
             side = "long" if contracts > 0 else "short"
-            entry_px = float(pos.get("entryPrice", 0) or 0)
+            entry_px = _fnum(pos, "entryPrice")
             exchange_positions[symbol] = {
                 "side": side,
                 "amount": abs(contracts),
@@ -2714,7 +3395,8 @@ class AlphaBot:
             }
 
         # ── Step 2: Check ALL exchange positions against bot state ────
-        all_checked_pairs = set(self.bybit_pairs) | set(exchange_positions.keys())
+        all_checked_pairs = self._bybit_pair_set | exchange_positions.keys()
+        now_utc = datetime.now(timezone.utc)
 
         for pair in all_checked_pairs:
             epos = exchange_positions.get(pair)
@@ -2736,7 +3418,7 @@ class AlphaBot:
                         pair=pair, exchange="bybit",
                     )
                     if open_trade and open_trade.get("status") == "open":
-                        db_entry_price = float(open_trade.get("entry_price", 0) or 0)
+                        db_entry_price = _fnum(open_trade, "entry_price")
                         restore_price = db_entry_price if db_entry_price > 0 else entry_px
 
                         scalp.in_position = True
@@ -2749,13 +3431,7 @@ class AlphaBot:
                         opened_at_str = open_trade.get("opened_at")
                         if opened_at_str:
                             try:
-                                from datetime import datetime, timezone
-                                if isinstance(opened_at_str, str):
-                                    opened_at_str = opened_at_str.replace("Z", "+00:00")
-                                    opened_dt = datetime.fromisoformat(opened_at_str)
-                                else:
-                                    opened_dt = opened_at_str
-                                seconds_ago = max(0, (datetime.now(timezone.utc) - opened_dt).total_seconds())
+                                seconds_ago = max(0, (now_utc - parse_iso(opened_at_str)).total_seconds())
                                 scalp.entry_time = time.monotonic() - seconds_ago
                             except Exception:
                                 scalp.entry_time = time.monotonic()
@@ -2787,14 +3463,11 @@ class AlphaBot:
                             pair, side, amount, restore_price,
                             current_price, current_pnl,
                         )
-                        try:
-                            await self.alerts.send_orphan_alert(
-                                pair=pair, side=side, contracts=amount,
-                                action="RESTORED INTO BOT",
-                                detail=f"Entry: ${restore_price:.2f} (DB) — current ${current_price:.2f} — PnL {current_pnl:+.2f}%",
-                            )
-                        except Exception:
-                            pass
+                        self._spawn(self._safe_orphan_alert(
+                            pair=pair, side=side, contracts=amount,
+                            action="RESTORED INTO BOT",
+                            detail=f"Entry: ${restore_price:.2f} (DB) — current ${current_price:.2f} — PnL {current_pnl:+.2f}%",
+                        ))
                         restored = True
 
                 if not restored:
@@ -2817,17 +3490,14 @@ class AlphaBot:
                         "NOT in bot memory! CLOSING",
                         pair, side, amount, entry_px,
                     )
-                    try:
-                        await self.alerts.send_orphan_alert(
-                            pair=pair, side=side, contracts=amount,
-                            action="CLOSING AT MARKET",
-                            detail=f"Entry: ${entry_px:.2f} — not in bot memory or DB",
-                        )
-                    except Exception:
-                        pass
+                    self._spawn(self._safe_orphan_alert(
+                        pair=pair, side=side, contracts=amount,
+                        action="CLOSING AT MARKET",
+                        detail=f"Entry: ${entry_px:.2f} — not in bot memory or DB",
+                    ))
 
                     try:
-                        close_side = "sell" if side == "long" else "buy"
+                        close_side = _CLOSE_SIDE.get(side, "buy")
                         await self.bybit.create_order(
                             pair, "market", close_side, amount,
                             params={"reduceOnly": True},
@@ -2842,11 +3512,7 @@ class AlphaBot:
                                 pair=pair, exchange="bybit",
                             )
                             if open_trade:
-                                try:
-                                    ticker = await self.bybit.fetch_ticker(pair)
-                                    exit_price = float(ticker.get("last", 0) or 0) or entry_px
-                                except Exception:
-                                    exit_price = entry_px
+                                exit_price = await self._get_current_price(pair, "bybit") or entry_px
                                 trade_lev = open_trade.get("leverage", config.bybit.leverage) or 1
                                 pnl, pnl_pct = calc_pnl(
                                     entry_px, exit_price, amount,
@@ -2866,17 +3532,16 @@ class AlphaBot:
                         logger.exception(
                             "Failed to close orphan %s — MANUAL INTERVENTION NEEDED", pair,
                         )
-                        try:
-                            await self.alerts.send_orphan_alert(
-                                pair=pair, side=side, contracts=amount,
-                                action="CLOSE FAILED — MANUAL CLOSE NEEDED",
-                                detail="Auto-close failed. Close manually on Bybit!",
-                            )
-                        except Exception:
-                            pass
+                        self._spawn(self._safe_orphan_alert(
+                            pair=pair, side=side, contracts=amount,
+                            action="CLOSE FAILED — MANUAL CLOSE NEEDED",
+                            detail="Auto-close failed. Close manually on Bybit!",
+                        ))
 
         # ── Step 3: Check for PHANTOM positions (bot has, exchange doesn't) ──
         now = time.monotonic()
+        min_hold, exit_grace = self.PHANTOM_MIN_HOLD_S, self.PHANTOM_EXIT_GRACE_S
+        phantoms: list[ScalpStrategy] = []
         for _key, scalp in self._scalp_strategies.items():
             if not scalp.in_position or not scalp.is_futures:
                 continue
@@ -2884,20 +3549,16 @@ class AlphaBot:
                 continue  # skip non-Bybit strategies
             epos = exchange_positions.get(scalp.pair)
             if not epos:
-                if scalp.entry_time > 0:
-                    hold_seconds = now - scalp.entry_time
-                    if hold_seconds < 300:
-                        logger.debug(
-                            "PHANTOM SKIP: %s — opened %.0fs ago (< 5min)", scalp.pair, hold_seconds,
-                        )
-                        continue
-                if scalp._last_position_exit > 0:
-                    since_exit = now - scalp._last_position_exit
-                    if since_exit < 30:
+                # ── TIME GUARDS: don't phantom-clear legitimate trades ──
+                et = scalp.entry_time
+                le = scalp._last_position_exit
+                if (et > 0 and now - et < min_hold) or (le > 0 and now - le < exit_grace):
+                    if logger.isEnabledFor(logging.DEBUG):
                         logger.debug(
-                            "PHANTOM SKIP: %s — trade closed %.0fs ago (< 30s)", scalp.pair, since_exit,
+                            "PHANTOM SKIP: %s — opened %.0fs / closed %.0fs ago, within guard",
+                            scalp.pair, now - et if et > 0 else -1, now - le if le > 0 else -1,
                         )
-                        continue
+                    continue
 
                 logger.warning(
                     "PHANTOM DETECTED: %s — bot thinks %s @ $%.2f "
@@ -2911,88 +3572,28 @@ class AlphaBot:
                 except Exception as e:
                     logger.debug("Cancel orders for %s on Bybit: %s", scalp.pair, e)
 
-                try:
-                    await self.alerts.send_orphan_alert(
-                        pair=scalp.pair,
-                        side=scalp.position_side or "unknown",
-                        contracts=scalp.entry_amount,
-                        action="PHANTOM CLEARED",
-                        detail=f"Bot thought {scalp.position_side} @ ${scalp.entry_price:.2f} but Bybit has nothing",
-                    )
-                except Exception:
-                    pass
+                self._spawn(self._safe_orphan_alert(
+                    pair=scalp.pair,
+                    side=scalp.position_side or "unknown",
+                    contracts=scalp.entry_amount,
+                    action="PHANTOM CLEARED",
+                    detail=f"Bot thought {scalp.position_side} @ ${scalp.entry_price:.2f} but Bybit has nothing",
+                ))
 
                 scalp.in_position = False
                 scalp.position_side = None
                 scalp.entry_price = 0.0
                 scalp.entry_amount = 0.0
                 scalp._last_position_exit = now
-                scalp._phantom_cooldown_until = now + 60
+                scalp._phantom_cooldown_until = now + self.PHANTOM_COOLDOWN_S
                 ScalpStrategy._live_pnl.pop(scalp.pair, None)
+                phantoms.append(scalp)
 
-                phantom_pnl_for_rm = 0.0
-                if self.db.is_connected:
-                    open_trade = await self.db.get_open_trade(
-                        pair=scalp.pair, exchange="bybit", strategy="scalp",
-                    )
-                    if open_trade:
-                        order_id = open_trade.get("order_id", "")
-                        entry_px = float(open_trade.get("entry_price", 0) or 0)
-                        trade_lev = open_trade.get("leverage", config.bybit.leverage) or 1
-                        pos_type = open_trade.get("position_type", "long")
-                        phantom_amount = open_trade.get("amount", 0)
-                        phantom_exit = entry_px
-                        phantom_reason = "phantom_cleared"
-
-                        try:
-                            recent_trades = await self.bybit.fetch_my_trades(scalp.pair, limit=20)
-                            if recent_trades:
-                                close_side = "sell" if pos_type == "long" else "buy"
-                                closing_fills = [
-                                    t for t in recent_trades if t.get("side") == close_side
-                                ]
-                                if closing_fills:
-                                    last_fill = closing_fills[-1]
-                                    fill_price = float(last_fill.get("price", 0) or 0)
-                                    if fill_price > 0:
-                                        phantom_exit = fill_price
-                                        phantom_reason = "CLOSED_BY_EXCHANGE"
-                        except Exception as e:
-                            logger.debug("Could not fetch trade history for %s: %s", scalp.pair, e)
-
-                        if phantom_exit == entry_px:
-                            try:
-                                ticker = await self.bybit.fetch_ticker(scalp.pair)
-                                phantom_exit = float(ticker.get("last", 0) or 0) or entry_px
-                            except Exception:
-                                pass
-
-                        # ── SAFETY: never close with $0 exit ──
-                        if phantom_exit <= 0:
-                            logger.error("Bybit phantom %s: exit=$0, skipping close", scalp.pair)
-                            continue
-
-                        phantom_pnl, phantom_pnl_pct = calc_pnl(
-                            entry_px, phantom_exit, phantom_amount,
-                            pos_type, trade_lev, "bybit", scalp.pair,
-                        )
-                        phantom_pnl_for_rm = phantom_pnl
-                        _bybit_exit_map = {
-                            "CLOSED_BY_EXCHANGE": "CLOSED_BY_EXCHANGE",
-                        }
-                        phantom_exit_reason = _bybit_exit_map.get(phantom_reason, "PHANTOM")
-                        if order_id:
-                            await self.db.close_trade(
-                                order_id, phantom_exit, phantom_pnl, phantom_pnl_pct,
-                                reason="phantom_cleared",
-                                exit_reason=phantom_exit_reason,
-                            )
-                        logger.info(
-                            "Phantom trade %s closed: exit=$%.2f pnl=$%.4f (%.2f%%)",
-                            scalp.pair, phantom_exit, phantom_pnl, phantom_pnl_pct,
-                        )
-
-                self.risk_manager.record_close(scalp.pair, phantom_pnl_for_rm)
+        if phantoms:
+            await self._close_phantoms(
+                phantoms, "bybit", default_leverage=config.bybit.leverage,
+                reason="phantom_cleared",
+            )
 
     async def _reconcile_kraken_positions(self) -> None:
         """Reconcile Kraken positions with bot memory.
@@ -3009,7 +3610,9 @@ class AlphaBot:
 
         # ── Step 1: Fetch ALL open positions from Kraken ──────────────
         try:
-            positions = await self.kraken.fetch_positions()
+            positions = await self._reconcile_read(
+                self.kraken.fetch_positions(), "Kraken", "fetch_positions",
+            )
         except Exception:
             logger.debug("Failed to fetch Kraken positions for reconciliation")
             return
@@ -3017,12 +3620,12 @@ class AlphaBot:
         # Build map: symbol → {side, amount, entry_price}
         exchange_positions: dict[str, dict[str, Any]] = {}
         for pos in positions:
-            contracts = float(pos.get("contracts", 0) or 0)
+            contracts = _fnum(pos, "contracts")
             if contracts == 0:
                 continue
             symbol = pos.get("symbol", "")
             side = "long" if contracts > 0 else "short"
-            entry_px = float(pos.get("entryPrice", 0) or 0)
+            entry_px = _fnum(pos, "entryPrice")
             exchange_positions[symbol] = {
                 "side": side,
                 "amount": abs(contracts),
@@ -3030,7 +3633,8 @@ class AlphaBot:
             }
 
         # ── Step 2: Check ALL exchange positions against bot state ────
-        all_checked_pairs = set(self.kraken_pairs) | set(exchange_positions.keys())
+        all_checked_pairs = self._kraken_pair_set | exchange_positions.keys()
+        now_utc = datetime.now(timezone.utc)
 
         for pair in all_checked_pairs:
             epos = exchange_positions.get(pair)
@@ -3052,7 +3656,7 @@ class AlphaBot:
                         pair=pair, exchange="kraken",
                     )
                     if open_trade and open_trade.get("status") == "open":
-                        db_entry_price = float(open_trade.get("entry_price", 0) or 0)
+                        db_entry_price = _fnum(open_trade, "entry_price")
                         restore_price = db_entry_price if db_entry_price > 0 else entry_px
 
                         scalp.in_position = True
@@ -3065,13 +3669,7 @@ class AlphaBot:
                         opened_at_str = open_trade.get("opened_at")
                         if opened_at_str:
                             try:
-                                from datetime import datetime, timezone
-                                if isinstance(opened_at_str, str):
-                                    opened_at_str = opened_at_str.replace("Z", "+00:00")
-                                    opened_dt = datetime.fromisoformat(opened_at_str)
-                                else:
-                                    opened_dt = opened_at_str
-                                seconds_ago = max(0, (datetime.now(timezone.utc) - opened_dt).total_seconds())
+                                seconds_ago = max(0, (now_utc - parse_iso(opened_at_str)).total_seconds())
                                 scalp.entry_time = time.monotonic() - seconds_ago
                             except Exception:
                                 scalp.entry_time = time.monotonic()
@@ -3103,14 +3701,11 @@ class AlphaBot:
                             pair, side, amount, restore_price,
                             current_price, current_pnl,
                         )
-                        try:
-                            await self.alerts.send_orphan_alert(
-                                pair=pair, side=side, contracts=amount,
-                                action="RESTORED INTO BOT",
-                                detail=f"Entry: ${restore_price:.2f} (DB) — current ${current_price:.2f} — PnL {current_pnl:+.2f}%",
-                            )
-                        except Exception:
-                            pass
+                        self._spawn(self._safe_orphan_alert(
+                            pair=pair, side=side, contracts=amount,
+                            action="RESTORED INTO BOT",
+                            detail=f"Entry: ${restore_price:.2f} (DB) — current ${current_price:.2f} — PnL {current_pnl:+.2f}%",
+                        ))
                         restored = True
 
                 if not restored:
@@ -3133,17 +3728,14 @@ class AlphaBot:
                         "NOT in bot memory! CLOSING",
                         pair, side, amount, entry_px,
                     )
-                    try:
-                        await self.alerts.send_orphan_alert(
-                            pair=pair, side=side, contracts=amount,
-                            action="CLOSING AT MARKET",
-                            detail=f"Entry: ${entry_px:.2f} — not in bot memory or DB",
-                        )
-                    except Exception:
-                        pass
+                    self._spawn(self._safe_orphan_alert(
+                        pair=pair, side=side, contracts=amount,
+                        action="CLOSING AT MARKET",
+                        detail=f"Entry: ${entry_px:.2f} — not in bot memory or DB",
+                    ))
 
                     try:
-                        close_side = "sell" if side == "long" else "buy"
+                        close_side = _CLOSE_SIDE.get(side, "buy")
                         await self.kraken.create_order(
                             pair, "market", close_side, amount,
                             params={"reduceOnly": True},
@@ -3158,11 +3750,7 @@ class AlphaBot:
                                 pair=pair, exchange="kraken",
                             )
                             if open_trade:
-                                try:
-                                    ticker = await self.kraken.fetch_ticker(pair)
-                                    exit_price = float(ticker.get("last", 0) or 0) or entry_px
-                                except Exception:
-                                    exit_price = entry_px
+                                exit_price = await self._get_current_price(pair, "kraken") or entry_px
                                 trade_lev = open_trade.get("leverage", config.kraken.leverage) or 1
                                 pnl, pnl_pct = calc_pnl(
                                     entry_px, exit_price, amount,
@@ -3182,17 +3770,16 @@ class AlphaBot:
                         logger.exception(
                             "Failed to close orphan %s — MANUAL INTERVENTION NEEDED", pair,
                         )
-                        try:
-                            await self.alerts.send_orphan_alert(
-                                pair=pair, side=side, contracts=amount,
-                                action="CLOSE FAILED — MANUAL CLOSE NEEDED",
-                                detail="Auto-close failed. Close manually on Kraken!",
-                            )
-                        except Exception:
-                            pass
+                        self._spawn(self._safe_orphan_alert(
+                            pair=pair, side=side, contracts=amount,
+                            action="CLOSE FAILED — MANUAL CLOSE NEEDED",
+                            detail="Auto-close failed. Close manually on Kraken!",
+                        ))
 
         # ── Step 3: Check for PHANTOM positions (bot has, exchange doesn't) ──
         now = time.monotonic()
+        min_hold, exit_grace = self.PHANTOM_MIN_HOLD_S, self.PHANTOM_EXIT_GRACE_S
+        phantoms: list[ScalpStrategy] = []
         for _key, scalp in self._scalp_strategies.items():
             if not scalp.in_position or not scalp.is_futures:
                 continue
@@ -3200,20 +3787,16 @@ class AlphaBot:
                 continue  # skip non-Kraken strategies
             epos = exchange_positions.get(scalp.pair)
             if not epos:
-                if scalp.entry_time > 0:
-                    hold_seconds = now - scalp.entry_time
-                    if hold_seconds < 300:
-                        logger.debug(
-                            "PHANTOM SKIP: %s — opened %.0fs ago (< 5min)", scalp.pair, hold_seconds,
-                        )
-                        continue
-                if scalp._last_position_exit > 0:
-                    since_exit = now - scalp._last_position_exit
-                    if since_exit < 30:
+                # ── TIME GUARDS: don't phantom-clear legitimate trades ──
+                et = scalp.entry_time
+                le = scalp._last_position_exit
+                if (et > 0 and now - et < min_hold) or (le > 0 and now - le < exit_grace):
+                    if logger.isEnabledFor(logging.DEBUG):
                         logger.debug(
-                            "PHANTOM SKIP: %s — trade closed %.0fs ago (< 30s)", scalp.pair, since_exit,
+                            "PHANTOM SKIP: %s — opened %.0fs / closed %.0fs ago, within guard",
+                            scalp.pair, now - et if et > 0 else -1, now - le if le > 0 else -1,
                         )
-                        continue
+                    continue
 
                 logger.warning(
                     "PHANTOM DETECTED: %s — bot thinks %s @ $%.2f "
@@ -3227,81 +3810,28 @@ class AlphaBot:
                 except Exception as e:
                     logger.debug("Cancel orders for %s on Kraken: %s", scalp.pair, e)
 
-                try:
-                    await self.alerts.send_orphan_alert(
-                        pair=scalp.pair,
-                        side=scalp.position_side or "unknown",
-                        contracts=scalp.entry_amount,
-                        action="PHANTOM CLEARED",
-                        detail=f"Bot thought {scalp.position_side} @ ${scalp.entry_price:.2f} but Kraken has nothing",
-                    )
-                except Exception:
-                    pass
+                self._spawn(self._safe_orphan_alert(
+                    pair=scalp.pair,
+                    side=scalp.position_side or "unknown",
+                    contracts=scalp.entry_amount,
+                    action="PHANTOM CLEARED",
+                    detail=f"Bot thought {scalp.position_side} @ ${scalp.entry_price:.2f} but Kraken has nothing",
+                ))
 
                 scalp.in_position = False
                 scalp.position_side = None
                 scalp.entry_price = 0.0
                 scalp.entry_amount = 0.0
                 scalp._last_position_exit = now
-                scalp._phantom_cooldown_until = now + 60
+                scalp._phantom_cooldown_until = now + self.PHANTOM_COOLDOWN_S
                 ScalpStrategy._live_pnl.pop(scalp.pair, None)
+                phantoms.append(scalp)
 
-                phantom_pnl_for_rm = 0.0
-                if self.db.is_connected:
-                    open_trade = await self.db.get_open_trade(
-                        pair=scalp.pair, exchange="kraken", strategy="scalp",
-                    )
-                    if open_trade:
-                        order_id = open_trade.get("order_id", "")
-                        entry_px = float(open_trade.get("entry_price", 0) or 0)
-                        trade_lev = open_trade.get("leverage", config.kraken.leverage) or 1
-                        pos_type = open_trade.get("position_type", "long")
-                        phantom_amount = open_trade.get("amount", 0)
-                        phantom_exit = entry_px
-                        try:
-                            recent_trades = await self.kraken.fetch_my_trades(scalp.pair, limit=20)
-                            if recent_trades:
-                                close_side = "sell" if pos_type == "long" else "buy"
-                                closing_fills = [
-                                    t for t in recent_trades if t.get("side") == close_side
-                                ]
-                                if closing_fills:
-                                    last_fill = closing_fills[-1]
-                                    fill_price = float(last_fill.get("price", 0) or 0)
-                                    if fill_price > 0:
-                                        phantom_exit = fill_price
-                        except Exception as e:
-                            logger.debug("Could not fetch trade history for %s: %s", scalp.pair, e)
-
-                        if phantom_exit == entry_px:
-                            try:
-                                ticker = await self.kraken.fetch_ticker(scalp.pair)
-                                phantom_exit = float(ticker.get("last", 0) or 0) or entry_px
-                            except Exception:
-                                pass
-
-                        # ── SAFETY: never close with $0 exit ──
-                        if phantom_exit <= 0:
-                            logger.error("Kraken phantom %s: exit=$0, skipping close", scalp.pair)
-                            continue
-
-                        phantom_pnl, phantom_pnl_pct = calc_pnl(
-                            entry_px, phantom_exit, phantom_amount,
-                            pos_type, trade_lev, "kraken", scalp.pair,
-                        )
-                        phantom_pnl_for_rm = phantom_pnl
-                        if order_id:
-                            await self.db.close_trade(
-                                order_id, phantom_exit, phantom_pnl, phantom_pnl_pct,
-                                reason="phantom_cleared",
-                                exit_reason="PHANTOM",
-                            )
-                        logger.info(
-                            "Phantom trade %s closed: exit=$%.2f pnl=$%.4f (%.2f%%)",
-                            scalp.pair, phantom_exit, phantom_pnl, phantom_pnl_pct,
-                        )
-
-                self.risk_manager.record_close(scalp.pair, phantom_pnl_for_rm)
+        if phantoms:
+            await self._close_phantoms(
+                phantoms, "kraken", default_leverage=config.kraken.leverage,
+                reason="phantom_cleared", exit_reason_map=_PHANTOM_EXIT_PLAIN,
+            )
 
     async def _reconcile_delta_positions(self) -> None:
         """Reconcile Delta Exchange positions with bot memory.
@@ -3320,7 +3850,9 @@ class AlphaBot:
 
         # ── Step 1: Fetch ALL open positions from Delta exchange ────────
         try:
-            positions = await self.delta.fetch_positions()
+            positions = await self._reconcile_read(
+                self.delta.fetch_positions(), "Delta", "fetch_positions",
+            )
         except Exception:
             logger.debug("Failed to fetch Delta positions for reconciliation")
             return
@@ -3328,12 +3860,12 @@ class AlphaBot:
         # Build map: symbol → {side, contracts, entry_price}
         exchange_positions: dict[str, dict[str, Any]] = {}
         for pos in positions:
-            contracts = float(pos.get("contracts", 0) or 0)
+            contracts = _fnum(pos, "contracts")
             if contracts == 0:
                 continue
             symbol = pos.get("symbol", "")
             side = "long" if contracts > 0 else "short"
-            entry_px = float(pos.get("entryPrice", 0) or 0)
+            entry_px = _fnum(pos, "entryPrice")
             exchange_positions[symbol] = {
                 "side": side,
                 "contracts": abs(contracts),
@@ -3361,12 +3893,41 @@ class AlphaBot:
             resolved = _resolve_pair(sym)
             normalized_positions[resolved] = data
 
-        all_checked_pairs = set(self.delta_pairs) | set(normalized_positions.keys())
+        # ── Steady-state fast path ──
+        # Same exchange positions and same bot in_position map as a pass that
+        # acted on nothing and deferred nothing → there is nothing to do.
+        # Passes waiting on a grace period or time guard never count as
+        # settled, so those still get re-checked every cycle.
+        fp = hash((
+            frozenset((sym, p["side"], p["contracts"]) for sym, p in normalized_positions.items()),
+            frozenset((key, s.in_position) for key, s in self._scalp_strategies.items()),
+        ))
+        if fp == self._delta_recon_fp:
+            return
+        settled = True
+
+        all_checked_pairs = self._delta_pair_set | normalized_positions.keys()
+        now_utc = datetime.now(timezone.utc)
+        now = time.monotonic()  # one snapshot for every guard/timer in this pass
+
+        # One DB round-trip for every position the bot isn't managing
+        # (restore candidates), instead of one query per pair
+        untracked: list[str] = []
+        for pair in normalized_positions:
+            if is_option_symbol(pair):
+                continue
+            scalp = self._get_scalp(pair, exchange="delta")
+            if not scalp or not scalp.in_position:
+                untracked.append(pair)
+        db_open: dict[str, dict[str, Any]] = {}
+        if untracked and self.db.is_connected:
+            db_open = await self.db.get_open_trades_by_pairs(untracked, "delta")
 
         for pair in all_checked_pairs:
             # Skip options positions — managed by OptionsScalpStrategy
             if is_option_symbol(pair):
-                logger.debug("Skipping options position in orphan check: %s", pair)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Skipping options position in orphan check: %s", pair)
                 continue
 
             epos = normalized_positions.get(pair)
@@ -3379,6 +3940,7 @@ class AlphaBot:
 
             if epos and (not scalp or not scalp.in_position):
                 # Exchange has position, bot doesn't track it
+                settled = False
                 side = epos["side"]
                 contracts = epos["contracts"]
                 entry_px = epos["entry_price"]
@@ -3389,13 +3951,11 @@ class AlphaBot:
                 # state wasn't properly injected.
                 restored = False
                 if scalp and self.db.is_connected:
-                    open_trade = await self.db.get_open_trade(
-                        pair=pair, exchange="delta",
-                    )
+                    open_trade = db_open.get(pair)
                     if open_trade and open_trade.get("status") == "open":
                         # DB knows about this position — restore into strategy
                         # Use DB entry_price (truth), exchange for size/side only
-                        db_entry_price = float(open_trade.get("entry_price", 0) or 0)
+                        db_entry_price = _fnum(open_trade, "entry_price")
                         restore_price = db_entry_price if db_entry_price > 0 else entry_px
 
                         scalp.in_position = True
@@ -3409,18 +3969,12 @@ class AlphaBot:
                         opened_at_str = open_trade.get("opened_at")
                         if opened_at_str:
                             try:
-                                from datetime import datetime, timezone
-                                if isinstance(opened_at_str, str):
-                                    opened_at_str = opened_at_str.replace("Z", "+00:00")
-                                    opened_dt = datetime.fromisoformat(opened_at_str)
-                                else:
-                                    opened_dt = opened_at_str
-                                seconds_ago = max(0, (datetime.now(timezone.utc) - opened_dt).total_seconds())
-                                scalp.entry_time = time.monotonic() - seconds_ago
+                                seconds_ago = max(0, (now_utc - parse_iso(opened_at_str)).total_seconds())
+                                scalp.entry_time = now - seconds_ago
                             except Exception:
-                                scalp.entry_time = time.monotonic()
+                                scalp.entry_time = now
                         else:
-                            scalp.entry_time = time.monotonic()
+                            scalp.entry_time = now
 
                         # Fetch actual current market price for immediate checks
                         current_price = await self._get_current_price(pair, "delta")
@@ -3451,20 +4005,18 @@ class AlphaBot:
                             pair, side, contracts, restore_price,
                             current_price, current_pnl,
                         )
-                        try:
-                            await self.alerts.send_orphan_alert(
-                                pair=pair, side=side, contracts=contracts,
-                                action="RESTORED INTO BOT",
-                                detail=f"Entry: ${restore_price:.2f} (DB) — current ${current_price:.2f} — PnL {current_pnl:+.2f}%",
-                            )
-                        except Exception:
-                            pass
+                        self._spawn(self._safe_orphan_alert(
+                            pair=pair, side=side, contracts=contracts,
+                            action="RESTORED INTO BOT",
+                            detail=f"Entry: ${restore_price:.2f} (DB) — current ${current_price:.2f} — PnL {current_pnl:+.2f}%",
+                        ))
                         restored = True
 
                 if not restored:
                     # ── SAFETY: check DB one more time for ANY open trade ────
                     # Prevents orphan-closing positions that were JUST opened
-                    # (race between strategy open and reconciliation cycle)
+                    # (race between strategy open and reconciliation cycle).
+                    # Deliberately a fresh query, not the db_open snapshot.
                     any_open = None
                     if self.db.is_connected:
                         any_open = await self.db.get_open_trade(pair=pair, exchange="delta")
@@ -3475,12 +4027,12 @@ class AlphaBot:
                         )
                         # Try to restore into strategy if scalp exists
                         if scalp:
-                            db_price = float(any_open.get("entry_price", 0) or 0) or entry_px
+                            db_price = _fnum(any_open, "entry_price") or entry_px
                             scalp.in_position = True
                             scalp.position_side = side
                             scalp.entry_price = db_price
                             scalp.entry_amount = contracts
-                            scalp.entry_time = time.monotonic()
+                            scalp.entry_time = now
                             logger.warning(
                                 "ORPHAN→RESTORE: %s %s %.0f ct @ $%.2f — forced restore from DB",
                                 pair, side, contracts, db_price,
@@ -3490,8 +4042,8 @@ class AlphaBot:
                     # ── Grace period: don't close newly-detected positions ──
                     fs_key = f"delta:{pair}"
                     if fs_key not in self._position_first_seen:
-                        self._position_first_seen[fs_key] = time.monotonic()
-                    age = time.monotonic() - self._position_first_seen[fs_key]
+                        self._position_first_seen[fs_key] = now
+                    age = now - self._position_first_seen[fs_key]
                     if age < self.ORPHAN_GRACE_S:
                         logger.info(
                             "ORPHAN_GRACE: skipping %s (age %.0fs < %ds)",
@@ -3506,17 +4058,14 @@ class AlphaBot:
                         "NOT in bot memory, no DB trade! CLOSING",
                         pair, side, contracts, entry_px,
                     )
-                    try:
-                        await self.alerts.send_orphan_alert(
-                            pair=pair, side=side, contracts=contracts,
-                            action="CLOSING AT MARKET",
-                            detail=f"Entry: ${entry_px:.2f} — not in bot memory or DB",
-                        )
-                    except Exception:
-                        pass
+                    self._spawn(self._safe_orphan_alert(
+                        pair=pair, side=side, contracts=contracts,
+                        action="CLOSING AT MARKET",
+                        detail=f"Entry: ${entry_px:.2f} — not in bot memory or DB",
+                    ))
 
                     try:
-                        close_side = "sell" if side == "long" else "buy"
+                        close_side = _CLOSE_SIDE.get(side, "buy")
                         await self.delta.create_order(
                             pair, "market", close_side, int(contracts),
                             params={"reduce_only": True},
@@ -3528,15 +4077,9 @@ class AlphaBot:
 
                         # Also mark any stale DB trade as closed
                         if self.db.is_connected:
-                            open_trade = await self.db.get_open_trade(
-                                pair=pair, exchange="delta",
-                            )
+                            open_trade = db_open.get(pair)
                             if open_trade:
-                                try:
-                                    ticker = await self.delta.fetch_ticker(pair)
-                                    exit_price = float(ticker.get("last", 0) or 0) or entry_px
-                                except Exception:
-                                    exit_price = entry_px
+                                exit_price = await self._get_current_price(pair, "delta") or entry_px
                                 trade_lev = open_trade.get("leverage", config.delta.leverage) or 1
                                 pnl, pnl_pct = calc_pnl(
                                     entry_px, exit_price, contracts,
@@ -3556,17 +4099,15 @@ class AlphaBot:
                         logger.exception(
                             "Failed to close orphan %s — MANUAL INTERVENTION NEEDED", pair,
                         )
-                        try:
-                            await self.alerts.send_orphan_alert(
-                                pair=pair, side=side, contracts=contracts,
-                                action="CLOSE FAILED — MANUAL CLOSE NEEDED",
-                                detail="Auto-close failed. Close manually on Delta Exchange!",
-                            )
-                        except Exception:
-                            pass
+                        self._spawn(self._safe_orphan_alert(
+                            pair=pair, side=side, contracts=contracts,
+                            action="CLOSE FAILED — MANUAL CLOSE NEEDED",
+                            detail="Auto-close failed. Close manually on Delta Exchange!",
+                        ))
 
         # ── Step 3: Check for PHANTOM positions (bot has, exchange doesn't) ──
-        now = time.monotonic()
+        min_hold, exit_grace = self.PHANTOM_MIN_HOLD_S, self.PHANTOM_EXIT_GRACE_S
+        phantoms: list[ScalpStrategy] = []
         for _key, scalp in self._scalp_strategies.items():
             if not scalp.in_position or not scalp.is_futures:
                 continue
@@ -3574,26 +4115,17 @@ class AlphaBot:
                 continue  # skip non-Delta strategies
             epos = normalized_positions.get(scalp.pair)
             if not epos:
+                settled = False
                 # ── TIME GUARDS: don't phantom-clear legitimate trades ──
-                # Guard 1: position opened < 5 min ago — give it time to settle
-                if scalp.entry_time > 0:
-                    hold_seconds = now - scalp.entry_time
-                    if hold_seconds < 300:
-                        logger.debug(
-                            "PHANTOM SKIP: %s — opened %.0fs ago (< 5min), not clearing",
-                            scalp.pair, hold_seconds,
-                        )
-                        continue
-
-                # Guard 2: strategy just closed a trade < 30s ago — normal exit, not phantom
-                if scalp._last_position_exit > 0:
-                    since_exit = now - scalp._last_position_exit
-                    if since_exit < 30:
+                et = scalp.entry_time
+                le = scalp._last_position_exit
+                if (et > 0 and now - et < min_hold) or (le > 0 and now - le < exit_grace):
+                    if logger.isEnabledFor(logging.DEBUG):
                         logger.debug(
-                            "PHANTOM SKIP: %s — trade closed %.0fs ago (< 30s), not phantom",
-                            scalp.pair, since_exit,
+                            "PHANTOM SKIP: %s — opened %.0fs / closed %.0fs ago, within guard",
+                            scalp.pair, now - et if et > 0 else -1, now - le if le > 0 else -1,
                         )
-                        continue
+                    continue
 
                 logger.warning(
                     "PHANTOM DETECTED: %s — bot thinks %s @ $%.2f "
@@ -3607,16 +4139,13 @@ class AlphaBot:
                 except Exception as e:
                     logger.debug("Cancel orders for %s on Delta: %s", scalp.pair, e)
 
-                try:
-                    await self.alerts.send_orphan_alert(
-                        pair=scalp.pair,
-                        side=scalp.position_side or "unknown",
-                        contracts=scalp.entry_amount,
-                        action="PHANTOM CLEARED",
-                        detail=f"Bot thought {scalp.position_side} @ ${scalp.entry_price:.2f} but exchange has nothing",
-                    )
-                except Exception:
-                    pass
+                self._spawn(self._safe_orphan_alert(
+                    pair=scalp.pair,
+                    side=scalp.position_side or "unknown",
+                    contracts=scalp.entry_amount,
+                    action="PHANTOM CLEARED",
+                    detail=f"Bot thought {scalp.position_side} @ ${scalp.entry_price:.2f} but exchange has nothing",
+                ))
 
                 # Clear bot state
                 scalp.in_position = False
@@ -3625,99 +4154,17 @@ class AlphaBot:
                 scalp.entry_amount = 0.0
                 scalp._last_position_exit = now
                 # Set phantom cooldown — no new entries on this pair for 60s
-                scalp._phantom_cooldown_until = now + 60
+                scalp._phantom_cooldown_until = now + self.PHANTOM_COOLDOWN_S
                 ScalpStrategy._live_pnl.pop(scalp.pair, None)
+                phantoms.append(scalp)
 
-                phantom_pnl_for_rm = 0.0  # track actual P&L for risk manager
-
-                # Mark closed in DB — use trade history to find real exit price & reason
-                if self.db.is_connected:
-                    open_trade = await self.db.get_open_trade(
-                        pair=scalp.pair, exchange="delta", strategy="scalp",
-                    )
-                    if open_trade:
-                        order_id = open_trade.get("order_id", "")
-                        entry_px = float(open_trade.get("entry_price", 0) or 0)
-                        trade_lev = open_trade.get("leverage", config.delta.leverage) or 1
-                        pos_type = open_trade.get("position_type", "long")
-                        phantom_amount = open_trade.get("amount", 0)
-                        phantom_exit = entry_px
-                        phantom_reason = "phantom_cleared"
-
-                        # Try to find actual exit from Delta trade history
-                        try:
-                            recent_trades = await self.delta.fetch_my_trades(scalp.pair, limit=20)
-                            if recent_trades:
-                                close_side = "sell" if pos_type == "long" else "buy"
-                                closing_fills = [
-                                    t for t in recent_trades
-                                    if t.get("side") == close_side
-                                ]
-                                if closing_fills:
-                                    last_fill = closing_fills[-1]
-                                    fill_price = float(last_fill.get("price", 0) or 0)
-                                    if fill_price > 0:
-                                        phantom_exit = fill_price
-                                        # Determine exit reason from fill context
-                                        fill_info = last_fill.get("info", {})
-                                        fill_type = str(fill_info.get("meta_data", {}).get("order_type", "")).lower() if isinstance(fill_info, dict) else ""
-                                        if "stop" in fill_type or "sl" in fill_type:
-                                            phantom_reason = "SL_EXCHANGE"
-                                        elif "take_profit" in fill_type or "tp" in fill_type:
-                                            phantom_reason = "TP_EXCHANGE"
-                                        else:
-                                            phantom_reason = "CLOSED_BY_EXCHANGE"
-                                        logger.info(
-                                            "Phantom %s: found exit fill $%.2f (reason=%s)",
-                                            scalp.pair, fill_price, phantom_reason,
-                                        )
-                        except Exception as e:
-                            logger.debug("Could not fetch trade history for %s: %s", scalp.pair, e)
-
-                        if phantom_exit == entry_px:
-                            try:
-                                ticker = await self.delta.fetch_ticker(scalp.pair)
-                                phantom_exit = float(ticker.get("last", 0) or 0) or entry_px
-                            except Exception:
-                                pass
-
-                        # ── SAFETY: never close with $0 exit ──
-                        if phantom_exit <= 0:
-                            logger.error("Delta phantom %s: exit=$0, skipping close", scalp.pair)
-                            continue
-
-                        phantom_pnl, phantom_pnl_pct = calc_pnl(
-                            entry_px, phantom_exit, phantom_amount,
-                            pos_type, trade_lev, "delta", scalp.pair,
-                        )
-                        phantom_pnl_for_rm = phantom_pnl
-                        trade_id = open_trade.get("id")
-                        _phantom_exit_map = {"SL_EXCHANGE": "SL_EXCHANGE",
-                                             "TP_EXCHANGE": "TP_EXCHANGE", "CLOSED_BY_EXCHANGE": "CLOSED_BY_EXCHANGE"}
-                        phantom_exit_reason = _phantom_exit_map.get(phantom_reason, "PHANTOM")
-                        if order_id:
-                            await self.db.close_trade(
-                                order_id, phantom_exit, phantom_pnl, phantom_pnl_pct,
-                                reason=phantom_reason,
-                                exit_reason=phantom_exit_reason,
-                            )
-                        elif trade_id:
-                            await self.db.update_trade(trade_id, {
-                                "status": "closed",
-                                "exit_price": phantom_exit,
-                                "closed_at": iso_now(),
-                                "pnl": round(phantom_pnl, 8),
-                                "pnl_pct": round(phantom_pnl_pct, 4),
-                                "reason": phantom_reason,
-                                "exit_reason": phantom_exit_reason,
-                            })
-                        logger.info(
-                            "Phantom trade %s closed: exit=$%.2f pnl=$%.4f (%.2f%%) reason=%s",
-                            scalp.pair, phantom_exit, phantom_pnl, phantom_pnl_pct, phantom_reason,
-                        )
+        self._delta_recon_fp = fp if settled else None
+        if not phantoms:
+            return
 
-                # Remove from risk manager — use real P&L for accurate daily tracking
-                self.risk_manager.record_close(scalp.pair, phantom_pnl_for_rm)
+        await self._close_phantoms(
+            phantoms, "delta", default_leverage=config.delta.leverage, close_by_id=True,
+        )
 
     async def _reconcile_binance_positions(self) -> None:
         """Reconcile Binance spot positions with bot memory.
@@ -3728,11 +4175,15 @@ class AlphaBot:
             return
 
         try:
-            balance = await self.binance.fetch_balance()
+            balance = await self._reconcile_read(
+                self._cached_balance(self.binance), "Binance", "fetch_balance",
+            )
             free_balances = balance.get("free", {})
         except Exception:
             return
 
+        bnow = time.monotonic()
+        phantoms: list[ScalpStrategy] = []
         for _key, scalp in self._scalp_strategies.items():
             if scalp.is_futures:
                 continue  # skip Delta pairs
@@ -3740,116 +4191,42 @@ class AlphaBot:
                 continue  # bot doesn't think it has a position, skip
 
             # Check if we actually hold this asset
-            base = scalp.pair.split("/")[0] if "/" in scalp.pair else scalp.pair
-            held = float(free_balances.get(base, 0) or 0)
+            base = _base_of(scalp.pair)
+            held = _fnum(free_balances, base)
             held_value = held * scalp.entry_price if scalp.entry_price > 0 else 0
 
             if held_value < 3.0:
                 # ── TIME GUARDS ──
-                bnow = time.monotonic()
-                if scalp.entry_time > 0 and (bnow - scalp.entry_time) < 300:
-                    continue  # opened < 5 min ago
-                if scalp._last_position_exit > 0 and (bnow - scalp._last_position_exit) < 30:
-                    continue  # just closed < 30s ago
+                et = scalp.entry_time
+                le = scalp._last_position_exit
+                if (et > 0 and bnow - et < self.PHANTOM_MIN_HOLD_S) or (
+                    le > 0 and bnow - le < self.PHANTOM_EXIT_GRACE_S
+                ):
+                    continue  # opened < 5 min ago, or just closed < 30s ago
 
                 # PHANTOM — bot thinks position exists but nothing on exchange
                 logger.warning(
                     "PHANTOM (Binance): %s — bot thinks long @ $%.2f but only $%.2f held. Clearing.",
                     scalp.pair, scalp.entry_price, held_value,
                 )
-                try:
-                    await self.alerts.send_orphan_alert(
-                        pair=scalp.pair, side="long", contracts=scalp.entry_amount,
-                        action="PHANTOM CLEARED (insufficient balance)",
-                        detail=f"Only ${held_value:.2f} held — position was closed externally",
-                    )
-                except Exception:
-                    pass
+                self._spawn(self._safe_orphan_alert(
+                    pair=scalp.pair, side="long", contracts=scalp.entry_amount,
+                    action="PHANTOM CLEARED (insufficient balance)",
+                    detail=f"Only ${held_value:.2f} held — position was closed externally",
+                ))
 
                 scalp.in_position = False
                 scalp.position_side = None
                 scalp.entry_price = 0.0
                 scalp.entry_amount = 0.0
                 scalp._last_position_exit = bnow
-                scalp._phantom_cooldown_until = bnow + 60
-
-                phantom_pnl_for_rm_bn = 0.0  # track actual P&L for risk manager
+                scalp._phantom_cooldown_until = bnow + self.PHANTOM_COOLDOWN_S
+                phantoms.append(scalp)
 
-                if self.db.is_connected:
-                    open_trade = await self.db.get_open_trade(
-                        pair=scalp.pair, exchange="binance", strategy="scalp",
-                    )
-                    if open_trade:
-                        order_id = open_trade.get("order_id", "")
-                        entry_px = float(open_trade.get("entry_price", 0) or 0)
-                        phantom_amount = open_trade.get("amount", 0)
-                        phantom_exit = entry_px
-                        phantom_reason = "phantom_cleared"
-
-                        # Try to find actual exit from Binance trade history
-                        try:
-                            recent_trades = await self.binance.fetch_my_trades(scalp.pair, limit=20)
-                            if recent_trades:
-                                closing_fills = [
-                                    t for t in recent_trades if t.get("side") == "sell"
-                                ]
-                                if closing_fills:
-                                    last_fill = closing_fills[-1]
-                                    fill_price = float(last_fill.get("price", 0) or 0)
-                                    if fill_price > 0:
-                                        phantom_exit = fill_price
-                                        phantom_reason = "CLOSED_BY_EXCHANGE"
-                                        logger.info(
-                                            "Phantom Binance %s: found sell fill $%.2f",
-                                            scalp.pair, fill_price,
-                                        )
-                        except Exception as e:
-                            logger.debug("Could not fetch Binance trade history for %s: %s", scalp.pair, e)
-
-                        # Fallback: current ticker if no fill found
-                        if phantom_exit == entry_px:
-                            try:
-                                ticker = await self.binance.fetch_ticker(scalp.pair)
-                                phantom_exit = float(ticker.get("last", 0) or 0) or entry_px
-                            except Exception:
-                                pass
-
-                        # ── SAFETY: never close with $0 exit ──
-                        if phantom_exit <= 0:
-                            logger.error("Binance phantom %s: exit=$0, skipping close", scalp.pair)
-                            continue
+        if not phantoms:
+            return
 
-                        phantom_pnl, phantom_pnl_pct = calc_pnl(
-                            entry_px, phantom_exit, phantom_amount,
-                            "spot", 1, "binance", scalp.pair,
-                        )
-                        phantom_pnl_for_rm_bn = phantom_pnl
-                        trade_id = open_trade.get("id")
-                        _phantom_exit_map_bn = {"phantom_cleared": "PHANTOM", "SL_EXCHANGE": "SL_EXCHANGE",
-                                                "TP_EXCHANGE": "TP_EXCHANGE", "CLOSED_BY_EXCHANGE": "CLOSED_BY_EXCHANGE"}
-                        phantom_exit_reason = _phantom_exit_map_bn.get(phantom_reason, "PHANTOM")
-                        if order_id:
-                            await self.db.close_trade(
-                                order_id, phantom_exit, phantom_pnl, phantom_pnl_pct,
-                                reason=phantom_reason,
-                                exit_reason=phantom_exit_reason,
-                            )
-                        elif trade_id:
-                            await self.db.update_trade(trade_id, {
-                                "status": "closed",
-                                "exit_price": phantom_exit,
-                                "closed_at": iso_now(),
-                                "pnl": round(phantom_pnl, 8),
-                                "pnl_pct": round(phantom_pnl_pct, 4),
-                                "reason": phantom_reason,
-                                "exit_reason": phantom_exit_reason,
-                            })
-                        logger.info(
-                            "Phantom Binance %s closed: exit=$%.2f pnl=$%.4f reason=%s",
-                            scalp.pair, phantom_exit, phantom_pnl, phantom_reason,
-                        )
-                # Remove from risk manager — use real P&L for accurate daily tracking
-                self.risk_manager.record_close(scalp.pair, phantom_pnl_for_rm_bn)
+        await self._close_phantoms(phantoms, "binance", position_type="spot", close_by_id=True)
 
     async def _close_orphaned_positions(self) -> None:
         """Close any open positions from non-scalp strategies (e.g. futures_momentum).
@@ -3860,17 +4237,8 @@ class AlphaBot:
         if not self.db.is_connected:
             return
 
-        open_trades = await self.db.get_all_open_trades()
-        if not open_trades:
-            return
-
         # Only close non-scalp, non-options_scalp positions
-        allowed_strategies = {"scalp", "options_scalp", ""}
-        orphans = [
-            t for t in open_trades
-            if t.get("strategy", "") not in allowed_strategies
-        ]
-
+        orphans = await self.db.get_orphan_open_trades({"scalp", "options_scalp", ""})
         if not orphans:
             return
 
@@ -3879,123 +4247,182 @@ class AlphaBot:
             len(orphans),
         )
 
-        for trade in orphans:
-            pair = trade["pair"]
-            exchange_id = trade.get("exchange", "delta")
-            position_type = trade.get("position_type", "long")
-            amount = trade.get("amount", 0)
-            entry_price = trade.get("entry_price", 0)
-            order_id = trade.get("order_id", "")
-            strategy_name = trade.get("strategy", "unknown")
+        # One ticker per (exchange, pair), fetched concurrently so every close
+        # is priced at the same moment
+        ticker_keys = list(dict.fromkeys(
+            (t.get("exchange", "delta"), t["pair"]) for t in orphans
+            if self._orphan_exchange(t.get("exchange", "delta"))
+        ))
+        tickers = dict(zip(ticker_keys, await asyncio.gather(
+            *(self._get_ticker(self._orphan_exchange(ex), pair) for ex, pair in ticker_keys),
+            return_exceptions=True,
+        )))
+
+        await asyncio.gather(
+            *(self._close_one_orphan(t, tickers) for t in orphans),
+            return_exceptions=True,
+        )
 
-            logger.info(
-                "Closing orphaned %s position: %s %s %.6f @ $%.2f (strategy=%s)",
-                strategy_name, pair, position_type, amount, entry_price, strategy_name,
-            )
+    def _orphan_exchange(self, exchange_id: str) -> ccxt.Exchange | None:
+        """Client an orphaned trade is closed on — the venue it was opened on."""
+        return self._exchanges.get(exchange_id)
+
+    async def _close_one_orphan(
+        self, trade: dict[str, Any], tickers: dict[tuple[str, str], Any],
+    ) -> None:
+        """Market-close a single orphaned position and mark its DB trade closed."""
+        pair = trade["pair"]
+        exchange_id = trade.get("exchange", "delta")
+        position_type = trade.get("position_type", "long")
+        amount = trade.get("amount", 0)
+        entry_price = trade.get("entry_price", 0)
+        order_id = trade.get("order_id", "")
+        strategy_name = trade.get("strategy", "unknown")
+        trade_lev = trade.get("leverage", 1) or 1
 
-            try:
-                # Determine close side
-                close_side = "sell" if position_type == "long" else "buy"
+        logger.info(
+            "Closing orphaned %s position: %s %s %.6f @ $%.2f (strategy=%s)",
+            strategy_name, pair, position_type, amount, entry_price, strategy_name,
+        )
 
-                # Get current price for P&L calc
-                exchange = self.delta if exchange_id == "delta" else self.binance
-                if exchange:
-                    ticker = await exchange.fetch_ticker(pair)
-                    current_price = float(ticker.get("last", 0) or 0)
-                else:
-                    current_price = entry_price
+        try:
+            # Determine close side
+            close_side = _CLOSE_SIDE.get(position_type, "buy")
+
+            # Current price for P&L calc (prefetched for all orphans)
+            exchange = self._orphan_exchange(exchange_id)
+            if exchange:
+                ticker = tickers.get((exchange_id, pair))
+                if isinstance(ticker, BaseException):
+                    raise ticker
+                if ticker is None:
+                    ticker = await self._get_ticker(exchange, pair)
+                current_price = _fnum(ticker, "last")
+            else:
+                current_price = entry_price
 
-                # For Delta: convert to contracts
-                if exchange_id == "delta":
-                    contract_size = DELTA_CONTRACT_SIZE.get(pair, 0.01)
-                    contracts = max(1, int(amount / contract_size))
+            # For Delta: convert to contracts
+            if exchange_id == "delta":
+                contract_size = DELTA_CONTRACT_SIZE.get(pair, 0.01)
+                contracts = max(1, int(amount / contract_size))
 
+                await exchange.create_order(  # type: ignore[union-attr]
+                    pair, "market", close_side, contracts,
+                    params={"reduce_only": True},
+                )
+                logger.info(
+                    "Closed orphaned position: %s %s %d contracts at market",
+                    pair, close_side, contracts,
+                )
+            else:
+                # Binance spot — sell the amount; Bybit/Kraken futures — reduce-only close
+                if exchange:
                     await exchange.create_order(  # type: ignore[union-attr]
-                        pair, "market", close_side, contracts,
-                        params={"reduce_only": True},
+                        pair, "market", close_side, amount,
+                        params={} if exchange_id == "binance" else {"reduceOnly": True},
                     )
-                    logger.info(
-                        "Closed orphaned position: %s %s %d contracts at market",
-                        pair, close_side, contracts,
-                    )
-                else:
-                    # Binance spot — sell the amount
-                    if exchange:
-                        await exchange.create_order(  # type: ignore[union-attr]
-                            pair, "market", close_side, amount,
-                        )
 
-                # Calculate P&L (leveraged, contract-aware)
-                trade_lev = trade.get("leverage", 1) or 1
-                pnl, pnl_pct = calc_pnl(
-                    entry_price, current_price, amount,
-                    position_type, trade_lev,
-                    exchange_id, pair,
+            # Calculate P&L (leveraged, contract-aware)
+            pnl, pnl_pct = calc_pnl(
+                entry_price, current_price, amount,
+                position_type, trade_lev,
+                exchange_id, pair,
+            )
+
+            # Close in DB
+            if order_id:
+                await self.db.close_trade(
+                    order_id, current_price, pnl, pnl_pct,
+                    reason="orphan_strategy_removed",
+                    exit_reason="ORPHAN",
                 )
 
-                # Close in DB
+            # Remove from risk manager — prevents ghost entries
+            self.risk_manager.record_close(pair, pnl)
+
+            # Send alert
+            await self.alerts.send_text(
+                f"🧹 Closed orphaned {strategy_name} position\n"
+                f"{pair} {position_type.upper()} @ ${entry_price:.2f}\n"
+                f"Exit: ${current_price:.2f} | P&L: ${pnl:+.4f} ({pnl_pct:+.2f}%)\n"
+                f"Reason: Strategy removed — freeing margin"
+            )
+
+        except Exception:
+            logger.exception("Failed to close orphaned position %s", pair)
+            # Try to at least mark it in DB — use current price if possible
+            fallback_pnl = 0.0
+            try:
                 if order_id:
+                    # Try to get current price for accurate P&L
+                    fallback_exit = entry_price
+                    try:
+                        exchange = self._orphan_exchange(exchange_id)
+                        if exchange:
+                            ticker = await self._get_ticker(exchange, pair)
+                            fallback_exit = _fnum(ticker, "last") or entry_price
+                    except Exception:
+                        pass  # keep fallback_exit = entry_price, pnl = 0
+                    fallback_pnl, fallback_pnl_pct = calc_pnl(
+                        entry_price, fallback_exit, amount,
+                        position_type, trade_lev,
+                        exchange_id, pair,
+                    )
                     await self.db.close_trade(
-                        order_id, current_price, pnl, pnl_pct,
+                        order_id, fallback_exit, fallback_pnl, fallback_pnl_pct,
                         reason="orphan_strategy_removed",
                         exit_reason="ORPHAN",
                     )
-
-                # Remove from risk manager — prevents ghost entries
-                self.risk_manager.record_close(pair, pnl)
-
-                # Send alert
-                await self.alerts.send_text(
-                    f"🧹 Closed orphaned {strategy_name} position\n"
-                    f"{pair} {position_type.upper()} @ ${entry_price:.2f}\n"
-                    f"Exit: ${current_price:.2f} | P&L: ${pnl:+.4f} ({pnl_pct:+.2f}%)\n"
-                    f"Reason: Strategy removed — freeing margin"
-                )
-
+                    logger.info(
+                        "Orphan fallback close %s: exit=$%.2f pnl=$%.4f (%.2f%%)",
+                        pair, fallback_exit, fallback_pnl, fallback_pnl_pct,
+                    )
+                # Remove from risk manager even in fallback path
+                self.risk_manager.record_close(pair, fallback_pnl)
             except Exception:
-                logger.exception("Failed to close orphaned position %s", pair)
-                # Try to at least mark it in DB — use current price if possible
-                try:
-                    if order_id:
-                        # Try to get current price for accurate P&L
-                        fallback_exit = entry_price
-                        try:
-                            exchange = self.delta if exchange_id == "delta" else self.binance
-                            if exchange:
-                                ticker = await exchange.fetch_ticker(pair)
-                                fallback_exit = float(ticker.get("last", 0) or 0) or entry_price
-                        except Exception:
-                            pass  # keep fallback_exit = entry_price, pnl = 0
-                        fallback_pnl, fallback_pnl_pct = calc_pnl(
-                            entry_price, fallback_exit, amount,
-                            position_type, trade_lev,
-                            exchange_id, pair,
-                        )
-                        await self.db.close_trade(
-                            order_id, fallback_exit, fallback_pnl, fallback_pnl_pct,
-                            reason="orphan_strategy_removed",
-                            exit_reason="ORPHAN",
-                        )
-                        logger.info(
-                            "Orphan fallback close %s: exit=$%.2f pnl=$%.4f (%.2f%%)",
-                            pair, fallback_exit, fallback_pnl, fallback_pnl_pct,
-                        )
-                    # Remove from risk manager even in fallback path
-                    self.risk_manager.record_close(pair, fallback_pnl)
-                except Exception:
-                    pass
+                pass
 
     # -- Exchange init ---------------------------------------------------------
 
+    @staticmethod
+    def _build_delta_client(
+        api_key: str, secret: str, default_type: str, session: aiohttp.ClientSession,
+    ) -> ccxt.delta:
+        """ccxt Delta client for one market type, pointed at the India endpoint."""
+        client = ccxt.delta({
+            "apiKey": api_key,
+            "secret": secret,
+            "enableRateLimit": True,
+            "options": {"defaultType": default_type},
+            "session": session,
+        })
+        # Override to India endpoint — urls['api'] must be a dict with public/private keys
+        client.urls["api"] = {
+            "public": config.delta.base_url,
+            "private": config.delta.base_url,
+        }
+        return client
+
     async def _init_exchanges(self) -> None:
         """Create ccxt exchange instances.
 
-        Uses the threaded DNS resolver to avoid aiodns failures on Windows.
+        All exchanges share one aiohttp session / connection pool, so TLS
+        connections and DNS lookups are reused across venues. Uses the
+        threaded DNS resolver on Windows to avoid aiodns failures there.
         """
-        # Force threaded resolver so aiohttp doesn't depend on aiodns/c-ares
-        resolver = aiohttp.resolver.ThreadedResolver()
-        connector = aiohttp.TCPConnector(resolver=resolver, ssl=True)
+        # Threaded resolver on Windows (aiodns/c-ares is unreliable there);
+        # elsewhere DefaultResolver uses aiodns when installed, threads otherwise
+        if sys.platform == "win32":
+            resolver = aiohttp.resolver.ThreadedResolver()
+        else:
+            resolver = aiohttp.resolver.DefaultResolver()
+        connector = aiohttp.TCPConnector(
+            resolver=resolver, ssl=True,
+            limit=100, limit_per_host=20,
+            ttl_dns_cache=300, keepalive_timeout=60,
+        )
         session = aiohttp.ClientSession(connector=connector)
+        self._http_session = session
 
         # Binance (required)
         self.binance = ccxt.binance({
@@ -4011,15 +4438,12 @@ class AlphaBot:
 
         # KuCoin (optional, for arbitrage)
         if config.kucoin.api_key:
-            kucoin_session = aiohttp.ClientSession(
-                connector=aiohttp.TCPConnector(resolver=aiohttp.resolver.ThreadedResolver(), ssl=True)
-            )
             self.kucoin = ccxt.kucoin({
                 "apiKey": config.kucoin.api_key,
                 "secret": config.kucoin.secret,
                 "password": config.kucoin.passphrase,
                 "enableRateLimit": True,
-                "session": kucoin_session,
+                "session": session,
             })
             logger.info("KuCoin exchange initialized (arbitrage enabled)")
         else:
@@ -4036,23 +4460,7 @@ class AlphaBot:
                 type(config.delta.api_key).__name__, type(config.delta.secret).__name__,
             )
 
-            delta_session = aiohttp.ClientSession(
-                connector=aiohttp.TCPConnector(
-                    resolver=aiohttp.resolver.ThreadedResolver(), ssl=True,
-                )
-            )
-            self.delta = ccxt.delta({
-                "apiKey": delta_key,
-                "secret": delta_secret,
-                "enableRateLimit": True,
-                "options": {"defaultType": "future"},
-                "session": delta_session,
-            })
-            # Override to India endpoint — urls['api'] must be a dict with public/private keys
-            self.delta.urls["api"] = {
-                "public": config.delta.base_url,
-                "private": config.delta.base_url,
-            }
+            self.delta = self._build_delta_client(delta_key, delta_secret, "future", session)
             # ── LEVERAGE SAFETY CHECK ─────────────────────────────────────
             if config.delta.leverage > 20:
                 logger.warning(
@@ -4067,22 +4475,7 @@ class AlphaBot:
 
             # Delta Options — separate ccxt instance for option markets
             if config.delta.options_enabled:
-                delta_options_session = aiohttp.ClientSession(
-                    connector=aiohttp.TCPConnector(
-                        resolver=aiohttp.resolver.ThreadedResolver(), ssl=True,
-                    )
-                )
-                self.delta_options = ccxt.delta({
-                    "apiKey": delta_key,
-                    "secret": delta_secret,
-                    "enableRateLimit": True,
-                    "options": {"defaultType": "option"},
-                    "session": delta_options_session,
-                })
-                self.delta_options.urls["api"] = {
-                    "public": config.delta.base_url,
-                    "private": config.delta.base_url,
-                }
+                self.delta_options = self._build_delta_client(delta_key, delta_secret, "option", session)
                 logger.info("Delta Exchange India options initialized (pairs: %s)",
                             ", ".join(config.delta.options_pairs))
             else:
@@ -4093,17 +4486,12 @@ class AlphaBot:
 
         # Bybit (primary futures exchange)
         if config.bybit.api_key:
-            bybit_session = aiohttp.ClientSession(
-                connector=aiohttp.TCPConnector(
-                    resolver=aiohttp.resolver.ThreadedResolver(), ssl=True,
-                )
-            )
             self.bybit = ccxt.bybit({
                 "apiKey": config.bybit.api_key,
                 "secret": config.bybit.secret,
                 "enableRateLimit": True,
                 "options": {"defaultType": "linear"},
-                "session": bybit_session,
+                "session": session,
             })
             if config.bybit.testnet:
                 self.bybit.set_sandbox_mode(True)
@@ -4123,17 +4511,12 @@ class AlphaBot:
 
         # Kraken Futures (alternative futures exchange)
         if config.kraken.api_key:
-            kraken_session = aiohttp.ClientSession(
-                connector=aiohttp.TCPConnector(
-                    resolver=aiohttp.resolver.ThreadedResolver(), ssl=True,
-                )
-            )
             self.kraken = ccxt.krakenfutures({
                 "apiKey": config.kraken.api_key,
                 "secret": config.kraken.secret,
                 "enableRateLimit": True,
                 "options": {"defaultType": "future"},
-                "session": kraken_session,
+                "session": session,
             })
             if config.kraken.testnet:
                 self.kraken.set_sandbox_mode(True)
@@ -4151,32 +4534,86 @@ class AlphaBot:
             self.kraken_pairs = []
             logger.info("Kraken credentials not set -- futures disabled")
 
+        self._delta_pair_set = frozenset(self.delta_pairs)
+        self._bybit_pair_set = frozenset(self.bybit_pairs)
+        self._kraken_pair_set = frozenset(self.kraken_pairs)
+        # Later venues win on overlap — same precedence as the old bybit/delta/kraken if-chain
+        self._pair_exchange = (
+            dict.fromkeys(self.kraken_pairs, "kraken")
+            | dict.fromkeys(self.delta_pairs, "delta")
+            | dict.fromkeys(self.bybit_pairs, "bybit")
+        )
+        self._all_pairs = None
+        self._all_pairs = self.all_pairs
+        self._exchanges = {
+            ex_id: ex for ex_id, ex in (
+                ("binance", self.binance), ("delta", self.delta),
+                ("bybit", self.bybit), ("kraken", self.kraken),
+            ) if ex is not None
+        }
+
+    async def _fetch_all_balances(
+        self,
+    ) -> tuple[float | None, float | None, float | None, float | None]:
+        """Portfolio USD value of (binance, delta, bybit, kraken), fetched concurrently."""
+        binance_bal, delta_bal, bybit_bal, kraken_bal = await asyncio.gather(
+            self._fetch_portfolio_usd(self.binance),
+            self._fetch_portfolio_usd(self.delta),
+            self._fetch_portfolio_usd(self.bybit),
+            self._fetch_portfolio_usd(self.kraken),
+        )
+        return binance_bal, delta_bal, bybit_bal, kraken_bal
+
     async def _fetch_portfolio_usd(
         self, exchange: ccxt.Exchange | None,
     ) -> float | None:
         """Fetch total portfolio value in USD including held assets.
 
-        For Binance: USDT free + value of held crypto assets.
-        For Delta: wallet balance + unrealized P&L from open positions.
+        Results are cached for PORTFOLIO_CACHE_TTL_S and concurrent callers for
+        the same exchange share one in-flight fetch. Any trade close invalidates.
         """
         if not exchange:
             return None
-        ex_id = getattr(exchange, "id", "?")
+        ex_id = exchange.id
+        cached = self._portfolio_cache.get(ex_id)
+        if cached and time.monotonic() - cached[0] < self.PORTFOLIO_CACHE_TTL_S:
+            return cached[1]
+        lock = self._portfolio_locks.get(ex_id)
+        if lock is None:
+            lock = self._portfolio_locks[ex_id] = asyncio.Lock()
+        async with lock:
+            # Another caller may have refreshed it while we waited
+            cached = self._portfolio_cache.get(ex_id)
+            if cached and time.monotonic() - cached[0] < self.PORTFOLIO_CACHE_TTL_S:
+                return cached[1]
+            value = await self._compute_portfolio_usd(exchange, ex_id)
+            if value is not None:
+                self._portfolio_cache[ex_id] = (time.monotonic(), value)
+            return value
+
+    async def _compute_portfolio_usd(self, exchange: ccxt.Exchange, ex_id: str) -> float | None:
+        """Uncached portfolio valuation behind _fetch_portfolio_usd.
+
+        For Binance: USDT free + value of held crypto assets.
+        For Delta: wallet balance + unrealized P&L from open positions.
+        """
         try:
-            balance = await exchange.fetch_balance()
+            balance = await self._cached_balance(exchange)
             total_map = balance.get("total", {})
             free_map = balance.get("free", {})
 
             # Log raw balance data for debugging
-            holdings = {k: float(v) for k, v in total_map.items()
-                        if v is not None and float(v) > 0}
-            free_holdings = {k: float(v) for k, v in free_map.items()
+            log_info = logger.isEnabledFor(logging.INFO)
+            if log_info:
+                holdings = {k: float(v) for k, v in total_map.items()
                             if v is not None and float(v) > 0}
-            logger.info("Holdings on %s: total=%s free=%s", ex_id, holdings, free_holdings)
+                free_holdings = {k: float(v) for k, v in free_map.items()
+                                 if v is not None and float(v) > 0}
+                logger.info("Holdings on %s: total=%s free=%s", ex_id, holdings, free_holdings)
 
             # Also log the info dict if available (contains exchange-specific fields)
             info = balance.get("info")
-            if info and isinstance(info, dict):
+            if log_info and info and isinstance(info, dict):
                 # Log key fields for Delta (wallet_balance, equity, margin_balance, etc.)
                 for key in ("wallet_balance", "equity", "available_balance",
                             "margin_balance", "unrealized_pnl", "balance", "result"):
@@ -4193,36 +4630,37 @@ class AlphaBot:
             # ── Stablecoins at face value ──────────────────────────────────
             stablecoin_total = 0.0
             for key in ("USDT", "USD", "USDC"):
-                val = total_map.get(key)
-                if val is not None and float(val) > 0:
-                    stablecoin_total += float(val)
+                val = _fnum(total_map, key)
+                if val > 0:
+                    stablecoin_total += val
 
             # ── Value held crypto assets using live ticker prices ──────────
             asset_total = 0.0
             asset_details: list[str] = []
-            tracked_bases = set()
-            for pair in (config.trading.pairs or []):
-                base = pair.split("/")[0] if "/" in pair else pair
-                tracked_bases.add(base)
+            # Filter to tracked, non-cash assets before converting anything —
+            # the balance map also lists every dust/delisted asset on the account
+            tracked_bases = self._tracked_bases
+            held_assets: dict[str, float] = {}
+            for asset in total_map:
+                if asset in tracked_bases and asset not in _NON_ASSET_CURRENCIES:
+                    qty = _fnum(total_map, asset)
+                    if qty > 0:
+                        held_assets[asset] = qty
+            # Price every held asset in one batch call, or one concurrent burst
+            tickers = await self._fetch_tickers(
+                exchange, [f"{asset}/USDT" for asset in held_assets],
+                ttl=self.VALUATION_TICKER_TTL_S,
+            )
 
-            for asset, qty in holdings.items():
-                if asset in ("USDT", "USD", "USDC", "INR"):
-                    continue
-                if asset not in tracked_bases:
-                    continue
-                qty_f = float(qty)
-                if qty_f <= 0:
-                    continue
-                try:
-                    ticker = await exchange.fetch_ticker(f"{asset}/USDT")
-                    price = ticker.get("last", 0) or 0
-                    if price and price > 0:
-                        value = qty_f * price
-                        if value > 0.50:
-                            asset_total += value
+            for asset, qty_f in held_assets.items():
+                ticker = tickers.get(f"{asset}/USDT")
+                price = (ticker.get("last", 0) or 0) if ticker else 0
+                if price and price > 0:
+                    value = qty_f * price
+                    if value > 0.50:
+                        asset_total += value
+                        if log_info:
                             asset_details.append(f"{asset}={qty_f:.6f}@${price:.2f}=${value:.2f}")
-                except Exception:
-                    pass
 
             # ── Delta Exchange India: INR → USD conversion ─────────────────
             inr_total = 0.0
@@ -4230,9 +4668,7 @@ class AlphaBot:
             inr_val = total_map.get("INR") or free_map.get("INR")
             if inr_val is not None and float(inr_val) > 0:
                 inr_raw = float(inr_val)
-                # Try to get live INR/USD rate from Binance
-                inr_rate = await self._get_inr_usd_rate()
-                inr_total = inr_raw / inr_rate
+                inr_total = inr_raw / self._inr_usd_rate
 
             # ── Delta: add unrealized P&L from open futures positions ──────
             unrealized_pnl_usd = 0.0
@@ -4240,11 +4676,11 @@ class AlphaBot:
                 try:
                     positions = await exchange.fetch_positions()
                     for pos in positions:
-                        contracts = float(pos.get("contracts", 0) or 0)
+                        contracts = _fnum(pos, "contracts")
                         if contracts == 0:
                             continue
                         # ccxt normalizes unrealizedPnl
-                        upnl = float(pos.get("unrealizedPnl", 0) or 0)
+                        upnl = _fnum(pos, "unrealizedPnl")
                         if upnl != 0:
                             unrealized_pnl_usd += upnl
                     if unrealized_pnl_usd != 0:
@@ -4254,20 +4690,20 @@ class AlphaBot:
 
             portfolio_total = stablecoin_total + asset_total + inr_total + unrealized_pnl_usd
 
-            if inr_raw > 0:
-                logger.info(
-                    "Portfolio %s: USDT=$%.2f + assets=$%.2f%s + INR=₹%.2f ($%.2f) + uPnL=$%.4f = $%.2f",
-                    ex_id, stablecoin_total, asset_total,
-                    f" ({', '.join(asset_details)})" if asset_details else "",
-                    inr_raw, inr_total, unrealized_pnl_usd, portfolio_total,
-                )
-            else:
-                logger.info(
-                    "Portfolio %s: USDT=$%.2f + assets=$%.2f%s + uPnL=$%.4f = $%.2f",
-                    ex_id, stablecoin_total, asset_total,
-                    f" ({', '.join(asset_details)})" if asset_details else "",
-                    unrealized_pnl_usd, portfolio_total,
-                )
+            if log_info:
+                details = f" ({', '.join(asset_details)})" if asset_details else ""
+                if inr_raw > 0:
+                    logger.info(
+                        "Portfolio %s: USDT=$%.2f + assets=$%.2f%s + INR=₹%.2f ($%.2f) + uPnL=$%.4f = $%.2f",
+                        ex_id, stablecoin_total, asset_total, details,
+                        inr_raw, inr_total, unrealized_pnl_usd, portfolio_total,
+                    )
+                else:
+                    logger.info(
+                        "Portfolio %s: USDT=$%.2f + assets=$%.2f%s + uPnL=$%.4f = $%.2f",
+                        ex_id, stablecoin_total, asset_total, details,
+                        unrealized_pnl_usd, portfolio_total,
+                    )
 
             return portfolio_total if portfolio_total > 0 else 0.0
 
@@ -4275,33 +4711,6 @@ class AlphaBot:
             logger.warning("Could not fetch balance from %s: %s (type: %s)", ex_id, e, type(e).__name__)
             return None
 
-    async def _get_inr_usd_rate(self) -> float:
-        """Get current INR/USD exchange rate. Uses cached value, refreshed every hour."""
-        now = time.monotonic()
-        if hasattr(self, "_inr_rate") and hasattr(self, "_inr_rate_time"):
-            if now - self._inr_rate_time < 3600:  # cache for 1 hour
-                return self._inr_rate
-
-        # Try fetching from Binance (USDT/INR pair if available)
-        rate = 86.5  # fallback default
-        try:
-            if self.binance:
-                # Binance doesn't have USDT/INR directly.
-                # Use a well-known approximate rate; update periodically.
-                # The user can set DELTA_INR_USD_RATE in env for precision.
-                env_rate = config.delta.__dict__.get("inr_usd_rate")
-                if env_rate and float(env_rate) > 0:
-                    rate = float(env_rate)
-                else:
-                    rate = 86.5  # current approximate rate as of Feb 2026
-        except Exception:
-            pass
-
-        self._inr_rate = rate
-        self._inr_rate_time = now
-        logger.debug("INR/USD rate: %.2f", rate)
-        return rate
-
 
 def _acquire_lockfile() -> Any:
     """Prevent duplicate bot processes via PID lockfile (Linux/macOS only)."""
@@ -4326,6 +4735,9 @@ def main() -> None:
     bot = AlphaBot()
     if sys.platform == "win32":
         asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    elif uvloop is not None:
+        # libuv loop: cheaper callback dispatch for the gather-heavy cycle/reconcile paths
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     try:
         asyncio.run(bot.start())
     except KeyboardInterrupt:
@@ -17,7 +17,8 @@ import asyncio
 import json
 import time
 from collections import deque
-from typing import TYPE_CHECKING, Any, Callable
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable
 
 import aiohttp
 
@@ -152,8 +153,12 @@ class PriceFeed:
         delta_testnet: bool = False,
         bybit_testnet: bool = False,
         kraken_testnet: bool = False,
+        session: aiohttp.ClientSession | None = None,
     ) -> None:
         self._strategies = strategies
+        # Shared HTTP session (the engine's ccxt pool) — reconnects reuse its
+        # DNS cache instead of standing up a fresh connector every time
+        self._session = session
         self._binance_exchange = binance_exchange
         self._delta_pairs = delta_pairs or []
         self._bybit_pairs = bybit_pairs or []
@@ -166,6 +171,10 @@ class PriceFeed:
         # Price cache
         self.price_cache: dict[str, float] = {}
         self._last_update: dict[str, float] = {}  # pair → monotonic time
+        # Per-venue last tick: "source:pair" → (price, monotonic time).
+        # price_cache is keyed by bare pair, so Delta and Kraken (both
+        # BTC/USD:USD) would overwrite each other there.
+        self._source_prices: dict[str, tuple[float, float]] = {}
 
         # Tasks
         self._tasks: list[asyncio.Task[None]] = []
@@ -191,6 +200,15 @@ class PriceFeed:
         self._kraken_messages_parsed = 0
         self._last_stats_log = 0.0
 
+    @asynccontextmanager
+    async def _ws_session(self) -> AsyncIterator[aiohttp.ClientSession]:
+        """The shared session if we were given one (caller owns it), else a throwaway."""
+        if self._session is not None and not self._session.closed:
+            yield self._session
+            return
+        async with aiohttp.ClientSession() as session:
+            yield session
+
     async def start(self) -> None:
         """Start WS feeds as background tasks."""
         self._running = True
@@ -237,6 +255,16 @@ class PriceFeed:
         """Get cached price for a pair."""
         return self.price_cache.get(pair)
 
+    def get_fresh_price(self, pair: str, source: str, max_age: float = 3.0) -> float | None:
+        """Get the last WS tick for pair on a specific exchange, or None if older than max_age seconds."""
+        entry = self._source_prices.get(f"{source}:{pair}")
+        if entry is None:
+            return None
+        price, ts = entry
+        if time.monotonic() - ts > max_age:
+            return None
+        return price
+
     def register_wake_callback(self, pair: str, callback: Callable[[], None]) -> None:
         """Register a callback to wake a strategy when momentum spikes on this pair."""
         self._wake_callbacks[pair] = callback
@@ -252,6 +280,7 @@ class PriceFeed:
         now = time.monotonic()
         self.price_cache[pair] = price
         self._last_update[pair] = now
+        self._source_prices[f"{source}:{pair}"] = (price, now)
 
         if source == "delta":
             self._delta_updates += 1
@@ -347,7 +376,7 @@ class PriceFeed:
         while self._running:
             try:
                 logger.info("Delta WS connecting to %s — symbols: %s", ws_url, symbols)
-                async with aiohttp.ClientSession() as session:
+                async with self._ws_session() as session:
                     async with session.ws_connect(ws_url, heartbeat=30) as ws:
                         logger.info("Delta WS connected")
                         backoff = RECONNECT_MIN_SEC  # reset on successful connect
@@ -452,7 +481,7 @@ class PriceFeed:
             if self._delta_messages_total <= 5:
                 logger.info(
                     "Delta WS unknown msg type=%s keys=%s",
-                    msg_type, list(data.keys())[:10],
+                    msg_type, list(data)[:10],
                 )
 
         except (json.JSONDecodeError, ValueError, KeyError) as e:
@@ -472,7 +501,7 @@ class PriceFeed:
         while self._running:
             try:
                 logger.info("Bybit WS connecting to %s — symbols: %s", ws_url, symbols)
-                async with aiohttp.ClientSession() as session:
+                async with self._ws_session() as session:
                     async with session.ws_connect(ws_url, heartbeat=20) as ws:
                         logger.info("Bybit WS connected")
                         backoff = RECONNECT_MIN_SEC
@@ -560,7 +589,7 @@ class PriceFeed:
         while self._running:
             try:
                 logger.info("Kraken WS connecting to %s — symbols: %s", ws_url, symbols)
-                async with aiohttp.ClientSession() as session:
+                async with self._ws_session() as session:
                     async with session.ws_connect(ws_url, heartbeat=30) as ws:
                         logger.info("Kraken WS connected")
                         backoff = RECONNECT_MIN_SEC
@@ -633,7 +662,7 @@ class PriceFeed:
             if self._kraken_messages_total <= 5:
                 logger.info(
                     "Kraken WS unknown feed=%s keys=%s",
-                    feed, list(data.keys())[:10],
+                    feed, list(data)[:10],
                 )
 
         except (json.JSONDecodeError, ValueError, KeyError) as e:
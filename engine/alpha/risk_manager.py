@@ -10,6 +10,7 @@ from __future__ import annotations
 import re
 import time
 from dataclasses import dataclass, field
+from typing import Callable
 
 from alpha.config import config
 from alpha.strategies.base import Signal
@@ -31,6 +32,15 @@ class Position:
     exchange: str = "binance"
     leverage: int = 1
     position_type: str = "spot"  # "spot", "long", or "short"
+    # Fixed by entry + leverage, so computed once here (0.0 for spot / 1x)
+    liquidation_price: float = field(init=False, default=0.0)
+
+    def __post_init__(self) -> None:
+        if self.leverage > 1:
+            if self.position_type == "long":
+                self.liquidation_price = self.entry_price * (1 - 1 / self.leverage)
+            elif self.position_type == "short":
+                self.liquidation_price = self.entry_price * (1 + 1 / self.leverage)
 
 
 class RiskManager:
@@ -60,6 +70,8 @@ class RiskManager:
         self.kraken_capital: float = 0.0
 
         self.open_positions: list[Position] = []
+        # Same positions indexed by pair (kept in step by record_open/record_close)
+        self.open_positions_by_pair: dict[str, list[Position]] = {}
         self._pair_entry_ts: dict[str, float] = {}  # pair -> last entry approval time
         self.daily_pnl: float = 0.0
         self.daily_pnl_scalp: float = 0.0
@@ -69,6 +81,8 @@ class RiskManager:
         self.is_paused = False
         self._pause_reason: str = ""
         self._force_resumed = False  # bypass win-rate breaker until next win
+        # Called as listener(pair, pnl) after every record_close
+        self.on_close_listeners: list[Callable[[str, float], None]] = []
 
     def update_exchange_balances(
         self, binance: float | None, delta: float | None,
@@ -345,7 +359,7 @@ class RiskManager:
 
     def record_open(self, signal: Signal) -> None:
         """Track a newly opened position."""
-        self.open_positions.append(Position(
+        pos = Position(
             pair=signal.pair,
             side=signal.side,
             entry_price=signal.price,
@@ -355,7 +369,9 @@ class RiskManager:
             exchange=signal.exchange_id,
             leverage=signal.leverage,
             position_type=signal.position_type,
-        ))
+        )
+        self.open_positions.append(pos)
+        self.open_positions_by_pair.setdefault(pos.pair, []).append(pos)
 
     def record_close(self, pair: str, pnl: float) -> None:
         """Record a closed trade's P&L."""
@@ -380,11 +396,22 @@ class RiskManager:
                 continue
             new_positions.append(p)
         self.open_positions = new_positions
+        if removed:
+            same_pair = self.open_positions_by_pair[pair]
+            del same_pair[0]
+            if not same_pair:
+                del self.open_positions_by_pair[pair]
         self.capital += pnl
         logger.info(
             "Trade closed [%s]: PnL=$%.4f | daily=$%.4f | capital=$%.2f | win_rate=%.1f%%",
             pair, pnl, self.daily_pnl, self.capital, self.win_rate,
         )
+        for listener in self.on_close_listeners:
+            try:
+                listener(pair, pnl)
+            except Exception:
+                # A broken subscriber must not fail the close it is observing
+                logger.exception("Close listener %r failed for %s", listener, pair)
 
     # -- Liquidation monitoring ------------------------------------------------
 
@@ -394,15 +421,13 @@ class RiskManager:
         For long:  liq_price = entry * (1 - 1/leverage)
         For short: liq_price = entry * (1 + 1/leverage)
         """
-        for pos in self.open_positions:
-            if pos.pair != pair or pos.leverage <= 1:
+        for pos in self.open_positions_by_pair.get(pair, ()):
+            if pos.leverage <= 1:
                 continue
             if pos.position_type == "long":
-                liq_price = pos.entry_price * (1 - 1 / pos.leverage)
-                distance_pct = ((current_price - liq_price) / current_price) * 100
+                distance_pct = ((current_price - pos.liquidation_price) / current_price) * 100
             elif pos.position_type == "short":
-                liq_price = pos.entry_price * (1 + 1 / pos.leverage)
-                distance_pct = ((liq_price - current_price) / current_price) * 100
+                distance_pct = ((pos.liquidation_price - current_price) / current_price) * 100
             else:
                 continue
             return distance_pct
@@ -108,8 +108,7 @@ def calc_pnl(
     # Convert contracts to coins for Delta futures (not options)
     coin_amount = float(amount)
     if exchange_id == "delta" and not is_option:
-        contract_size = DELTA_CONTRACT_SIZE.get(pair, 0.01)
-        coin_amount = float(amount) * contract_size
+        coin_amount *= DELTA_CONTRACT_SIZE.get(pair, 0.01)
 
     # Gross P&L (notional)
     if position_type in ("long", "spot"):
@@ -280,7 +279,7 @@ class TradeExecutor:
             exchange = self._get_exchange(signal)
             balance = await exchange.fetch_balance()
             # Base asset: e.g. "ETH" from "ETH/USDT"
-            base = signal.pair.split("/")[0] if "/" in signal.pair else signal.pair
+            base = signal.pair.partition("/")[0]
             free = float(balance.get("free", {}).get(base, 0) or 0)
             total = float(balance.get("total", {}).get(base, 0) or 0)
             raw = free if free > 0 else total
@@ -447,7 +446,7 @@ class TradeExecutor:
         # Send clean info alert ONLY when we actually closed something (avoid spam)
         if actually_closed and self.alerts is not None:
             try:
-                pair_short = signal.pair.split("/")[0] if "/" in signal.pair else signal.pair
+                pair_short = signal.pair.partition("/")[0]
                 await self.alerts.send_text(
                     f"\u2139\ufe0f {pair_short} — Position not found on exchange\n"
                     f"Marked closed in DB. No action needed."
@@ -516,6 +515,18 @@ class TradeExecutor:
         bybit_pairs: list[str] | None = None, kraken_pairs: list[str] | None = None,
     ) -> None:
         """Pre-load minimum order sizes for all tracked pairs on each exchange."""
+        # Fetch every venue's market catalogue concurrently up front — the
+        # per-venue blocks below then read ccxt's cached copy. Failures are
+        # left to those blocks, whose own load_markets() retries and logs.
+        venues = [self.exchange]
+        if self.delta_exchange and delta_pairs:
+            venues.append(self.delta_exchange)
+        if self.bybit_exchange and bybit_pairs:
+            venues.append(self.bybit_exchange)
+        if self.kraken_exchange and kraken_pairs:
+            venues.append(self.kraken_exchange)
+        await asyncio.gather(*(ex.load_markets() for ex in venues), return_exceptions=True)
+
         # Binance spot
         try:
             await self.exchange.load_markets()
@@ -1663,7 +1674,7 @@ class TradeExecutor:
             return
         self._last_error_alert[signal.pair] = (error_key, now)
         try:
-            pair_short = signal.pair.split("/")[0] if "/" in signal.pair else signal.pair
+            pair_short = signal.pair.partition("/")[0]
             human_error = self._humanize_error(error)
             msg = (
                 f"\u26a0\ufe0f {signal.side.upper()} {pair_short} failed\n"
@@ -1694,7 +1705,7 @@ class TradeExecutor:
         try:
             # Parse error into human-readable message
             error_msg = self._humanize_error(error)
-            pair_short = signal.pair.split("/")[0] if "/" in signal.pair else signal.pair
+            pair_short = signal.pair.partition("/")[0]
             msg = (
                 f"\u26a0\ufe0f Exit failed: {pair_short}\n"
                 f"{error_msg}\n"
@@ -45,6 +45,15 @@ def iso_now() -> str:
     return utcnow().isoformat()
 
 
+def parse_iso(value: str | datetime) -> datetime:
+    """Parse an ISO-8601 timestamp as stored by Supabase ("...Z" or "+00:00")."""
+    if isinstance(value, datetime):
+        return value
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
+
+
 def round_price(price: float, precision: int = 2) -> float:
     """Round a price to given decimal places."""
     return round(price, precision)